@@ -57,6 +57,7 @@ celery_app.conf.update(
     task_routes={
         "tasks.execute_engineering_workflow": {"queue": "engineering"},
         "tasks.execute_skill": {"queue": "skills"},
+        "tasks.execute_skill_batch": {"queue": "skills"},
         "tasks.*": {"queue": "default"},
     },
 
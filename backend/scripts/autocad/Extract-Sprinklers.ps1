@@ -201,11 +201,12 @@ try {
         }
     }
 
-    # Check for output in DWG directory (LISP writes there)
+    # The LISP writes to *OUTPUT-FILE*; older extractors ignore it and
+    # write sprinkler_data.json in the DWG directory instead
     $dwgDir = Split-Path $DwgPath -Parent
     $defaultOutput = Join-Path $dwgDir "sprinkler_data.json"
 
-    if (Test-Path $defaultOutput) {
+    if ((Test-Path $defaultOutput) -and -not (Test-Path $outputJsonPath)) {
         # Move to expected location if different
         if ($defaultOutput -ne $outputJsonPath) {
             Move-Item -Path $defaultOutput -Destination $outputJsonPath -Force
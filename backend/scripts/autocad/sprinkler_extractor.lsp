@@ -20,8 +20,9 @@
 ;; XDATA application names to search
 (setq *XDATA-APPS* '("AQUABRAIN" "SPRINKLER" "HYDRO" "FIRE" "MEP"))
 
-;; Output file path (will be set dynamically)
-(setq *OUTPUT-FILE* nil)
+;; Output file path - callers may set *OUTPUT-FILE* before loading this file;
+;; otherwise EXTRACTSPRINKLERS writes <DWGPREFIX>sprinkler_data.json.
+;; (Not reset here: the bridge scripts set it first, then load.)
 
 ;;; -----------------------------------------------------------------------------
 ;;; UTILITY FUNCTIONS - פונקציות עזר
@@ -348,8 +349,10 @@
 
   (setq json-output (strcat json-output "]"))
 
-  ;; Write to file
-  (setq *OUTPUT-FILE* (strcat (getvar "DWGPREFIX") "sprinkler_data.json"))
+  ;; Write to file (preset *OUTPUT-FILE* wins over the default)
+  (if (not *OUTPUT-FILE*)
+    (setq *OUTPUT-FILE* (strcat (getvar "DWGPREFIX") "sprinkler_data.json"))
+  )
   (setq file (open *OUTPUT-FILE* "w"))
   (write-line json-output file)
   (close file)
@@ -357,6 +360,9 @@
   (princ (strcat "\n\n✓ JSON written to: " *OUTPUT-FILE*))
   (princ "\n")
 
+  ;; One-shot - the next drawing sets its own path or gets the default
+  (setq *OUTPUT-FILE* nil)
+
   ;; Return the JSON for immediate use
   json-output
 )
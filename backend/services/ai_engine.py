@@ -28,8 +28,9 @@ Usage:
 
 import os
 import re
+import json
 import requests
-from typing import List, Dict, Optional, Literal
+from typing import List, Dict, Optional, Literal, Iterator
 from dotenv import load_dotenv
 from enum import Enum
 
@@ -133,7 +134,24 @@ class OllamaClient:
         """Generate response using local LLM."""
 
         url = f"{self.base_url}/api/generate"
+        payload = self.generate_payload(prompt, model, system_prompt, temperature, max_tokens, num_ctx)
 
+        response = requests.post(url, json=payload, timeout=120)
+        response.raise_for_status()
+
+        data = response.json()
+        return data.get("response", "")
+
+    @staticmethod
+    def generate_payload(
+        prompt: str,
+        model: str = LOCAL_MODEL,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        num_ctx: int = 4096
+    ) -> Dict:
+        """Request body for /api/generate (shared with the concurrent batcher)."""
         payload = {
             "model": model,
             "prompt": prompt,
@@ -148,11 +166,7 @@ class OllamaClient:
         if system_prompt:
             payload["system"] = system_prompt
 
-        response = requests.post(url, json=payload, timeout=120)
-        response.raise_for_status()
-
-        data = response.json()
-        return data.get("response", "")
+        return payload
 
     def chat(
         self,
@@ -236,6 +250,42 @@ class GeminiClient:
         data = response.json()
         return data["candidates"][0]["content"]["parts"][0]["text"]
 
+    def generate_stream(
+        self,
+        prompt: str,
+        model: str = DEFAULT_GEMINI_MODEL,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096
+    ) -> Iterator[str]:
+        """Stream content with Gemini, yielding text chunks as they arrive."""
+
+        url = f"{self.base_url}/models/{model}:streamGenerateContent?alt=sse&key={self.api_key}"
+
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"[System Instructions]\n{system_prompt}\n\n[User Query]\n{prompt}"
+
+        payload = {
+            "contents": [{"parts": [{"text": full_prompt}]}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens,
+            }
+        }
+
+        with requests.post(url, json=payload, timeout=120, stream=True) as response:
+            response.raise_for_status()
+
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = json.loads(line[5:])
+                for candidate in data.get("candidates", []):
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -521,6 +571,27 @@ def ask_ai(
         raise ValueError(f"Unknown provider: {provider}")
 
 
+def ask_ai_stream(
+    prompt: str,
+    provider: Literal["ollama", "gemini", "claude"] = DEFAULT_PROVIDER,
+    model: Optional[str] = None,
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7
+) -> Iterator[str]:
+    """
+    Streaming variant of ask_ai - yields text chunks as they arrive.
+
+    Gemini streams natively; other providers yield the full response
+    as a single chunk.
+    """
+
+    if provider == "gemini":
+        client = get_gemini_client()
+        yield from client.generate_stream(prompt, model or DEFAULT_GEMINI_MODEL, system_prompt, temperature)
+    else:
+        yield ask_ai(prompt, provider, model, system_prompt, temperature)
+
+
 def chat_ai(
     messages: List[Dict[str, str]],
     provider: Literal["ollama", "gemini", "claude"] = DEFAULT_PROVIDER,
@@ -663,6 +734,7 @@ __all__ = [
     'should_use_local',
     # Unified Interface
     'ask_ai',
+    'ask_ai_stream',
     'chat_ai',
     # AquaBrain
     'ask_aquabrain',
@@ -0,0 +1,83 @@
+"""
+AquaBrain Ollama Batcher
+========================
+Concurrent local generation for multi-query workloads.
+
+Ollama batches whatever is in flight at the same time (up to
+OLLAMA_NUM_PARALLEL decode slots per loaded model), so N queries sent one
+after another pay N full roundtrips while N queries sent together share
+the GPU. This module keeps up to OLLAMA_NUM_PARALLEL requests open.
+
+Ollama server settings (set on the Ollama service, not the backend):
+    OLLAMA_NUM_PARALLEL=8       # Concurrent decodes per model
+    OLLAMA_MAX_LOADED_MODELS=1  # Keep VRAM for one model's KV caches
+
+Usage:
+    from services.ollama_batcher import generate_many
+
+    responses = generate_many([
+        {"prompt": "Summarize NFPA 13 spacing", "temperature": 0.2},
+        {"prompt": "Explain K-factor", "temperature": 0.2},
+    ])
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+
+from services.ai_engine import get_ollama_client
+
+
+# Requests kept in flight - match the server's OLLAMA_NUM_PARALLEL
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+GENERATE_TIMEOUT_SEC = 120
+
+
+async def generate_many_async(
+    batch: List[Dict[str, Any]],
+    max_parallel: Optional[int] = None
+) -> List[Union[str, Exception]]:
+    """
+    Run several OllamaClient.generate() requests concurrently.
+
+    Args:
+        batch: Keyword arguments for OllamaClient.generate(), one dict per request
+        max_parallel: Requests in flight (default: OLLAMA_NUM_PARALLEL)
+
+    Returns:
+        One response per request, in order. A failed request yields its
+        exception instead of cancelling the others.
+    """
+    client = get_ollama_client()
+    slots = asyncio.Semaphore(max_parallel or OLLAMA_NUM_PARALLEL)
+
+    async with httpx.AsyncClient(base_url=client.base_url, timeout=GENERATE_TIMEOUT_SEC) as http:
+
+        async def generate(request: Dict[str, Any]) -> str:
+            async with slots:
+                response = await http.post("/api/generate", json=client.generate_payload(**request))
+                response.raise_for_status()
+                return response.json().get("response", "")
+
+        return await asyncio.gather(*(generate(request) for request in batch), return_exceptions=True)
+
+
+def generate_many(
+    batch: List[Dict[str, Any]],
+    max_parallel: Optional[int] = None
+) -> List[Union[str, Exception]]:
+    """
+    Sync entry point for generate_many_async (skills, Celery tasks).
+
+    Runs on a helper thread when the caller is already inside an event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(generate_many_async(batch, max_parallel))
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, generate_many_async(batch, max_parallel)).result()
@@ -294,6 +294,7 @@ class EngineeringOrchestrator:
         hazard_class: str = "ordinary_1",
         instructions: str = "",
         progress_callback: Optional[Callable[[PipelineProgress], None]] = None,
+        simulation_mode: Optional[bool] = None,
     ) -> PipelineResult:
         """
         Execute the full engineering pipeline.
@@ -303,6 +304,8 @@ class EngineeringOrchestrator:
             hazard_class: NFPA 13 hazard classification
             instructions: Special instructions from engineer
             progress_callback: Optional callback for progress updates
+            simulation_mode: Simulate the bridges for this run only
+                (default: SIMULATION_MODE)
 
         Returns:
             PipelineResult with traffic light status and summaries
@@ -310,10 +313,14 @@ class EngineeringOrchestrator:
         start_time = asyncio.get_event_loop().time()
         stages_completed = []
 
+        # Resolved once - concurrent runs may use different modes
+        if simulation_mode is None:
+            simulation_mode = self.SIMULATION_MODE
+
         try:
             # === STAGE 1: EXTRACT GEOMETRY ===
             self._update_stage(PipelineStage.EXTRACTING, 10, "שואב תוכניות מ-Revit...")
-            geometry = await self._extract_geometry(project_id)
+            geometry = await self._extract_geometry(project_id, simulation_mode=simulation_mode)
             stages_completed.append("extract")
 
             # === STAGE 2: VOXELIZE ===
@@ -338,7 +345,7 @@ class EngineeringOrchestrator:
 
             # === STAGE 6: GENERATE LOD 500 ===
             self._update_stage(PipelineStage.GENERATING, 85, "מייצר מודל LOD 500 ב-Revit...")
-            await self._generate_lod500(project_id, routes)
+            await self._generate_lod500(project_id, routes, simulation_mode=simulation_mode)
             stages_completed.append("generate")
 
             # === STAGE 7: TRAFFIC LIGHT ===
@@ -398,7 +405,12 @@ class EngineeringOrchestrator:
             except Exception:
                 pass
 
-    async def _extract_geometry(self, project_id: str, file_path: str = None) -> Dict[str, Any]:
+    async def _extract_geometry(
+        self,
+        project_id: str,
+        file_path: str = None,
+        simulation_mode: Optional[bool] = None,
+    ) -> Dict[str, Any]:
         """
         Extract geometry from Revit or AutoCAD via Bridge with validation.
 
@@ -420,8 +432,11 @@ class EngineeringOrchestrator:
             elif ext == ".rvt":
                 source_type = "revit"
 
+        if simulation_mode is None:
+            simulation_mode = self.SIMULATION_MODE
+
         # Get raw data from appropriate bridge
-        if self.SIMULATION_MODE:
+        if simulation_mode:
             raw_data = self._simulate_geometry(project_id)
         elif source_type == "autocad":
             # === AutoCAD Extraction Path ===
@@ -624,11 +639,19 @@ class EngineeringOrchestrator:
             "max_velocity_fps": max_velocity,
         }
 
-    async def _generate_lod500(self, project_id: str, routes: Dict) -> None:
+    async def _generate_lod500(
+        self,
+        project_id: str,
+        routes: Dict,
+        simulation_mode: Optional[bool] = None,
+    ) -> None:
         """Generate LOD 500 model in Revit."""
         await asyncio.sleep(0.5)
 
-        if self.SIMULATION_MODE:
+        if simulation_mode is None:
+            simulation_mode = self.SIMULATION_MODE
+
+        if simulation_mode:
             print(f"📐 [SIMULATION] Generated LOD 500 for {project_id}")
             print(f"    - Main route: {routes.get('main_route', {}).get('total_length_m', 0):.1f}m")
             print(f"    - Branches: {len(routes.get('branches', []))}")
@@ -1263,16 +1286,19 @@ async def run_engineering_process(
     hazard_class: str = "ordinary_1",
     notes: str = "",
     revit_version: str = "auto",
+    mock_mode: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """
     Entry point for the engineering pipeline (async).
 
-    Called by the FastAPI endpoint.
+    Called by the FastAPI endpoint. mock_mode applies to this run only
+    (default: orchestrator.SIMULATION_MODE).
     """
     result = await orchestrator.run_pipeline(
         project_id=project_id,
         hazard_class=hazard_class,
         instructions=notes,
+        simulation_mode=mock_mode,
     )
     return result.to_dict()
 
@@ -1301,9 +1327,6 @@ def run_engineering_process_sync(
     """
     import asyncio
 
-    # Update orchestrator mode
-    orchestrator.SIMULATION_MODE = mock_mode
-
     # Run async in new event loop
     try:
         loop = asyncio.get_event_loop()
@@ -1317,6 +1340,7 @@ def run_engineering_process_sync(
                         project_id=project_id,
                         hazard_class=hazard_class,
                         instructions=notes,
+                        simulation_mode=mock_mode,
                     )
                 )
                 result = future.result()
@@ -1326,6 +1350,7 @@ def run_engineering_process_sync(
                     project_id=project_id,
                     hazard_class=hazard_class,
                     instructions=notes,
+                    simulation_mode=mock_mode,
                 )
             )
     except RuntimeError:
@@ -1335,6 +1360,7 @@ def run_engineering_process_sync(
                 project_id=project_id,
                 hazard_class=hazard_class,
                 instructions=notes,
+                simulation_mode=mock_mode,
             )
         )
 
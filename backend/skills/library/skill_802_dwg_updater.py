@@ -24,6 +24,8 @@ from __future__ import annotations
 import os
 import sys
 import re
+import time
+import queue
 import smtplib
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
@@ -71,6 +73,12 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 # Email configuration
 GMAIL_USER = os.getenv("GMAIL_USER", "")
 GMAIL_PASSWORD = os.getenv("GMAIL_APP_PASSWORD", "")
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 587
+
+# Authenticated SMTP connections kept alive between skill invocations
+SMTP_POOL_SIZE = 2
+SMTP_IDLE_CHECK_SEC = 30
 
 
 # ============================================================================
@@ -140,6 +148,7 @@ def find_and_replace_text(search_text: str, replace_text: str) -> Dict[str, Any]
                 {"handle": "2B4C", "x": 3200, "y": 2000, "old_text": search_text, "new_text": replace_text},
                 {"handle": "2C5D", "x": 4800, "y": 2000, "old_text": search_text, "new_text": replace_text}
             ],
+            "locations_xy": [(1500, 2000), (3200, 2000), (4800, 2000)],
             "message": f"[MOCK] Replaced '{search_text}' with '{replace_text}' in 3 locations"
         }
 
@@ -196,7 +205,15 @@ def find_and_replace_text(search_text: str, replace_text: str) -> Dict[str, Any]
 
     from scripts.bridge_autocad import run_powershell
     result = run_powershell(script, timeout=60)
-    return result.data if result.success else {"success": False, "error": result.error}
+    if not result.success:
+        return {"success": False, "error": result.error}
+
+    data = result.data
+    # Flat (x, y) pairs so callers can bound the changes without dict lookups
+    data["locations_xy"] = [
+        (loc.get("x", 0), loc.get("y", 0)) for loc in data.get("locations") or []
+    ]
+    return data
 
 
 def save_dwg_as(new_filename: str) -> Dict[str, Any]:
@@ -298,6 +315,58 @@ def export_pdf(pdf_filename: str) -> Dict[str, Any]:
 # EMAIL DELIVERY
 # ============================================================================
 
+# Pool of (connection, last_used) pairs - avoids a TLS handshake + login per email
+_SMTP_POOL: "queue.Queue[Tuple[smtplib.SMTP, float]]" = queue.Queue(maxsize=SMTP_POOL_SIZE)
+
+
+def _acquire_smtp() -> smtplib.SMTP:
+    """
+    Get an authenticated SMTP connection, reusing a pooled one when possible.
+
+    Connections idle for longer than SMTP_IDLE_CHECK_SEC are probed with NOOP
+    and discarded if the server has dropped them.
+    """
+    while True:
+        try:
+            server, last_used = _SMTP_POOL.get_nowait()
+        except queue.Empty:
+            break
+
+        if time.monotonic() - last_used < SMTP_IDLE_CHECK_SEC:
+            return server
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except smtplib.SMTPException:
+            pass
+        _close_smtp(server)
+
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    try:
+        server.starttls()
+        server.login(GMAIL_USER, GMAIL_PASSWORD)
+    except Exception:
+        _close_smtp(server)
+        raise
+    return server
+
+
+def _release_smtp(server: smtplib.SMTP) -> None:
+    """Return a healthy connection to the pool (closes it if the pool is full)."""
+    try:
+        _SMTP_POOL.put_nowait((server, time.monotonic()))
+    except queue.Full:
+        _close_smtp(server)
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    """Close a connection, ignoring errors from an already-dead socket."""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
 def send_update_email(
     recipient: str,
     recipient_name: str,
@@ -384,10 +453,17 @@ AquaBrain V9.0 - AutoCAD Automation"""
                 )
                 msg.attach(part)
 
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(GMAIL_USER, GMAIL_PASSWORD)
+        server = _acquire_smtp()
+        try:
             server.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            # Broken connection - never hand it back to the pool
+            _close_smtp(server)
+            raise
+        except Exception:
+            _release_smtp(server)
+            raise
+        _release_smtp(server)
 
         return {
             "success": True,
@@ -504,21 +580,24 @@ class DWGUpdaterSkill(AquaSkill):
         """Execute DWG update and delivery workflow."""
         action = inputs.get("action", "update_and_send")
         start_time = datetime.now()
+        today = start_time.strftime("%d.%m.%y")
 
         try:
             if action == "demo":
-                result = self._run_demo(inputs)
+                result = self._run_demo(inputs, today)
             elif action == "update_only":
-                result = self._update_dwg(inputs, send_email=False)
+                result = self._update_dwg(inputs, today, send_email=False)
             elif action == "update_and_send":
-                result = self._update_dwg(inputs, send_email=True)
+                result = self._update_dwg(inputs, today, send_email=True)
             else:
                 result = {"error": f"פעולה לא מוכרת: {action}"}
 
             duration = (datetime.now() - start_time).total_seconds()
             result["duration_seconds"] = round(duration, 1)
 
-            return ExecutionResult(
+            # Success fields are already well-typed - skip pydantic validation
+            # (model_construct still runs the run_id/started_at factories)
+            return ExecutionResult.model_construct(
                 status=ExecutionStatus.SUCCESS,
                 skill_id=self.metadata.id,
                 message=result.get("message", "עדכון הושלם"),
@@ -533,7 +612,7 @@ class DWGUpdaterSkill(AquaSkill):
                 error=str(e)
             )
 
-    def _run_demo(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    def _run_demo(self, inputs: Dict[str, Any], today: Optional[str] = None) -> Dict[str, Any]:
         """Run full demo with mock data."""
         search_text = inputs.get("search_text", "-8.57")
         replace_text = inputs.get("replace_text", "-7.90")
@@ -541,7 +620,7 @@ class DWGUpdaterSkill(AquaSkill):
         recipient_name = inputs.get("recipient_name", "שירן")
         dwg_file = inputs.get("dwg_file", "2046_P3_18.06.2025.dwg")
 
-        today = datetime.now().strftime("%d.%m.%y")
+        today = today or datetime.now().strftime("%d.%m.%y")
         new_filename = f"1210-20-23_{today}_UPDATED_{replace_text.replace('-', '').replace('.', '_')}.dwg"
         pdf_filename = new_filename.replace(".dwg", ".pdf")
 
@@ -646,7 +725,12 @@ class DWGUpdaterSkill(AquaSkill):
             "steps": steps
         }
 
-    def _update_dwg(self, inputs: Dict[str, Any], send_email: bool = True) -> Dict[str, Any]:
+    def _update_dwg(
+        self,
+        inputs: Dict[str, Any],
+        today: Optional[str] = None,
+        send_email: bool = True
+    ) -> Dict[str, Any]:
         """Execute actual DWG update workflow."""
         search_text = inputs.get("search_text", "-8.57")
         replace_text = inputs.get("replace_text", "-7.90")
@@ -656,9 +740,9 @@ class DWGUpdaterSkill(AquaSkill):
 
         # If mock mode, run demo instead
         if MOCK_MODE or not BRIDGE_AVAILABLE:
-            return self._run_demo(inputs)
+            return self._run_demo(inputs, today)
 
-        today = datetime.now().strftime("%d.%m.%y")
+        today = today or datetime.now().strftime("%d.%m.%y")
         new_filename = f"1210-20-23_{today}_UPDATED_{replace_text.replace('-', '').replace('.', '_')}.dwg"
         pdf_filename = new_filename.replace(".dwg", ".pdf")
 
@@ -688,13 +772,19 @@ class DWGUpdaterSkill(AquaSkill):
                 }
 
             # Step 3: Draw Revision Cloud around changes
-            locations = replace_result.get("locations", [])
+            locations = replace_result.get("locations_xy")
+            if locations is None:
+                locations = [
+                    (loc.get("x", 0), loc.get("y", 0))
+                    for loc in replace_result.get("locations", [])
+                ]
             if locations:
                 # Calculate bounding box
-                min_x = min(loc.get("x", 0) for loc in locations) - 200
-                max_x = max(loc.get("x", 0) for loc in locations) + 500
-                min_y = min(loc.get("y", 0) for loc in locations) - 100
-                max_y = max(loc.get("y", 0) for loc in locations) + 100
+                xs, ys = zip(*locations)
+                min_x = min(xs) - 200
+                max_x = max(xs) + 500
+                min_y = min(ys) - 100
+                max_y = max(ys) + 100
 
                 cloud_points = [
                     (min_x, min_y), (max_x, min_y),
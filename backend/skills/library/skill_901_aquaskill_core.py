@@ -43,11 +43,13 @@ import sys
 import json
 import hashlib
 import uuid
-from typing import Dict, Any, Optional, List, Tuple
+import itertools
+from typing import Dict, Any, Optional, List, Tuple, Sequence, Union
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -58,6 +60,13 @@ from skills.base import (
     register_skill
 )
 
+# Optional: orjson encodes the Hebrew-heavy plans/reports in C
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ============================================================================
 # CONSTANTS & ENUMS
@@ -81,9 +90,8 @@ class StepTool(str, Enum):
     AI_ENGINE = "AI_Engine"
 
 
-# Output directory for plans and results
+# Output directory for plans and results (created on first save)
 DATA_DIR = Path(__file__).parent.parent.parent / "data" / "aquaskill_core"
-DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 # NFPA 13 Hazard Classes with densities (GPM/ft²)
@@ -96,6 +104,43 @@ NFPA_HAZARD_CLASSES = {
 }
 
 
+@lru_cache(maxsize=8)
+def _hazard_step_descriptions(hazard_class: str) -> Tuple[str, str, str, str]:
+    """
+    Hazard-class dependent step descriptions (P03 EN/HE, E04 EN/HE).
+
+    Only a handful of hazard classes exist, so every plan for the same class
+    shares the same string objects instead of re-formatting them.
+    """
+    req = NFPA_HAZARD_CLASSES.get(hazard_class, NFPA_HAZARD_CLASSES['Light'])
+    return (
+        f"Fetch NFPA 13 density curves for {hazard_class}",
+        f"שליפת עקומות צפיפות NFPA 13 ל-{hazard_class}",
+        f"Place sprinkler heads ({req['density']} GPM/ft², max {req['coverage']} ft²)",
+        f"מיקום ראשי ספרינקלרים ({req['density']} GPM/ft², מקס' {req['coverage']} ft²)",
+    )
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Write data as indented UTF-8 JSON (orjson when available).
+
+    Writes to a sibling temp file and renames it over the target, so a
+    crash mid-write never leaves a truncated plan/report behind.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+    if ORJSON_AVAILABLE:
+        tmp_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    os.replace(tmp_path, path)
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
@@ -124,8 +169,27 @@ class ExecutionPlan:
     status: str
     inputs: Dict
 
+    def __post_init__(self):
+        # id -> position in steps (plain attribute, so asdict() ignores it)
+        self._step_index = {step['id']: i for i, step in enumerate(self.steps)}
 
-@dataclass
+    def update_step(self, step_id: str, **changes) -> Dict:
+        """
+        Update a single step in place by its id.
+
+        Args:
+            step_id: Step id (e.g. "E05_Routing_A_Star")
+            **changes: Fields to set on the step (status, result, ...)
+
+        Returns:
+            The updated step dict
+        """
+        step = self.steps[self._step_index[step_id]]
+        step.update(changes)
+        return step
+
+
+@dataclass(slots=True)
 class VerificationResult:
     """Result from the Forensic Verifier."""
     project_id: str
@@ -158,7 +222,7 @@ class AquaPlanner:
     def __init__(self, project_id: str, inputs: Dict[str, Any]):
         self.project_id = project_id
         self.inputs = inputs
-        self.plan_id = str(uuid.uuid4())
+        self.plan_id = uuid.uuid4().hex
 
     def _determine_risk_level(self) -> RiskProfile:
         """
@@ -183,11 +247,6 @@ class AquaPlanner:
 
         return RiskProfile.STANDARD
 
-    def _get_nfpa_requirements(self) -> Dict[str, Any]:
-        """Get NFPA 13 requirements for the hazard class."""
-        hc = self.inputs.get('hazard_class', 'Light')
-        return NFPA_HAZARD_CLASSES.get(hc, NFPA_HAZARD_CLASSES['Light'])
-
     def build_execution_plan(self) -> ExecutionPlan:
         """
         Builds a dynamic plan based on project-specific constraints.
@@ -196,7 +255,9 @@ class AquaPlanner:
             ExecutionPlan with all steps and metadata
         """
         risk_level = self._determine_risk_level()
-        nfpa_req = self._get_nfpa_requirements()
+        nfpa_fetch, nfpa_fetch_he, place, place_he = _hazard_step_descriptions(
+            self.inputs.get('hazard_class', 'Light')
+        )
 
         # Core Steps (always executed)
         steps = [
@@ -215,14 +276,14 @@ class AquaPlanner:
             {
                 "id": "P03_NFPA_Fetch",
                 "tool": StepTool.BROWSER_TOOL.value,
-                "description": f"Fetch NFPA 13 density curves for {self.inputs.get('hazard_class', 'Light')}",
-                "description_he": f"שליפת עקומות צפיפות NFPA 13 ל-{self.inputs.get('hazard_class', 'Light')}"
+                "description": nfpa_fetch,
+                "description_he": nfpa_fetch_he
             },
             {
                 "id": "E04_Sprinkler_Place",
                 "tool": StepTool.CODE_INTERPRETER.value,
-                "description": f"Place sprinkler heads ({nfpa_req['density']} GPM/ft², max {nfpa_req['coverage']} ft²)",
-                "description_he": f"מיקום ראשי ספרינקלרים ({nfpa_req['density']} GPM/ft², מקס' {nfpa_req['coverage']} ft²)"
+                "description": place,
+                "description_he": place_he
             },
             {
                 "id": "E05_Routing_A_Star",
@@ -305,9 +366,7 @@ class AquaPlanner:
         project_dir.mkdir(parents=True, exist_ok=True)
 
         plan_path = project_dir / "execution_plan.json"
-
-        with open(plan_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(plan), f, indent=2, ensure_ascii=False)
+        _write_json(plan_path, asdict(plan))
 
         return str(plan_path)
 
@@ -316,6 +375,114 @@ class AquaPlanner:
 # FORENSIC VERIFIER
 # ============================================================================
 
+# Verification status -> base-3 digit for the traffic-light table
+_STATUS_CODE = {"PASS": 0, "marginal_pass": 1, "FAIL": 2}
+
+
+def _combine_statuses(statuses: Tuple[str, ...]) -> TrafficLight:
+    """Any FAIL -> RED, else any marginal_pass -> YELLOW, else GREEN."""
+    if "FAIL" in statuses:
+        return TrafficLight.RED
+    if "marginal_pass" in statuses:
+        return TrafficLight.YELLOW
+    return TrafficLight.GREEN
+
+
+# All 27 (hydraulic, velocity, clash) combinations, indexed by h*9 + v*3 + c
+_TRAFFIC_LUT: Tuple[TrafficLight, ...] = tuple(
+    _combine_statuses(combo) for combo in itertools.product(_STATUS_CODE, repeat=3)
+)
+
+# Bilingual next-step recommendation per traffic light (EN + "\n" + HE)
+_NEXT_STEPS: Dict[TrafficLight, str] = {
+    TrafficLight.GREEN: (
+        "Ready for Fabrication - Upload to manufacturer portal\n"
+        "מוכן לייצור - העלאה לפורטל יצרן"
+    ),
+    TrafficLight.YELLOW: (
+        "Marginal Pass - Requires Senior Engineer Review\n"
+        "עובר על הקצה - נדרשת סקירת מהנדס בכיר"
+    ),
+    TrafficLight.RED: (
+        "Redesign Required - See violations list\n"
+        "נדרש תכנון מחדש - ראה רשימת הפרות"
+    ),
+}
+
+# Defaults for missing fabrication-part fields (mirrors the dict.get() fallbacks)
+_BOM_PART_DEFAULTS = {
+    "sku": "GENERIC",
+    "description": "Unknown Part",
+    "description_he": "חלק לא ידוע",
+    "length_ft": 0,
+    "unit_cost": 0,
+    "manufacturer": "Generic",
+}
+
+
+@lru_cache(maxsize=256)
+def _compute_audit_hash(project_id: str, traffic_light: str, n_violations: int, day: str) -> str:
+    """SHA-256 audit tag (first 16 hex chars) - cached, since re-verifications repeat inputs."""
+    audit_string = f"{project_id}{traffic_light}{n_violations}{day}"
+    # Hex-encode only the 8 bytes we keep (same value as hexdigest()[:16])
+    return hashlib.sha256(audit_string.encode()).digest()[:8].hex()
+
+
+def _group_parts_columns(columns: Dict[str, Sequence]) -> Dict[str, Dict]:
+    """
+    Group column-oriented fabrication parts by SKU with NumPy.
+
+    Missing columns take the _BOM_PART_DEFAULTS value. SKUs keep
+    first-seen order and metadata comes from each SKU's first part,
+    matching the row-oriented loop.
+    """
+    import numpy as np
+
+    if "sku" in columns:
+        sku = np.asarray(columns["sku"])
+    else:
+        n_rows = len(next(iter(columns.values()), ()))
+        sku = np.full(n_rows, _BOM_PART_DEFAULTS["sku"], dtype=object)
+
+    n_parts = len(sku)
+    if n_parts == 0:
+        return {}
+
+    def column(name: str) -> np.ndarray:
+        if name in columns:
+            return np.asarray(columns[name])
+        return np.full(n_parts, _BOM_PART_DEFAULTS[name], dtype=object)
+
+    skus, first, inverse, counts = np.unique(
+        sku, return_index=True, return_inverse=True, return_counts=True
+    )
+    lengths = np.bincount(
+        inverse, weights=column("length_ft").astype(np.float64), minlength=len(skus)
+    )
+
+    order = np.argsort(first, kind="stable")
+    first_rows = first[order]
+    return {
+        sku_value: {
+            "description": description,
+            "description_he": description_he,
+            "quantity": qty,
+            "total_length_ft": total_length,
+            "unit_cost_usd": unit_cost,
+            "manufacturer": manufacturer,
+        }
+        for sku_value, description, description_he, qty, total_length, unit_cost, manufacturer in zip(
+            skus[order].tolist(),
+            column("description")[first_rows].tolist(),
+            column("description_he")[first_rows].tolist(),
+            counts[order].tolist(),
+            lengths[order].tolist(),
+            column("unit_cost")[first_rows].tolist(),
+            column("manufacturer")[first_rows].tolist(),
+        )
+    }
+
+
 class AquaVerifier:
     """
     Forensic Verifier that validates execution results.
@@ -330,8 +497,10 @@ class AquaVerifier:
 
     SAFETY_MARGIN = 1.1  # 10% safety margin
 
-    def __init__(self, project_id: str):
+    def __init__(self, project_id: str, verbose: bool = True):
         self.project_id = project_id
+        # verbose=False skips PASS/WARNING audit messages (violations are always kept)
+        self.verbose = verbose
         self.audit_log: List[str] = []
         self.violations: List[str] = []
 
@@ -354,16 +523,20 @@ class AquaVerifier:
             )
             return "FAIL"
 
-        if end_pressure < req_pressure * self.SAFETY_MARGIN:
-            self.audit_log.append(
-                f"WARNING: Low safety margin ({((end_pressure/req_pressure)-1)*100:.1f}% < 10% recommended)."
-            )
-            return "marginal_pass"
+        marginal = end_pressure < req_pressure * self.SAFETY_MARGIN
 
-        self.audit_log.append(
-            f"PASS: Hydraulic verification passed with {((end_pressure/req_pressure)-1)*100:.1f}% margin."
-        )
-        return "PASS"
+        if self.verbose:
+            margin_pct = (end_pressure / req_pressure - 1) * 100
+            if marginal:
+                self.audit_log.append(
+                    f"WARNING: Low safety margin ({margin_pct:.1f}% < 10% recommended)."
+                )
+            else:
+                self.audit_log.append(
+                    f"PASS: Hydraulic verification passed with {margin_pct:.1f}% margin."
+                )
+
+        return "marginal_pass" if marginal else "PASS"
 
     def _verify_velocity(self, results: Dict[str, Any]) -> str:
         """
@@ -383,14 +556,16 @@ class AquaVerifier:
             return "FAIL"
 
         if max_velocity > 20:
-            self.audit_log.append(
-                f"WARNING: Max velocity ({max_velocity:.1f} fps) is in warning range (20-32 fps)."
-            )
+            if self.verbose:
+                self.audit_log.append(
+                    f"WARNING: Max velocity ({max_velocity:.1f} fps) is in warning range (20-32 fps)."
+                )
             return "marginal_pass"
 
-        self.audit_log.append(
-            f"PASS: Velocity check passed ({max_velocity:.1f} fps < 20 fps)."
-        )
+        if self.verbose:
+            self.audit_log.append(
+                f"PASS: Velocity check passed ({max_velocity:.1f} fps < 20 fps)."
+            )
         return "PASS"
 
     def _verify_clashes(self, clash_data: Dict[str, Any]) -> str:
@@ -413,51 +588,70 @@ class AquaVerifier:
             return "FAIL"
 
         if soft_clashes > 5:
-            self.audit_log.append(
-                f"WARNING: {soft_clashes} soft clashes detected (clearance violations)."
-            )
+            if self.verbose:
+                self.audit_log.append(
+                    f"WARNING: {soft_clashes} soft clashes detected (clearance violations)."
+                )
             return "marginal_pass"
 
-        self.audit_log.append(
-            f"PASS: Clash detection passed ({soft_clashes} minor clearance issues)."
-        )
+        if self.verbose:
+            self.audit_log.append(
+                f"PASS: Clash detection passed ({soft_clashes} minor clearance issues)."
+            )
         return "PASS"
 
-    def generate_bom_lod500(self, piping_data: List[Dict]) -> Dict[str, Any]:
+    def generate_bom_lod500(
+        self,
+        piping_data: Union[List[Dict], Dict[str, Sequence]]
+    ) -> Dict[str, Any]:
         """
         Generates a Manufacturer-ready Bill of Materials (LOD 500).
 
         Args:
-            piping_data: List of fabrication parts
+            piping_data: List of fabrication parts, or a dict of parallel
+                columns ({"sku": [...], "length_ft": [...], ...})
 
         Returns:
             BOM dictionary grouped by SKU
         """
+        if isinstance(piping_data, dict):
+            return self._summarize_bom(_group_parts_columns(piping_data))
+
         bom: Dict[str, Dict] = {}
 
         for part in piping_data:
             sku = part.get('sku', 'GENERIC')
+            row = bom.get(sku)
 
-            if sku not in bom:
+            if row is None:
+                # First occurrence - metadata is read once per SKU
                 bom[sku] = {
                     "description": part.get('description', 'Unknown Part'),
                     "description_he": part.get('description_he', 'חלק לא ידוע'),
-                    "quantity": 0,
-                    "total_length_ft": 0.0,
+                    "quantity": 1,
+                    "total_length_ft": float(part.get('length_ft', 0)),
                     "unit_cost_usd": part.get('unit_cost', 0),
                     "manufacturer": part.get('manufacturer', 'Generic')
                 }
-
-            bom[sku]['quantity'] += 1
-            bom[sku]['total_length_ft'] += part.get('length_ft', 0)
-
-        # Calculate totals
-        total_parts = sum(item['quantity'] for item in bom.values())
-        total_length = sum(item['total_length_ft'] for item in bom.values())
-        total_cost = sum(
-            item['quantity'] * item['unit_cost_usd']
-            for item in bom.values()
-        )
+                continue
+
+            row['quantity'] += 1
+            row['total_length_ft'] += part.get('length_ft', 0)
+
+        return self._summarize_bom(bom)
+
+    @staticmethod
+    def _summarize_bom(bom: Dict[str, Dict]) -> Dict[str, Any]:
+        """Wrap per-SKU BOM rows with overall totals."""
+        # Calculate totals (single pass over the SKU rows)
+        total_parts = 0
+        total_length = 0.0
+        total_cost = 0.0
+        for item in bom.values():
+            quantity = item['quantity']
+            total_parts += quantity
+            total_length += item['total_length_ft']
+            total_cost += quantity * item['unit_cost_usd']
 
         return {
             "parts": bom,
@@ -469,78 +663,79 @@ class AquaVerifier:
             }
         }
 
-    def _generate_audit_hash(self, traffic_light: str) -> str:
+    def _generate_audit_hash(self, traffic_light: str, day: Optional[str] = None) -> str:
         """
         Create cryptographic signature for audit trail.
 
         This ensures the report hasn't been tampered with.
+
+        Args:
+            traffic_light: Final traffic light value
+            day: Verification date as YYYYMMDD (default: today)
         """
-        audit_string = (
-            f"{self.project_id}"
-            f"{traffic_light}"
-            f"{len(self.violations)}"
-            f"{datetime.now().strftime('%Y%m%d')}"
+        return _compute_audit_hash(
+            self.project_id,
+            traffic_light,
+            len(self.violations),
+            day or datetime.now().strftime('%Y%m%d')
         )
-        return hashlib.sha256(audit_string.encode()).hexdigest()[:16]
 
-    def finalize_verification(self, context_data: Dict[str, Any]) -> VerificationResult:
+    def finalize_verification(
+        self,
+        context_data: Dict[str, Any],
+        eager: bool = False
+    ) -> VerificationResult:
         """
         Run all verifications and produce final report.
 
         Args:
             context_data: Full context with hydraulic_results, clash_results, fabrication_parts
+            eager: Skip BOM generation once any check FAILs (the result is RED
+                regardless). bom_summary is then empty with zero totals.
+                The skill actions always run with eager=False.
 
         Returns:
             VerificationResult with traffic light and all details
         """
+        # Single clock read so the audit hash date and timestamp always agree
+        now = datetime.now()
+
+        hydraulic_results = context_data.get('hydraulic_results') or {}
+        clash_results = context_data.get('clash_results') or {}
+        fabrication_parts = context_data.get('fabrication_parts') or []
+
         # 1. Hydraulic Check
-        hydraulic_status = self._verify_hydraulics(
-            context_data.get('hydraulic_results', {})
-        )
+        hydraulic_status = self._verify_hydraulics(hydraulic_results)
 
         # 2. Velocity Check
-        velocity_status = self._verify_velocity(
-            context_data.get('hydraulic_results', {})
-        )
+        velocity_status = self._verify_velocity(hydraulic_results)
 
         # 3. Clash Check
-        clash_status = self._verify_clashes(
-            context_data.get('clash_results', {})
-        )
+        clash_status = self._verify_clashes(clash_results)
 
         # 4. Generate BOM
-        bom = self.generate_bom_lod500(
-            context_data.get('fabrication_parts', [])
-        )
+        if eager and "FAIL" in (hydraulic_status, velocity_status, clash_status):
+            bom = self._summarize_bom({})
+        else:
+            bom = self.generate_bom_lod500(fabrication_parts)
 
         # 5. Traffic Light Logic
-        all_statuses = [hydraulic_status, velocity_status, clash_status]
-
-        if "FAIL" in all_statuses:
-            traffic_light = TrafficLight.RED
-        elif "marginal_pass" in all_statuses:
-            traffic_light = TrafficLight.YELLOW
-        else:
-            traffic_light = TrafficLight.GREEN
+        traffic_light = _TRAFFIC_LUT[
+            _STATUS_CODE[hydraulic_status] * 9
+            + _STATUS_CODE[velocity_status] * 3
+            + _STATUS_CODE[clash_status]
+        ]
 
         # 6. Audit Hash
-        audit_hash = self._generate_audit_hash(traffic_light.value)
+        audit_hash = self._generate_audit_hash(traffic_light.value, now.strftime('%Y%m%d'))
 
         # 7. Next Step Recommendation
-        if traffic_light == TrafficLight.GREEN:
-            next_step = "Ready for Fabrication - Upload to manufacturer portal"
-            next_step_he = "מוכן לייצור - העלאה לפורטל יצרן"
-        elif traffic_light == TrafficLight.YELLOW:
-            next_step = "Marginal Pass - Requires Senior Engineer Review"
-            next_step_he = "עובר על הקצה - נדרשת סקירת מהנדס בכיר"
-        else:
-            next_step = "Redesign Required - See violations list"
-            next_step_he = "נדרש תכנון מחדש - ראה רשימת הפרות"
+        next_step = _NEXT_STEPS[traffic_light]
 
         # 8. Build Result
         result = VerificationResult(
             project_id=self.project_id,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now.isoformat(),
             traffic_light=traffic_light.value,
             audit_hash=audit_hash,
             bom_summary=bom,
@@ -550,13 +745,47 @@ class AquaVerifier:
                 "System designed in accordance with NFPA 13 (2025 Edition) "
                 "and Israeli Standard ת\"י 1596 for fire water systems."
             ),
-            next_step=f"{next_step}\n{next_step_he}",
+            next_step=next_step,
             hydraulic_status=hydraulic_status,
             clash_status=clash_status
         )
 
         return result
 
+    @classmethod
+    def finalize_batch(
+        cls,
+        project_contexts: List[Tuple[str, Dict[str, Any]]],
+        max_workers: Optional[int] = None,
+        verbose: bool = True,
+        eager: bool = False
+    ) -> List[VerificationResult]:
+        """
+        Verify many independent projects in parallel (e.g. nightly audit sweep).
+
+        Args:
+            project_contexts: (project_id, context_data) pairs
+            max_workers: Worker processes (default: CPU count)
+            verbose: Passed to each AquaVerifier
+            eager: Passed to finalize_verification (skip BOM for failed projects)
+
+        Returns:
+            VerificationResults in the same order as project_contexts
+        """
+        items = [
+            (project_id, context, verbose, eager) for project_id, context in project_contexts
+        ]
+        if len(items) < 2:
+            return [_verify_one(item) for item in items]
+
+        # Deferred: concurrent.futures.process pulls in multiprocessing (~8ms import)
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, min(16, len(items) // workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_verify_one, items, chunksize=chunksize))
+
     def save_report(self, result: VerificationResult) -> str:
         """
         Save verification report to local filesystem (production: S3).
@@ -568,13 +797,19 @@ class AquaVerifier:
         project_dir.mkdir(parents=True, exist_ok=True)
 
         report_path = project_dir / "verification_report.json"
-
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(result), f, indent=2, ensure_ascii=False)
+        # Shallow field dict - no nested dataclasses, so asdict()'s deep copy is wasted work
+        _write_json(report_path, {f.name: getattr(result, f.name) for f in fields(result)})
 
         return str(report_path)
 
 
+def _verify_one(item: Tuple[str, Dict[str, Any], bool, bool]) -> VerificationResult:
+    """Process-pool worker for AquaVerifier.finalize_batch."""
+    project_id, context_data, verbose, eager = item
+    verifier = AquaVerifier(project_id, verbose=verbose)
+    return verifier.finalize_verification(context_data, eager=eager)
+
+
 # ============================================================================
 # SKILL #901 - AQUASKILL CORE
 # ============================================================================
@@ -696,7 +931,8 @@ class AquaSkillCore(AquaSkill):
 
     def _run_planner(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Run the Dynamic Planner."""
-        project_id = inputs.get("project_id", f"PROJ-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+        # Only build the timestamped fallback id when none was supplied
+        project_id = inputs.get("project_id") or f"PROJ-{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
         planner_inputs = {
             "hazard_class": inputs.get("hazard_class", "Ordinary Group 2"),
@@ -765,7 +1001,8 @@ class AquaSkillCore(AquaSkill):
 
     def _run_full_demo(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Run complete Planner → Executor → Verifier demo."""
-        project_id = inputs.get("project_id", f"DEMO-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+        # Only build the timestamped fallback id when none was supplied
+        project_id = inputs.get("project_id") or f"DEMO-{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
         results = {
             "message": "הדגמה מלאה של AquaSkill Core | Full AquaSkill Core Demo",
@@ -823,6 +1060,8 @@ class AquaSkillCore(AquaSkill):
         })
 
         # Phase 3: Verifier
+        # One shared sprinkler record - the BOM only reads parts, never mutates them
+        sprinkler_part = {'sku': 'SPK-STD', 'description': 'Standard Sprinkler Head', 'description_he': 'ראש ספרינקלר סטנדרטי', 'length_ft': 0, 'unit_cost': 12.00, 'manufacturer': 'Viking'}
         context_data = {
             'hydraulic_results': executor_result['hydraulic_results'],
             'clash_results': executor_result['clash_results'],
@@ -831,7 +1070,8 @@ class AquaSkillCore(AquaSkill):
                 {'sku': 'VIC-002', 'description': 'Victaulic Tee', 'description_he': 'טי ויקטולי', 'length_ft': 0, 'unit_cost': 35.00, 'manufacturer': 'Victaulic'},
                 {'sku': 'PIP-SCH40-2', 'description': '2" Schedule 40 Pipe', 'description_he': 'צינור 2" Schedule 40', 'length_ft': 400, 'unit_cost': 8.50, 'manufacturer': 'Generic'},
                 {'sku': 'PIP-SCH40-1.5', 'description': '1.5" Schedule 40 Pipe', 'description_he': 'צינור 1.5" Schedule 40', 'length_ft': 250, 'unit_cost': 6.00, 'manufacturer': 'Generic'},
-            ] + [{'sku': 'SPK-STD', 'description': 'Standard Sprinkler Head', 'description_he': 'ראש ספרינקלר סטנדרטי', 'length_ft': 0, 'unit_cost': 12.00, 'manufacturer': 'Viking'} for _ in range(45)]
+                *([sprinkler_part] * executor_result['sprinklers_placed']),
+            ]
         }
 
         verifier = AquaVerifier(project_id)
@@ -61,12 +61,20 @@ import json
 import base64
 import hashlib
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Literal
+from typing import Dict, Any, List, Optional, Tuple, Literal, Callable, Mapping
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
 import threading
 import time
+import asyncio
+import queue
+import atexit
+import weakref
 
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -77,12 +85,26 @@ from skills.base import (
     register_skill
 )
 
+# Optional: orjson serializes the Hebrew project data straight to UTF-8
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps_project(project: Dict[str, Any]) -> str:
+    """Serialize project data as indented JSON for LLM prompts."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(project, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(project, ensure_ascii=False, indent=2)
+
 
 # =============================================================================
 # CONFIGURATION - SECRETS MANAGER
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SecretsManager:
     """
     Secure secrets manager for API keys and OAuth tokens.
@@ -125,7 +147,7 @@ secrets = SecretsManager()
 # ENGINEER PROFILE (Extended)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SeniorEngineerProfile:
     """Extended profile for the virtual senior engineer."""
     full_name: str = "נימרוד עופר"
@@ -147,6 +169,105 @@ class SeniorEngineerProfile:
 # PROJECT MEMORY (Weaviate Integration)
 # =============================================================================
 
+# Open issues mentioning any of these block auto-signing a declaration
+BLOCKING_ISSUE_KEYWORDS = ("חסר", "ברז")
+_BLOCKING_ISSUE_RE = re.compile("|".join(map(re.escape, BLOCKING_ISSUE_KEYWORDS)))
+
+# Search results cached per query string (misses included), least recently used evicted
+SEARCH_CACHE_MAX_ENTRIES = 256
+
+# Logged activity is written in the background, batched per debounce window
+ACTIVITY_FLUSH_INTERVAL_SEC = 0.5
+ACTIVITY_BATCH_SIZE = 100
+ACTIVITY_WRITER_IDLE_SEC = 5.0  # The writer thread exits after this long with nothing queued
+
+# Memories with a running activity writer - flushed once at interpreter exit
+_ACTIVE_MEMORIES: "weakref.WeakSet[ProjectMemory]" = weakref.WeakSet()
+
+
+def _flush_active_memories() -> None:
+    for memory in list(_ACTIVE_MEMORIES):
+        memory.flush()
+
+
+atexit.register(_flush_active_memories)
+
+
+@lru_cache(maxsize=8)
+def _project_matcher(names: Tuple[str, ...]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Compile known project names into one alternation, matched against lowercased text.
+
+    Longest names go first so a name never loses to its own prefix.
+    Returns the pattern and a lowercased-name -> name map.
+    """
+    by_lower = {name.lower(): name for name in names}
+    alternation = "|".join(map(re.escape, sorted(by_lower, key=len, reverse=True)))
+    return re.compile(alternation or r"(?!)"), by_lower
+
+
+# Demo projects, built once and shared by every ProjectMemory
+_MOCK_DATA: Dict[str, Any] = {
+    "ארלוזורוב 20": {
+        "project_id": "ARL-20-2024",
+        "address": "ארלוזורוב 20, תל אביב",
+        "gush_chelka": "3000/150",
+        "permit_number": "2024-05678",
+        "client": "חברת נדל\"ן בע\"מ",
+        "status": "בביצוע",
+        "payment_status": {
+            "dami_hakama": {"amount": 187000, "paid": False, "deadline": "2025-01-15"},
+            "piku_elyon": {"amount": 45000, "paid": True}
+        },
+        "recent_reports": [
+            {"date": "2024-11-15", "type": "פיקוח עליון", "findings": "חוסר ברז ריקון במאגר"},
+            {"date": "2024-10-20", "type": "בדיקת ספרינקלרים", "findings": "תקין"},
+            {"date": "2024-09-10", "type": "בדיקת אינסטלציה", "findings": "AS-MADE לא עדכני"}
+        ],
+        "open_issues": [
+            "ברז ריקון חסר במאגר שריפה",
+            "AS-MADE לא עודכן מ-09/2024",
+            "דמי הקמה לתאגיד מים - 187,000 ₪ טרם שולמו"
+        ],
+        "contacts": [
+            {"name": "דניאל קשטן", "role": "מפקח עירייה", "email": "daniel@example.com"},
+            {"name": "יוסי לוי", "role": "קבלן ראשי", "email": "yossi@example.com"}
+        ],
+        "regulatory": {
+            "nfpa13": "תקף עד 2026",
+            "ti1596": "תקף",
+            "fire_dept_approval": "ממתין"
+        }
+    },
+    "קניון נופים": {
+        "project_id": "NOF-2024",
+        "address": "קניון נופים, רמת גן",
+        "gush_chelka": "6200/85",
+        "permit_number": "2024-09123",
+        "client": "עיריית רמת גן",
+        "status": "בתכנון",
+        "payment_status": {
+            "dami_hakama": {"amount": 320000, "paid": False, "deadline": "2025-02-28"}
+        },
+        "recent_reports": [
+            {"date": "2024-11-28", "type": "סקר ראשוני", "findings": "חסר ברז כיבוי ראשי"}
+        ],
+        "open_issues": [
+            "חסר ברז כיבוי ראשי",
+            "דמי הקמה 320,000 ₪ טרם שולמו"
+        ],
+        "contacts": [
+            {"name": "מיכל כהן", "role": "מנהלת פרויקט עירייה", "email": "michal@ramatgan.muni.il"}
+        ],
+        "regulatory": {
+            "nfpa13": "נדרש אישור",
+            "ti1596": "בתהליך",
+            "fire_dept_approval": "נדרש"
+        }
+    }
+}
+
+
 class ProjectMemory:
     """
     Weaviate-based project memory.
@@ -157,104 +278,159 @@ class ProjectMemory:
         self.url = weaviate_url or secrets.weaviate_url
         self.api_key = api_key or secrets.weaviate_api_key
         self._mock_data = self._init_mock_data()
-
-    def _init_mock_data(self) -> Dict[str, Any]:
-        """Initialize mock project data for demo."""
-        return {
-            "ארלוזורוב 20": {
-                "project_id": "ARL-20-2024",
-                "address": "ארלוזורוב 20, תל אביב",
-                "gush_chelka": "3000/150",
-                "permit_number": "2024-05678",
-                "client": "חברת נדל\"ן בע\"מ",
-                "status": "בביצוע",
-                "payment_status": {
-                    "dami_hakama": {"amount": 187000, "paid": False, "deadline": "2025-01-15"},
-                    "piku_elyon": {"amount": 45000, "paid": True}
-                },
-                "recent_reports": [
-                    {"date": "2024-11-15", "type": "פיקוח עליון", "findings": "חוסר ברז ריקון במאגר"},
-                    {"date": "2024-10-20", "type": "בדיקת ספרינקלרים", "findings": "תקין"},
-                    {"date": "2024-09-10", "type": "בדיקת אינסטלציה", "findings": "AS-MADE לא עדכני"}
-                ],
-                "open_issues": [
-                    "ברז ריקון חסר במאגר שריפה",
-                    "AS-MADE לא עודכן מ-09/2024",
-                    "דמי הקמה לתאגיד מים - 187,000 ₪ טרם שולמו"
-                ],
-                "contacts": [
-                    {"name": "דניאל קשטן", "role": "מפקח עירייה", "email": "daniel@example.com"},
-                    {"name": "יוסי לוי", "role": "קבלן ראשי", "email": "yossi@example.com"}
-                ],
-                "regulatory": {
-                    "nfpa13": "תקף עד 2026",
-                    "ti1596": "תקף",
-                    "fire_dept_approval": "ממתין"
-                }
-            },
-            "קניון נופים": {
-                "project_id": "NOF-2024",
-                "address": "קניון נופים, רמת גן",
-                "gush_chelka": "6200/85",
-                "permit_number": "2024-09123",
-                "client": "עיריית רמת גן",
-                "status": "בתכנון",
-                "payment_status": {
-                    "dami_hakama": {"amount": 320000, "paid": False, "deadline": "2025-02-28"}
-                },
-                "recent_reports": [
-                    {"date": "2024-11-28", "type": "סקר ראשוני", "findings": "חסר ברז כיבוי ראשי"}
-                ],
-                "open_issues": [
-                    "חסר ברז כיבוי ראשי",
-                    "דמי הקמה 320,000 ₪ טרם שולמו"
-                ],
-                "contacts": [
-                    {"name": "מיכל כהן", "role": "מנהלת פרויקט עירייה", "email": "michal@ramatgan.muni.il"}
-                ],
-                "regulatory": {
-                    "nfpa13": "נדרש אישור",
-                    "ti1596": "בתהליך",
-                    "fire_dept_approval": "נדרש"
-                }
-            }
+        self._search_cache: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._json_cache: Dict[str, str] = {}  # Keyed by project name - one entry per known project
+        self._revisions: Dict[str, int] = defaultdict(int)  # Bumped per project on logged activity
+        self._activity_queue: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._flush_now = threading.Event()  # Set by flush() to cut the debounce short
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Precompute project names, lowercased name/address lookups, unpaid payments and blocking issues."""
+        self._projects = tuple(self._mock_data)
+        self._name_idx = {name.lower(): name for name in self._mock_data}
+        self._addr_idx = {
+            data.get("address", "").lower(): name for name, data in self._mock_data.items()
+        }
+        self._search_keys = [
+            (name.lower(), data.get("address", "").lower(), name)
+            for name, data in self._mock_data.items()
+        ]
+        self._unpaid = {
+            name: [
+                (payment, status.get("amount", 0), status.get("deadline"))
+                for payment, status in data.get("payment_status", {}).items()
+                if isinstance(status, dict) and not status.get("paid", True)
+            ]
+            for name, data in self._mock_data.items()
+        }
+        self._blocking = {
+            name: [issue for issue in data.get("open_issues", []) if _BLOCKING_ISSUE_RE.search(issue)]
+            for name, data in self._mock_data.items()
         }
 
+    def _init_mock_data(self) -> Mapping[str, Any]:
+        """Initialize mock project data for demo (shared, read-only view)."""
+        return MappingProxyType(_MOCK_DATA)
+
     def search_project(self, query: str) -> Optional[Dict[str, Any]]:
         """Search for project by name or keywords."""
+        with self._search_cache_lock:
+            if query in self._search_cache:
+                self._search_cache.move_to_end(query)
+                return self._search_cache[query]
+
+        result = self._search_uncached(query)
+
+        with self._search_cache_lock:
+            result = self._search_cache.setdefault(query, result)
+            self._search_cache.move_to_end(query)
+            while len(self._search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+                self._search_cache.popitem(last=False)
+        return result
+
+    def _search_uncached(self, query: str) -> Optional[Dict[str, Any]]:
+        """Resolve a search query against the project index."""
         query_lower = query.lower()
 
-        for name, data in self._mock_data.items():
-            if name.lower() in query_lower or query_lower in name.lower():
-                return {"name": name, **data}
-
-            # Check address
-            if data.get("address", "").lower() in query_lower:
-                return {"name": name, **data}
-
-        return None
+        # Exact name / address hits
+        name = self._name_idx.get(query_lower) or self._addr_idx.get(query_lower)
+
+        if name is None:
+            # Partial match on name, or address contained in query
+            for name_lower, address_lower, key in self._search_keys:
+                if name_lower in query_lower or query_lower in name_lower or address_lower in query_lower:
+                    name = key
+                    break
+            else:
+                return None
+
+        return {"name": name, **self._mock_data[name]}
+
+    def projects(self) -> Tuple[str, ...]:
+        """Get all known project names (rebuilt only with the indexes)."""
+        return self._projects
+
+    def find_projects(self, text: str) -> List[str]:
+        """Find known project names mentioned in free text, in order of appearance."""
+        pattern, by_lower = _project_matcher(self._projects)
+        found = {by_lower[m.group()]: None for m in pattern.finditer(text.lower())}
+        return list(found)
+
+    def get_project(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """Get a project by its exact name (no fuzzy matching)."""
+        data = self._mock_data.get(project_name)
+        if data is None:
+            return None
+        return {"name": project_name, **data}
+
+    def _resolve_name(self, query: str) -> Optional[str]:
+        """Map an exact project name or a search query to the project key."""
+        if query in self._mock_data:
+            return query
+
+        project = self.search_project(query)
+        return project["name"] if project else None
+
+    def revision_of(self, project_name: str) -> int:
+        """Get a counter that changes whenever activity is logged for the project."""
+        return self._revisions.get(self._resolve_name(project_name) or project_name, 0)
+
+    def project_json(self, query: str) -> Optional[str]:
+        """Get the search result for a query serialized for prompts (cached per project)."""
+        name = self._resolve_name(query)
+        if name is None:
+            return None
+
+        data = self._json_cache.get(name)
+        if data is None:
+            data = self._json_cache[name] = _dumps_project({"name": name, **self._mock_data[name]})
+        return data
+
+    def _clear_caches(self) -> None:
+        """Drop cached search results after project state changes."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+        self._json_cache.clear()
 
     def get_project_history(self, project_name: str) -> List[Dict[str, Any]]:
         """Get full project history and documents."""
-        project = self.search_project(project_name)
-        if project:
-            return project.get("recent_reports", [])
+        name = self._resolve_name(project_name)
+        if name:
+            return self._mock_data[name].get("recent_reports", [])
         return []
 
     def get_open_issues(self, project_name: str) -> List[str]:
         """Get open issues for a project."""
-        project = self.search_project(project_name)
-        if project:
-            return project.get("open_issues", [])
+        name = self._resolve_name(project_name)
+        if name:
+            return self._mock_data[name].get("open_issues", [])
         return []
 
     def get_payment_status(self, project_name: str) -> Dict[str, Any]:
         """Get payment status for a project."""
-        project = self.search_project(project_name)
-        if project:
-            return project.get("payment_status", {})
+        name = self._resolve_name(project_name)
+        if name:
+            return self._mock_data[name].get("payment_status", {})
         return {}
 
+    def get_unpaid_payments(self, project_name: str) -> List[Tuple[str, int, Optional[str]]]:
+        """Get (payment, amount, deadline) for each unpaid payment of a project."""
+        name = self._resolve_name(project_name)
+        if name:
+            return self._unpaid[name]
+        return []
+
+    def get_blocking_issues(self, project_name: str) -> List[str]:
+        """Get open issues that block auto-signing (see BLOCKING_ISSUE_KEYWORDS)."""
+        name = self._resolve_name(project_name)
+        if name:
+            return self._blocking[name]
+        return []
+
     def add_action_item(
         self,
         project_name: str,
@@ -264,6 +440,7 @@ class ProjectMemory:
     ) -> bool:
         """Add action item to project."""
         # In production, would store in Weaviate
+        self._clear_caches()
         print(f"[MEMORY] Added action item to {project_name}: {action} (deadline: {deadline})")
         return True
 
@@ -274,15 +451,86 @@ class ProjectMemory:
         description: str,
         metadata: Dict = None
     ) -> bool:
-        """Log activity to project history."""
-        print(f"[MEMORY] Logged activity for {project_name}: {activity_type} - {description}")
+        """Log activity to project history (written in the background - see flush())."""
+        self._clear_caches()
+        self._revisions[self._resolve_name(project_name) or project_name] += 1
+        self._activity_queue.put({
+            "project_name": project_name,
+            "activity_type": activity_type,
+            "description": description,
+            "metadata": metadata or {},
+            "logged_at": datetime.now().isoformat()
+        })
+        self._ensure_writer()
         return True
 
+    def flush(self) -> None:
+        """Block until every logged activity has been written."""
+        self._flush_now.set()
+        self._activity_queue.join()
+        self._flush_now.clear()
+
+    def _ensure_writer(self) -> None:
+        """Start the background activity writer if it is not running."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="activity-writer", daemon=True)
+                self._writer.start()
+                _ACTIVE_MEMORIES.add(self)
+
+    def _write_loop(self) -> None:
+        """
+        Drain the activity queue, writing up to ACTIVITY_BATCH_SIZE entries at a time.
+
+        Exits once the queue stays empty for ACTIVITY_WRITER_IDLE_SEC, so an
+        idle memory is not pinned by its thread; log_activity() restarts it.
+        """
+        while True:
+            try:
+                batch = [self._activity_queue.get(timeout=ACTIVITY_WRITER_IDLE_SEC)]
+            except queue.Empty:
+                with self._writer_lock:
+                    if self._activity_queue.empty():
+                        self._writer = None
+                        return
+                continue
+
+            self._flush_now.wait(ACTIVITY_FLUSH_INTERVAL_SEC)  # Debounce - let a burst accumulate
+
+            while len(batch) < ACTIVITY_BATCH_SIZE:
+                try:
+                    batch.append(self._activity_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_activities(batch)
+            except Exception as e:
+                print(f"[MEMORY] Failed to write {len(batch)} activities: {e}")
+            finally:
+                for _ in batch:
+                    self._activity_queue.task_done()
+
+    def _write_activities(self, activities: List[Dict[str, Any]]) -> None:
+        """Persist a batch of activities."""
+        # In production, one batched insert into Weaviate
+        for activity in activities:
+            print(
+                f"[MEMORY] Logged activity for {activity['project_name']}: "
+                f"{activity['activity_type']} - {activity['description']}"
+            )
+
 
 # =============================================================================
 # MEETING PREP GENERATOR
 # =============================================================================
 
+# The LLM only fills the judgement sections; the 8-line document is rendered locally
+MEETING_PREP_SCHEMA = """{{"goal": "מטרת הפגישה במשפט אחד",
+ "risks": ["סיכונים משפטיים/פיננסיים"],
+ "wants": ["מה אנחנו רוצים להשיג"],
+ "concessions": ["מה אנחנו מוכנים לוותר"]}}"""
+
 MEETING_PREP_PROMPT = """אתה נימרוד עופר, מהנדס אזרחי בכיר עם 38 שנות ניסיון.
 
 פגישה בעוד שעה עם {participants}.
@@ -292,17 +540,74 @@ MEETING_PREP_PROMPT = """אתה נימרוד עופר, מהנדס אזרחי ב
 נתוני הפרויקט:
 {project_data}
 
-הכן מסמך הכנה של 8 שורות בדיוק:
-1. מטרת הפגישה
-2. רקע עדכני
-3. ממצאים קריטיים מדו"חות קודמים
-4. סיכונים משפטיים/פיננסיים
-5. דרישות רגולטוריות (ת"י 1596, NFPA-13, דמי הקמה)
-6. מה אנחנו רוצים להשיג
-7. מה אנחנו מוכנים לוותר
-8. Action Items מומלצים
+הכן הכנה לפגישה. החזר JSON תקין בלבד, ללא טקסט נוסף, במבנה:
+""" + MEETING_PREP_SCHEMA + """
+
+עד 3 פריטים קצרים בכל רשימה."""
+
+# Several meetings in one LLM call; each answer is returned after a ===[N]=== marker
+MEETING_PREP_BATCH_PROMPT = """אתה נימרוד עופר, מהנדס אזרחי בכיר עם 38 שנות ניסיון.
+
+יש לך {count} פגישות קרובות. לכל פגישה החזר JSON תקין בלבד במבנה:
+""" + MEETING_PREP_SCHEMA + """
+
+עד 3 פריטים קצרים בכל רשימה.
+
+{meetings}
+
+החזר את התשובות לפי הסדר.
+כל תשובה מתחילה בשורה נפרדת ===[N]=== כאשר N הוא מספר הפגישה."""
+
+MEETING_PREP_BATCH_ITEM = """[{index}] פגישה עם {participants}.
+הפרויקט: {project_name}.
+נתוני הפרויקט:
+{project_data}"""
+
+PREP_BATCH_SIZE = 4
+PREP_CACHE_TTL_SEC = 3600
+PREP_CACHE_MAX_ENTRIES = 256
+_BATCH_MARKER_RE = re.compile(r"^\s*===\[(\d+)\]===\s*$", re.MULTILINE)
+
+
+# Local defaults for the sections the LLM would otherwise fill
+_DEFAULT_PREP_SECTIONS = {
+    "goal": "סקירת התקדמות הפרויקט וסגירת סוגיות פתוחות",
+    "risks": [],
+    "wants": ["אישור להמשך עבודות", "סגירת ליקויים פתוחים", "קביעת לו\"ז לתשלומים"],
+    "concessions": ["דחיית תשלום דמי הקמה עד 30 יום", "גמישות בלו\"ז תיקון ליקויים"],
+}
+
+
+def _parse_prep_sections(response: str) -> Dict[str, Any]:
+    """Parse the LLM's JSON prep answer (raises ValueError if it is not a JSON object)."""
+    start, end = response.find("{"), response.rfind("}")
+    if start < 0 or end < start:
+        raise ValueError("no JSON object in response")
+
+    raw = response[start:end + 1]
+    sections = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    if not isinstance(sections, dict):
+        raise ValueError("prep answer is not a JSON object")
+
+    return sections
+
+
+def _bullets(items: Any) -> List[str]:
+    """Normalize an LLM list field (list or single string) to bullet texts."""
+    if isinstance(items, str):
+        items = [items]
+    return [str(item) for item in items or [] if item]
 
-החזר את המסמך בפורמט מסודר וקצר."""
+
+def _split_batch_response(response: str, count: int) -> List[str]:
+    """Split a batched LLM response into per-meeting documents (raises ValueError)."""
+    parts = _BATCH_MARKER_RE.split(response)
+    documents = {int(index): text.strip() for index, text in zip(parts[1::2], parts[2::2])}
+
+    if sorted(documents) != list(range(1, count + 1)):
+        raise ValueError(f"expected {count} marked documents, got {sorted(documents)}")
+
+    return [documents[i] for i in range(1, count + 1)]
 
 
 class MeetingPrepGenerator:
@@ -313,17 +618,26 @@ class MeetingPrepGenerator:
 
     def __init__(self, memory: ProjectMemory):
         self.memory = memory
+        # cache key -> (created, project revision, document), least recently used first
+        self._prep_cache: "OrderedDict[str, Tuple[float, int, str]]" = OrderedDict()
+        self._prep_cache_lock = threading.Lock()  # Meetings are prepared in parallel
 
     def generate(
         self,
         project_name: str,
         meeting_title: str,
         participants: List[str],
-        meeting_time: datetime
+        meeting_time: datetime,
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Generate meeting preparation document.
 
+        Args:
+            on_chunk: Optional callback receiving the finished document once
+                (the LLM answers JSON that is rendered locally, so raw
+                response chunks are never forwarded)
+
         Returns:
             {
                 "document": str,
@@ -332,47 +646,243 @@ class MeetingPrepGenerator:
                 "action_items": List[str]
             }
         """
-        # Get project data
-        project = self.memory.search_project(project_name)
-        if not project:
-            project = {"name": project_name, "status": "לא נמצא במערכת"}
+        project, open_issues, payment_status = self._load_project(project_name)
 
-        # Get history and issues
-        open_issues = self.memory.get_open_issues(project_name)
-        payment_status = self.memory.get_payment_status(project_name)
+        # Nothing for the LLM to judge - the local template says it all
+        if not self._needs_llm(project_name, project, open_issues):
+            print(f"[PREP] {project_name}: no open issues or unknown project - skipping LLM")
+            document = self._render_document(project_name, project, open_issues, payment_status)
+        else:
+            document = self._llm_document(project_name, participants, project, open_issues, payment_status)
 
-        # Format project data
-        project_data = json.dumps(project, ensure_ascii=False, indent=2)
+        if on_chunk:
+            on_chunk(document)
+        return self._assemble_prep(project_name, project, open_issues, document, meeting_time)
 
-        # Build prompt
-        prompt = MEETING_PREP_PROMPT.format(
-            participants=", ".join(participants) if participants else "לא צוינו",
-            project_name=project_name,
-            project_data=project_data
+    def _llm_document(
+        self,
+        project_name: str,
+        participants: List[str],
+        project: Dict[str, Any],
+        open_issues: List[str],
+        payment_status: Dict[str, Any]
+    ) -> str:
+        """Cached or freshly generated LLM document; the local template if the LLM fails."""
+        project_data = self.memory.project_json(project_name) or _dumps_project(project)
+
+        # Reuse a recent document for the same project state and participants
+        cache_key = self._prep_cache_key(project_data, participants)
+        revision = self.memory.revision_of(project_name)
+        document = self._get_cached_document(cache_key, revision)
+
+        if document is None:
+            # Build prompt
+            prompt = MEETING_PREP_PROMPT.format(
+                participants=", ".join(participants) if participants else "לא צוינו",
+                project_name=project_name,
+                project_data=project_data
+            )
+
+            # Call LLM
+            try:
+                from services.ai_engine import ask_ai
+                response = ask_ai(
+                    prompt=prompt,
+                    provider="gemini",  # Using Gemini for speed
+                    temperature=0.3
+                )
+                document = self._document_from_response(
+                    response, project_name, project, open_issues, payment_status
+                )
+                self._store_document(cache_key, revision, document)
+            except Exception as e:
+                print(f"[PREP] LLM failed: {e}")
+                document = self._render_document(project_name, project, open_issues, payment_status)
+
+        return document
+
+    def _needs_llm(self, project_name: str, project: Dict[str, Any], open_issues: List[str]) -> bool:
+        """A known project with open issues or unpaid payments is worth an LLM call."""
+        return bool(project.get("project_id")) and bool(
+            open_issues or self.memory.get_unpaid_payments(project_name)
         )
 
-        # Call LLM
-        try:
-            from services.ai_engine import ask_ai
-            document = ask_ai(
-                prompt=prompt,
-                provider="gemini",  # Using Gemini for speed
-                temperature=0.3
+    async def generate_async(self, **kwargs) -> Dict[str, Any]:
+        """Run generate() in a worker thread so the event loop stays free during the LLM call."""
+        return await asyncio.to_thread(self.generate, **kwargs)
+
+    async def generate_many(self, meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate preparation documents for several meetings concurrently.
+
+        Args:
+            meetings: Dicts with the keyword arguments of generate()
+
+        Returns:
+            One prep dict per meeting, in input order
+        """
+        return list(await asyncio.gather(*(self.generate_async(**m) for m in meetings)))
+
+    def generate_batch(
+        self,
+        meetings: List[Dict[str, Any]],
+        batch_size: int = PREP_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate preparation documents for several meetings.
+
+        Packs up to batch_size meetings into one LLM prompt. Meetings that
+        need no LLM or have a cached document are rendered directly, and a
+        batch whose response cannot be split back into per-meeting documents
+        falls back to one generate() call per meeting. Every meeting's
+        on_chunk receives its whole document once, as with generate().
+
+        Args:
+            meetings: Dicts with the keyword arguments of generate()
+            batch_size: Maximum meetings per LLM call
+
+        Returns:
+            One prep dict per meeting, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(meetings)
+        pending = []
+
+        for index, m in enumerate(meetings):
+            loaded = self._load_project(m["project_name"])
+            needs_llm = self._needs_llm(m["project_name"], loaded[0], loaded[1])
+            if needs_llm and not self._has_cached_document(m, loaded[0]):
+                pending.append((index, m, loaded))
+            else:
+                results[index] = self.generate(**m)
+
+        for start in range(0, len(pending), batch_size):
+            indices, batch, loaded = zip(*pending[start:start + batch_size])
+            if len(batch) == 1:
+                results[indices[0]] = self.generate(**batch[0])
+                continue
+
+            prompt = MEETING_PREP_BATCH_PROMPT.format(
+                count=len(batch),
+                meetings="\n\n".join(
+                    MEETING_PREP_BATCH_ITEM.format(
+                        index=i,
+                        participants=", ".join(m["participants"]) if m["participants"] else "לא צוינו",
+                        project_name=m["project_name"],
+                        project_data=self.memory.project_json(m["project_name"]) or _dumps_project(project)
+                    )
+                    for i, (m, (project, _, _)) in enumerate(zip(batch, loaded), start=1)
+                )
             )
-        except Exception as e:
-            print(f"[PREP] LLM failed: {e}")
-            document = self._generate_mock_document(project_name, project, open_issues, payment_status)
 
+            try:
+                from services.ai_engine import ask_ai
+                response = ask_ai(prompt=prompt, provider="gemini", temperature=0.3)
+                answers = _split_batch_response(response, len(batch))
+            except Exception as e:
+                print(f"[PREP] Batch LLM failed, preparing meetings one by one: {e}")
+                for index, m in zip(indices, batch):
+                    results[index] = self.generate(**m)
+                continue
+
+            for index, m, (project, open_issues, payment_status), answer in zip(indices, batch, loaded, answers):
+                document = self._document_from_response(
+                    answer, m["project_name"], project, open_issues, payment_status
+                )
+                self._store_document(
+                    self._meeting_cache_key(m, project), self.memory.revision_of(m["project_name"]), document
+                )
+                if m.get("on_chunk"):
+                    m["on_chunk"](document)
+                results[index] = self._assemble_prep(
+                    m["project_name"], project, open_issues, document, m["meeting_time"]
+                )
+
+        return results
+
+    @staticmethod
+    def merge_preps(preps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Combine single-project preps into one prep for a multi-project meeting.
+
+        Documents are joined with a separator, findings and payment issues are
+        unioned in order, and action items are concatenated.
+        """
+        return {
+            "document": "\n---\n".join(p["document"] for p in preps),
+            "critical_findings": list(dict.fromkeys(f for p in preps for f in p["critical_findings"])),
+            "payment_issues": list(dict.fromkeys(i for p in preps for i in p["payment_issues"])),
+            "action_items": [item for p in preps for item in p["action_items"]],
+            "project": preps[0]["project"] if preps else {},
+            "projects": [p["project"] for p in preps]
+        }
+
+    @staticmethod
+    def _prep_cache_key(project_data: str, participants: List[str]) -> str:
+        """Hash the serialized project state together with the participants."""
+        payload = project_data + "|" + "|".join(sorted(participants or []))
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _meeting_cache_key(self, meeting: Dict[str, Any], project: Dict[str, Any]) -> str:
+        """Prep cache key for a generate() keyword dict."""
+        project_data = self.memory.project_json(meeting["project_name"]) or _dumps_project(project)
+        return self._prep_cache_key(project_data, meeting["participants"])
+
+    def _has_cached_document(self, meeting: Dict[str, Any], project: Dict[str, Any]) -> bool:
+        """Check whether generate() would be served from the prep cache."""
+        cache_key = self._meeting_cache_key(meeting, project)
+        return self._get_cached_document(cache_key, self.memory.revision_of(meeting["project_name"])) is not None
+
+    def _get_cached_document(self, cache_key: str, revision: int) -> Optional[str]:
+        """Return a cached LLM document if it is fresh and no project activity was logged since."""
+        with self._prep_cache_lock:
+            entry = self._prep_cache.get(cache_key)
+            if entry is None:
+                return None
+
+            created, cached_revision, document = entry
+            if cached_revision != revision or time.monotonic() - created > PREP_CACHE_TTL_SEC:
+                del self._prep_cache[cache_key]
+                return None
+
+            self._prep_cache.move_to_end(cache_key)
+            return document
+
+    def _store_document(self, cache_key: str, revision: int, document: str) -> None:
+        """Cache an LLM document, evicting the least recently used entry when full."""
+        with self._prep_cache_lock:
+            self._prep_cache[cache_key] = (time.monotonic(), revision, document)
+            self._prep_cache.move_to_end(cache_key)
+            while len(self._prep_cache) > PREP_CACHE_MAX_ENTRIES:
+                self._prep_cache.popitem(last=False)
+
+    def _load_project(self, project_name: str) -> Tuple[Dict[str, Any], List[str], Dict[str, Any]]:
+        """Fetch project data, open issues and payment status from memory."""
+        project = self.memory.get_project(project_name) or self.memory.search_project(project_name)
+        if not project:
+            project = {"name": project_name, "status": "לא נמצא במערכת"}
+
+        open_issues = self.memory.get_open_issues(project_name)
+        payment_status = self.memory.get_payment_status(project_name)
+
+        return project, open_issues, payment_status
+
+    def _assemble_prep(
+        self,
+        project_name: str,
+        project: Dict[str, Any],
+        open_issues: List[str],
+        document: str,
+        meeting_time: datetime
+    ) -> Dict[str, Any]:
+        """Combine the prep document with findings, payments and action items."""
         # Extract critical findings
         critical_findings = open_issues[:3] if open_issues else []
 
         # Extract payment issues
-        payment_issues = []
-        for name, status in payment_status.items():
-            if isinstance(status, dict) and not status.get("paid", True):
-                amount = status.get("amount", 0)
-                deadline = status.get("deadline", "לא צוין")
-                payment_issues.append(f"{name}: {amount:,} ₪ - תאריך יעד: {deadline}")
+        payment_issues = [
+            f"{name}: {amount:,} ₪ - תאריך יעד: {deadline or 'לא צוין'}"
+            for name, amount, deadline in self.memory.get_unpaid_payments(project_name)
+        ]
 
         # Generate action items
         action_items = self._generate_action_items(project, open_issues, meeting_time)
@@ -385,22 +895,50 @@ class MeetingPrepGenerator:
             "project": project
         }
 
-    def _generate_mock_document(
+    def _document_from_response(
         self,
+        response: str,
         project_name: str,
         project: Dict,
         open_issues: List[str],
         payment_status: Dict
     ) -> str:
-        """Generate mock document when LLM unavailable."""
-        issues_text = "\n".join(f"   • {issue}" for issue in open_issues) if open_issues else "   • אין ליקויים פתוחים"
+        """Render the LLM's JSON answer; free text that is not JSON is kept as-is."""
+        try:
+            sections = _parse_prep_sections(response)
+        except ValueError as e:
+            print(f"[PREP] LLM answer is not JSON, using it verbatim: {e}")
+            return response.strip()
+
+        return self._render_document(project_name, project, open_issues, payment_status, sections)
+
+    def _render_document(
+        self,
+        project_name: str,
+        project: Dict,
+        open_issues: List[str],
+        payment_status: Dict,
+        sections: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Render the 8-line prep document.
 
-        payment_text = ""
-        for name, status in payment_status.items():
-            if isinstance(status, dict):
-                paid = "שולם" if status.get("paid") else "טרם שולם"
-                amount = status.get("amount", 0)
-                payment_text += f"   • {name}: {amount:,} ₪ - {paid}\n"
+        Sections 1, 4, 6 and 7 come from the LLM's JSON answer when given,
+        otherwise from local defaults (used when the LLM is unavailable).
+        """
+        sections = {**_DEFAULT_PREP_SECTIONS, **{k: v for k, v in (sections or {}).items() if v}}
+        issues_text = "\n".join([f"   • {issue}" for issue in open_issues]) if open_issues else "   • אין ליקויים פתוחים"
+
+        risk_lines = [
+            f"   • {name}: {status.get('amount', 0):,} ₪ - {'שולם' if status.get('paid') else 'טרם שולם'}\n"
+            for name, status in payment_status.items()
+            if isinstance(status, dict)
+        ]
+        risk_lines += [f"   • {risk}\n" for risk in _bullets(sections["risks"])]
+        payment_text = "".join(risk_lines)
+
+        wants_text = "\n".join([f"   • {item}" for item in _bullets(sections["wants"])])
+        concessions_text = "\n".join([f"   • {item}" for item in _bullets(sections["concessions"])])
 
         return f"""
 ═══════════════════════════════════════════════════════════════
@@ -410,7 +948,7 @@ class MeetingPrepGenerator:
 ═══════════════════════════════════════════════════════════════
 
 1. מטרת הפגישה:
-   סקירת התקדמות הפרויקט וסגירת סוגיות פתוחות
+   {sections['goal']}
 
 2. רקע עדכני:
    סטטוס: {project.get('status', 'לא ידוע')}
@@ -429,13 +967,10 @@ class MeetingPrepGenerator:
    • אישור כב"א: {project.get('regulatory', {}).get('fire_dept_approval', 'נדרש')}
 
 6. מה אנחנו רוצים להשיג:
-   • אישור להמשך עבודות
-   • סגירת ליקויים פתוחים
-   • קביעת לו"ז לתשלומים
+{wants_text}
 
 7. מה אנחנו מוכנים לוותר:
-   • דחיית תשלום דמי הקמה עד 30 יום
-   • גמישות בלו"ז תיקון ליקויים
+{concessions_text}
 
 8. Action Items מומלצים:
    • לסגור ליקויים עד שבוע מהפגישה
@@ -467,14 +1002,12 @@ class MeetingPrepGenerator:
             })
 
         # Payment action items
-        payment_status = project.get("payment_status", {})
-        for name, status in payment_status.items():
-            if isinstance(status, dict) and not status.get("paid", True):
-                items.append({
-                    "action": f"תשלום {name}: {status.get('amount', 0):,} ₪",
-                    "deadline": status.get("deadline", "בהקדם"),
-                    "priority": "high"
-                })
+        for name, amount, deadline in self.memory.get_unpaid_payments(project["name"]):
+            items.append({
+                "action": f"תשלום {name}: {amount:,} ₪",
+                "deadline": deadline or "בהקדם",
+                "priority": "high"
+            })
 
         return items
 
@@ -483,6 +1016,20 @@ class MeetingPrepGenerator:
 # CALENDAR INTEGRATION
 # =============================================================================
 
+# Upper bound on calendar meetings prepared in parallel
+MEETING_WORKERS = 8
+
+# Process-wide pool for per-meeting tracking and notifications
+_MEETING_POOL = ThreadPoolExecutor(max_workers=MEETING_WORKERS, thread_name_prefix="vse-meeting")
+atexit.register(_MEETING_POOL.shutdown, wait=False)
+
+# Repeat polls within this window reuse the last calendar fetch
+CALENDAR_CACHE_TTL_SEC = 60
+
+# Known project patterns, unioned so an event is scanned once
+_PROJECT_NAME_RE = re.compile(r"ארלוזורוב\s*\d+|קניון\s+\w+|פרויקט\s+[\w\s]+")
+
+
 class CalendarIntegration:
     """
     Google Calendar integration for meeting triggers.
@@ -490,10 +1037,22 @@ class CalendarIntegration:
 
     def __init__(self):
         self.oauth_token = secrets.google_calendar_oauth
+        self._events_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
 
     def get_upcoming_meetings(self, hours_ahead: int = 24) -> List[Dict[str, Any]]:
-        """Get upcoming meetings from calendar."""
-        # In production, would use Google Calendar API
+        """Get upcoming meetings from calendar (cached for CALENDAR_CACHE_TTL_SEC)."""
+        cached = self._events_cache.get(hours_ahead)
+        if cached and time.monotonic() - cached[0] < CALENDAR_CACHE_TTL_SEC:
+            return cached[1]
+
+        meetings = self._fetch_meetings(hours_ahead)
+        self._events_cache[hours_ahead] = (time.monotonic(), meetings)
+        return meetings
+
+    def _fetch_meetings(self, hours_ahead: int) -> List[Dict[str, Any]]:
+        """Fetch upcoming meetings from the calendar provider."""
+        # In production, would use Google Calendar API with its syncToken,
+        # so a refresh after the cache expires only downloads changed events
         # For now, return mock data
 
         now = datetime.now()
@@ -530,19 +1089,8 @@ class CalendarIntegration:
         title = event.get("title", "")
         location = event.get("location", "")
 
-        # Known project patterns
-        patterns = [
-            r"ארלוזורוב\s*\d+",
-            r"קניון\s+\w+",
-            r"פרויקט\s+[\w\s]+",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, title + " " + location)
-            if match:
-                return match.group()
-
-        return None
+        match = _PROJECT_NAME_RE.search(f"{title} {location}")
+        return match.group() if match else None
 
     def create_reminder(
         self,
@@ -559,6 +1107,16 @@ class CalendarIntegration:
 # NOTIFICATION HUB
 # =============================================================================
 
+# Per-notification budget; slower channels are reported as failed
+NOTIFY_TIMEOUT_SEC = 10
+NOTIFY_WORKERS = 32
+
+# Process-wide pool for channel fan-out (separate from the meeting pool, whose
+# tasks wait on these - sharing one pool could deadlock when it is saturated)
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=NOTIFY_WORKERS, thread_name_prefix="vse-notify")
+atexit.register(_NOTIFY_POOL.shutdown, wait=False)
+
+
 class NotificationHub:
     """
     Multi-channel notification system.
@@ -574,29 +1132,52 @@ class NotificationHub:
         meeting_title: str,
         channels: List[str] = None
     ) -> Dict[str, bool]:
-        """Send meeting prep via multiple channels."""
+        """Send meeting prep via multiple channels (sent concurrently)."""
         channels = channels or ["command_center", "email"]
-        results = {}
+        senders = {
+            "whatsapp": lambda: self._send_whatsapp(
+                f"🗓️ הכנה לפגישה: {meeting_title}\n\n{prep_document[:500]}..."
+            ),
+            "email": lambda: self._send_email(
+                subject=f"מסמך הכנה לפגישה - {meeting_title}",
+                body=prep_document
+            ),
+            "command_center": lambda: self._notify_command_center(
+                title=f"📋 הכנה לפגישה: {meeting_title}",
+                message=prep_document,
+                type="meeting_prep"
+            ),
+        }
+        jobs = {channel: senders[channel] for channel in channels if channel in senders}
+        if not jobs:
+            return {}
 
-        for channel in channels:
-            if channel == "whatsapp":
-                results["whatsapp"] = self._send_whatsapp(
-                    f"🗓️ הכנה לפגישה: {meeting_title}\n\n{prep_document[:500]}..."
-                )
-            elif channel == "email":
-                results["email"] = self._send_email(
-                    subject=f"מסמך הכנה לפגישה - {meeting_title}",
-                    body=prep_document
-                )
-            elif channel == "command_center":
-                results["command_center"] = self._notify_command_center(
-                    title=f"📋 הכנה לפגישה: {meeting_title}",
-                    message=prep_document,
-                    type="meeting_prep"
-                )
+        futures = {channel: _NOTIFY_POOL.submit(send) for channel, send in jobs.items()}
+        wait(futures.values(), timeout=NOTIFY_TIMEOUT_SEC)  # Don't block on a channel that timed out
+
+        # A failing or slow channel must not hide the others
+        results = {}
+        for channel, future in futures.items():
+            if not future.done():
+                print(f"[NOTIFY] {channel} timed out after {NOTIFY_TIMEOUT_SEC}s")
+                results[channel] = False
+                continue
+            try:
+                results[channel] = future.result()
+            except Exception as e:
+                print(f"[NOTIFY] {channel} failed: {e}")
+                results[channel] = False
 
         return results
 
+    def push_partial(self, meeting_title: str, chunk: str) -> bool:
+        """Push a meeting prep document to the Command Center as soon as it is ready."""
+        return self._notify_command_center(
+            title=f"📋 הכנה לפגישה: {meeting_title}",
+            message=chunk,
+            type="meeting_prep_partial"
+        )
+
     def send_declaration_alert(
         self,
         project_name: str,
@@ -661,7 +1242,11 @@ class ActionItemsTracker:
 
     def __init__(self, memory: ProjectMemory):
         self.memory = memory
-        self._items: List[Dict[str, Any]] = []
+        self._items: Dict[str, Dict[str, Any]] = {}
+        # Insertion-ordered id sets (dict keys) for open items, overall and per project
+        self._open_ids: Dict[str, None] = {}
+        self._by_project: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._lock = threading.Lock()  # Calendar meetings are processed in parallel
 
     def add_item(
         self,
@@ -669,10 +1254,13 @@ class ActionItemsTracker:
         action: str,
         deadline: str,
         priority: str = "medium",
-        assigned_to: str = None
+        assigned_to: str = None,
+        created_at: str = None
     ) -> str:
         """Add new action item."""
-        item_id = hashlib.md5(f"{project_name}{action}{datetime.now()}".encode()).hexdigest()[:8]
+        item_id = hashlib.blake2b(
+            f"{project_name}{action}{time.monotonic_ns()}".encode(), digest_size=4
+        ).hexdigest()
 
         item = {
             "id": item_id,
@@ -682,35 +1270,59 @@ class ActionItemsTracker:
             "priority": priority,
             "assigned_to": assigned_to or "נימרוד עופר",
             "status": "open",
-            "created_at": datetime.now().isoformat()
+            "created_at": created_at or datetime.now().isoformat()
         }
 
-        self._items.append(item)
+        with self._lock:
+            self._items[item_id] = item
+            self._open_ids[item_id] = None
+            self._by_project[project_name][item_id] = None
         self.memory.add_action_item(project_name, action, deadline, priority)
 
         return item_id
 
+    def add_items_bulk(self, project_name: str, items: List[Dict[str, Any]]) -> List[str]:
+        """Add several action items (dicts with action/deadline/priority) sharing one timestamp."""
+        created_at = datetime.now().isoformat()
+        return [
+            self.add_item(
+                project_name=project_name,
+                action=item["action"],
+                deadline=item["deadline"],
+                priority=item.get("priority", "medium"),
+                created_at=created_at
+            )
+            for item in items
+        ]
+
     def get_pending_items(self, project_name: str = None) -> List[Dict[str, Any]]:
         """Get pending action items."""
-        items = [i for i in self._items if i["status"] == "open"]
-        if project_name:
-            items = [i for i in items if i["project"] == project_name]
-        return items
+        with self._lock:
+            if project_name:
+                ids = self._by_project.get(project_name, {})
+                return [self._items[i] for i in ids if i in self._open_ids]
+            return [self._items[i] for i in self._open_ids]
 
     def complete_item(self, item_id: str) -> bool:
         """Mark action item as complete."""
-        for item in self._items:
-            if item["id"] == item_id:
-                item["status"] = "completed"
-                item["completed_at"] = datetime.now().isoformat()
-                return True
-        return False
+        with self._lock:
+            if item_id not in self._open_ids:
+                return item_id in self._items
+            del self._open_ids[item_id]
+            item = self._items[item_id]
+
+        item["status"] = "completed"
+        item["completed_at"] = datetime.now().isoformat()
+        return True
 
 
 # =============================================================================
 # DECLARATION HANDLER (Enhanced from Skill #501)
 # =============================================================================
 
+DECLARATION_CACHE_TTL_SEC = 3600
+DECLARATION_CACHE_MAX_ENTRIES = 256
+
 class EnhancedDeclarationHandler:
     """
     Enhanced declaration handler with project history integration.
@@ -719,6 +1331,9 @@ class EnhancedDeclarationHandler:
     def __init__(self, memory: ProjectMemory, notifications: NotificationHub):
         self.memory = memory
         self.notifications = notifications
+        # key -> (created, project revision, (analysis, auto_approve, reason)), least recently used first
+        self._analysis_cache: "OrderedDict[str, Tuple[float, int, Tuple[Dict[str, Any], bool, str]]]" = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
 
     def analyze_with_history(
         self,
@@ -729,11 +1344,39 @@ class EnhancedDeclarationHandler:
         """
         Analyze declaration with full project history.
 
+        Duplicate emails (retries, forwards) reuse the previous result until
+        activity is logged for the project or the entry expires.
+
         Returns:
             (analysis_result, auto_approve, reason)
         """
+        cache_key = hashlib.blake2b(
+            "\0".join((project_name, email_body, attachment_content)).encode(), digest_size=16
+        ).hexdigest()
+        revision = self.memory.revision_of(project_name)
+
+        with self._analysis_cache_lock:
+            entry = self._analysis_cache.get(cache_key)
+            if entry is not None:
+                created, cached_revision, result = entry
+                if cached_revision == revision and time.monotonic() - created <= DECLARATION_CACHE_TTL_SEC:
+                    self._analysis_cache.move_to_end(cache_key)
+                    return result
+                self._analysis_cache.pop(cache_key, None)
+
+        result = self._analyze_uncached(project_name)
+
+        with self._analysis_cache_lock:
+            self._analysis_cache[cache_key] = (time.monotonic(), revision, result)
+            self._analysis_cache.move_to_end(cache_key)
+            while len(self._analysis_cache) > DECLARATION_CACHE_MAX_ENTRIES:
+                self._analysis_cache.popitem(last=False)
+        return result
+
+    def _analyze_uncached(self, project_name: str) -> Tuple[Dict[str, Any], bool, str]:
+        """Run the history checks for a project."""
         # Get project history
-        project = self.memory.search_project(project_name)
+        project = self.memory.get_project(project_name) or self.memory.search_project(project_name)
         open_issues = self.memory.get_open_issues(project_name)
         payment_status = self.memory.get_payment_status(project_name)
 
@@ -741,12 +1384,11 @@ class EnhancedDeclarationHandler:
         blocking_issues = []
 
         # Check payment status
-        for name, status in payment_status.items():
-            if isinstance(status, dict) and not status.get("paid", True):
-                blocking_issues.append(f"תשלום {name} טרם בוצע")
+        for name, _, _ in self.memory.get_unpaid_payments(project_name):
+            blocking_issues.append(f"תשלום {name} טרם בוצע")
 
         # Check open issues
-        critical_issues = [i for i in open_issues if "חסר" in i or "ברז" in i]
+        critical_issues = self.memory.get_blocking_issues(project_name)
         if critical_issues:
             blocking_issues.extend(critical_issues[:2])
 
@@ -774,6 +1416,46 @@ class EnhancedDeclarationHandler:
         return analysis, auto_approve, reason
 
 
+# =============================================================================
+# COMMAND PARSING
+# =============================================================================
+
+# Chat intent keywords, in priority order - an earlier intent wins wherever it appears
+INTENT_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "meeting": ("פגישה",),
+    "declaration": ("תצהיר", "קיבלתי"),
+}
+
+
+def _compile_intents(keywords: Mapping[str, Tuple[str, ...]]) -> re.Pattern:
+    """
+    Compile intent keywords into one pattern - branch on match.lastgroup.
+
+    Each intent is a lookahead anchored at the start, tried in priority order.
+    """
+    lookaheads = (
+        f"(?=.*?(?P<{intent}>{'|'.join(map(re.escape, words))}))" for intent, words in keywords.items()
+    )
+    return re.compile("^(?:" + "|".join(lookaheads) + ")", re.DOTALL)
+
+
+_INTENT_RE = _compile_intents(INTENT_KEYWORDS)
+
+
+@lru_cache(maxsize=1024)
+def _extract_project_cached(command: str, known_projects: Tuple[str, ...]) -> Optional[str]:
+    """Extract a project name from a chat command (memoized - commands repeat)."""
+    # Known projects (one scan for all names)
+    pattern, by_lower = _project_matcher(known_projects)
+    match = pattern.search(command.lower())
+    if match:
+        return by_lower[match.group()]
+
+    # Patterns (shared with calendar event parsing)
+    match = _PROJECT_NAME_RE.search(command)
+    return match.group() if match else None
+
+
 # =============================================================================
 # SKILL #601 - VIRTUAL SENIOR ENGINEER
 # =============================================================================
@@ -798,6 +1480,10 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
         self.prep_generator = MeetingPrepGenerator(self.memory)
         self.action_tracker = ActionItemsTracker(self.memory)
         self.declaration_handler = EnhancedDeclarationHandler(self.memory, self.notifications)
+        self._chat_handlers: Dict[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]] = {
+            "meeting": self._chat_meeting,
+            "declaration": self._chat_declaration,
+        }
 
     @property
     def metadata(self) -> SkillMetadata:
@@ -853,7 +1539,7 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
 
     def execute(self, inputs: Dict[str, Any]) -> ExecutionResult:
         """Execute the Virtual Senior Engineer."""
-        start_time = datetime.now()
+        start = time.monotonic()
         trigger_type = inputs.get("trigger_type", "chat")
 
         try:
@@ -866,7 +1552,7 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
             else:  # chat
                 result = self._handle_chat_command(inputs)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.monotonic() - start
             result["duration_seconds"] = round(duration, 1)
 
             return ExecutionResult(
@@ -885,6 +1571,16 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
                 error=str(e)
             )
 
+    async def execute_async(self, inputs: Dict[str, Any]) -> ExecutionResult:
+        """
+        Execute from an event loop without blocking it.
+
+        The LLM, calendar and notification clients are synchronous, so the
+        whole run is moved to a worker thread - the meeting fan-out inside
+        it already runs on a thread pool.
+        """
+        return await asyncio.to_thread(self.execute, inputs)
+
     def _handle_calendar_trigger(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Handle calendar event trigger."""
         # Get upcoming meetings
@@ -893,52 +1589,63 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
         if not meetings:
             return {"message": "אין פגישות קרובות", "meetings": []}
 
-        results = []
-        for meeting in meetings:
-            project_name = self.calendar.extract_project_from_event(meeting)
-            if not project_name:
-                continue
+        # Prep all meetings together so the LLM sees them in as few calls as possible
+        projects = [self.calendar.extract_project_from_event(meeting) for meeting in meetings]
+        matched = [(meeting, name) for meeting, name in zip(meetings, projects) if name]
+        preps = self.prep_generator.generate_batch([
+            {
+                "project_name": project_name,
+                "meeting_title": meeting.get("title", ""),
+                "participants": meeting.get("participants", []),
+                "meeting_time": datetime.fromisoformat(meeting["start"]),
+                # Push each prep to the Command Center when ready (bind the title per meeting)
+                "on_chunk": lambda chunk, title=meeting.get("title", ""): self.notifications.push_partial(title, chunk),
+            }
+            for meeting, project_name in matched
+        ])
 
-            # Generate meeting prep
-            prep = self.prep_generator.generate(
-                project_name=project_name,
-                meeting_title=meeting.get("title", ""),
-                participants=meeting.get("participants", []),
-                meeting_time=datetime.fromisoformat(meeting["start"])
-            )
+        # Tracking and notifications are independent per meeting and I/O-bound
+        results = list(_MEETING_POOL.map(
+            lambda args: self._process_meeting(*args, inputs),
+            [(meeting, project_name, prep) for (meeting, project_name), prep in zip(matched, preps)]
+        ))
 
-            # Add action items
-            for item in prep["action_items"]:
-                self.action_tracker.add_item(
-                    project_name=project_name,
-                    action=item["action"],
-                    deadline=item["deadline"],
-                    priority=item["priority"]
-                )
+        return {
+            "message": f"הוכנו {len(results)} מסמכי הכנה לפגישות",
+            "meetings_prepared": results
+        }
 
-            # Send notifications
-            channels = ["command_center", "email"]
-            if inputs.get("send_whatsapp"):
-                channels.append("whatsapp")
+    def _process_meeting(
+        self,
+        meeting: Dict[str, Any],
+        project_name: str,
+        prep: Dict[str, Any],
+        inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Track and notify a single prepared calendar meeting."""
+        title = meeting.get("title", "")
 
-            self.notifications.send_meeting_prep(
-                prep_document=prep["document"],
-                meeting_title=meeting.get("title", ""),
-                channels=channels
-            )
+        # Add action items
+        self.action_tracker.add_items_bulk(project_name, prep["action_items"])
 
-            results.append({
-                "meeting": meeting["title"],
-                "project": project_name,
-                "document": prep["document"],
-                "critical_findings": prep["critical_findings"],
-                "payment_issues": prep["payment_issues"],
-                "action_items": prep["action_items"]
-            })
+        # Send notifications
+        channels = ["command_center", "email"]
+        if inputs.get("send_whatsapp"):
+            channels.append("whatsapp")
+
+        self.notifications.send_meeting_prep(
+            prep_document=prep["document"],
+            meeting_title=title,
+            channels=channels
+        )
 
         return {
-            "message": f"הוכנו {len(results)} מסמכי הכנה לפגישות",
-            "meetings_prepared": results
+            "meeting": meeting["title"],
+            "project": project_name,
+            "document": prep["document"],
+            "critical_findings": prep["critical_findings"],
+            "payment_issues": prep["payment_issues"],
+            "action_items": prep["action_items"]
         }
 
     def _handle_email_trigger(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -995,7 +1702,29 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
         command = inputs.get("command", "").lower()
 
         # Detect intent
-        if "פגישה" in command:
+        match = _INTENT_RE.search(command)
+        handler = self._chat_handlers.get(match.lastgroup if match else None, self._chat_help)
+
+        return handler(command, inputs)
+
+    def _chat_meeting(self, command: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare a meeting document from a chat command."""
+        meeting_time = datetime.now() + timedelta(hours=1)
+
+        # Several known projects - prep each (cached preps are reused) and merge
+        projects = self.memory.find_projects(command)
+        if len(projects) > 1:
+            project_name = ", ".join(projects)
+            prep = self.prep_generator.merge_preps(self.prep_generator.generate_batch([
+                {
+                    "project_name": name,
+                    "meeting_title": f"פגישה - {name}",
+                    "participants": [],
+                    "meeting_time": meeting_time
+                }
+                for name in projects
+            ]))
+        else:
             # Extract project name
             project_name = self._extract_project_from_command(command)
             if not project_name:
@@ -1006,14 +1735,14 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
                 project_name=project_name,
                 meeting_title=f"פגישה - {project_name}",
                 participants=[],
-                meeting_time=datetime.now() + timedelta(hours=1)
+                meeting_time=meeting_time
             )
 
-            # Build response
-            issues_text = ", ".join(prep["critical_findings"]) if prep["critical_findings"] else "אין"
-            payment_text = ", ".join(prep["payment_issues"]) if prep["payment_issues"] else "אין"
+        # Build response
+        issues_text = ", ".join(prep["critical_findings"]) if prep["critical_findings"] else "אין"
+        payment_text = ", ".join(prep["payment_issues"]) if prep["payment_issues"] else "אין"
 
-            message = f"""קלטתי.
+        message = f"""קלטתי.
 הכנתי לך מסמך הכנה של 8 שורות בדיוק
 
 נמצאו ממצאים: {issues_text}
@@ -1022,29 +1751,29 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
 מסמך מצורף + התראה ביומן
 רוצה שאשלח גם בוואטסאפ?"""
 
-            return {
-                "message": message,
-                "document": prep["document"],
-                "project": project_name,
-                "findings": prep["critical_findings"],
-                "payments": prep["payment_issues"],
-                "action_items": prep["action_items"]
-            }
+        return {
+            "message": message,
+            "document": prep["document"],
+            "project": project_name,
+            "findings": prep["critical_findings"],
+            "payments": prep["payment_issues"],
+            "action_items": prep["action_items"]
+        }
 
-        elif "תצהיר" in command or "קיבלתי" in command:
-            # Declaration received
-            project_name = self._extract_project_from_command(command)
-            if not project_name:
-                project_name = inputs.get("project_name", "ארלוזורוב 20")
+    def _chat_declaration(self, command: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a received declaration mentioned in chat."""
+        project_name = self._extract_project_from_command(command)
+        if not project_name:
+            project_name = inputs.get("project_name", "ארלוזורוב 20")
 
-            return self._handle_email_trigger({**inputs, "project_name": project_name})
+        return self._handle_email_trigger({**inputs, "project_name": project_name})
 
-        else:
-            # General query
-            return {
-                "message": "אני כאן 24/7. איך אפשר לעזור?\n• אמור 'פגישה' + שם פרויקט להכנת מסמך\n• אמור 'תצהיר' + שם פרויקט לחתימה",
-                "available_projects": list(self.memory._mock_data.keys())
-            }
+    def _chat_help(self, command: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a general query with the available commands."""
+        return {
+            "message": "אני כאן 24/7. איך אפשר לעזור?\n• אמור 'פגישה' + שם פרויקט להכנת מסמך\n• אמור 'תצהיר' + שם פרויקט לחתימה",
+            "available_projects": list(self.memory.projects())
+        }
 
     def _run_full_demo(self) -> Dict[str, Any]:
         """Run full demonstration of all capabilities."""
@@ -1053,31 +1782,27 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
             "steps": []
         }
 
-        # Step 1: Calendar trigger
-        calendar_result = self._handle_calendar_trigger({"send_whatsapp": False})
-        results["steps"].append({
-            "name": "Calendar Trigger",
-            "result": calendar_result
-        })
-
-        # Step 2: Email trigger (auto-approve)
-        email_result_ok = self._handle_email_trigger({
-            "project_name": "ארלוזורוב 20",
-            "command": "תצהיר מתכנן לגמר"
-        })
-        results["steps"].append({
-            "name": "Email Trigger (Clean Project)",
-            "result": email_result_ok
-        })
-
-        # Step 3: Chat command
-        chat_result = self._handle_chat_command({
-            "command": "יש לי פגישה מחר עם עיריית תל אביב על קניון נופים"
-        })
-        results["steps"].append({
-            "name": "Chat Command",
-            "result": chat_result
-        })
+        # The steps touch different projects and are I/O-bound - run them together
+        steps = [
+            # Step 1: Calendar trigger
+            ("Calendar Trigger", self._handle_calendar_trigger, {"send_whatsapp": False}),
+            # Step 2: Email trigger (auto-approve)
+            ("Email Trigger (Clean Project)", self._handle_email_trigger, {
+                "project_name": "ארלוזורוב 20",
+                "command": "תצהיר מתכנן לגמר"
+            }),
+            # Step 3: Chat command
+            ("Chat Command", self._handle_chat_command, {
+                "command": "יש לי פגישה מחר עם עיריית תל אביב על קניון נופים"
+            }),
+        ]
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            futures = [(name, pool.submit(handler, step_inputs)) for name, handler, step_inputs in steps]
+            for name, future in futures:
+                results["steps"].append({
+                    "name": name,
+                    "result": future.result()
+                })
 
         results["demo_completed"] = datetime.now().isoformat()
         results["message"] = "הדגמה מלאה הושלמה - כל היכולות נבדקו"
@@ -1086,24 +1811,7 @@ class Skill_VirtualSeniorEngineer(AquaSkill):
 
     def _extract_project_from_command(self, command: str) -> Optional[str]:
         """Extract project name from natural language command."""
-        # Known projects
-        for project_name in self.memory._mock_data.keys():
-            if project_name.lower() in command.lower():
-                return project_name
-
-        # Patterns
-        patterns = [
-            r"(ארלוזורוב\s*\d+)",
-            r"(קניון\s+\w+)",
-            r"(פרויקט\s+[\w\s]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, command)
-            if match:
-                return match.group(1)
-
-        return None
+        return _extract_project_cached(command, self.memory.projects())
 
 
 # =============================================================================
@@ -1120,5 +1828,6 @@ __all__ = [
     "NotificationHub",
     "ActionItemsTracker",
     "EnhancedDeclarationHandler",
-    "MEETING_PREP_PROMPT"
+    "MEETING_PREP_PROMPT",
+    "MEETING_PREP_BATCH_PROMPT"
 ]
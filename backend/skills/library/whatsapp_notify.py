@@ -9,11 +9,11 @@ Supports:
 - CallMeBot (free tier)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import os
-import urllib.request
-import urllib.parse
-import json
+import asyncio
+
+import httpx
 
 from skills.base import (
     AquaSkill,
@@ -28,6 +28,32 @@ from skills.base import (
 )
 
 
+HTTP_TIMEOUT_SEC = 30
+CALLMEBOT_URL = "https://api.callmebot.com/whatsapp.php"
+
+# Shared keep-alive client - repeat sends skip the TCP/TLS handshake
+_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """Get the pooled HTTP client singleton."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=HTTP_TIMEOUT_SEC,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+def _clean_phone(phone: str) -> str:
+    """Normalize a phone number to international format without '+'."""
+    phone = phone.replace("+", "").replace("-", "").replace(" ", "")
+    if phone.startswith("0"):
+        phone = "972" + phone[1:]
+    return phone
+
+
 @register_skill
 class WhatsAppNotifySkill(AquaSkill):
     """
@@ -104,9 +130,7 @@ class WhatsAppNotifySkill(AquaSkill):
         api_key = inputs.get("api_key") or os.environ.get("WHATSAPP_API_KEY", "")
 
         # Clean phone number
-        phone = phone.replace("+", "").replace("-", "").replace(" ", "")
-        if phone.startswith("0"):
-            phone = "972" + phone[1:]
+        phone = _clean_phone(phone)
 
         try:
             if provider == "mock":
@@ -171,22 +195,83 @@ class WhatsAppNotifySkill(AquaSkill):
                 error=str(e),
             )
 
+    async def send_many(
+        self,
+        recipients: List[Dict[str, str]],
+        provider: str = "callmebot",
+        api_key: str = "",
+    ) -> List[Dict[str, Any]]:
+        """
+        Send messages to several recipients concurrently over one connection pool.
+
+        Args:
+            recipients: Dicts with "phone" and "message"
+            provider: "callmebot" or "twilio"
+            api_key: Provider key (or from ENV)
+
+        Returns:
+            Per recipient {"phone", "sent", "response" | "error"}, in input order
+        """
+        api_key = api_key or os.environ.get("WHATSAPP_API_KEY", "")
+        send = {"callmebot": self._send_callmebot_async, "twilio": self._send_twilio_async}.get(provider)
+        if send is None:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT_SEC) as client:
+            phones = [_clean_phone(r["phone"]) for r in recipients]
+            responses = await asyncio.gather(
+                *(send(client, phone, r["message"], api_key) for phone, r in zip(phones, recipients)),
+                return_exceptions=True,
+            )
+
+        return [
+            {"phone": phone, "sent": False, "error": str(response)}
+            if isinstance(response, Exception)
+            else {"phone": phone, "sent": True, "response": response}
+            for phone, response in zip(phones, responses)
+        ]
+
     def _send_callmebot(self, phone: str, message: str, api_key: str) -> Dict[str, Any]:
         """Send via CallMeBot API."""
+        response = get_http_client().get(CALLMEBOT_URL, params=self._callmebot_params(phone, message, api_key))
+        response.raise_for_status()
+        return {"status": response.status_code, "body": response.text}
+
+    async def _send_callmebot_async(
+        self, client: httpx.AsyncClient, phone: str, message: str, api_key: str
+    ) -> Dict[str, Any]:
+        """Send via CallMeBot API (async)."""
+        response = await client.get(CALLMEBOT_URL, params=self._callmebot_params(phone, message, api_key))
+        response.raise_for_status()
+        return {"status": response.status_code, "body": response.text}
+
+    def _callmebot_params(self, phone: str, message: str, api_key: str) -> Dict[str, str]:
+        """Build the CallMeBot query parameters (encoded by httpx)."""
         if not api_key:
             raise ValueError("CallMeBot API key required. Get one at callmebot.com")
 
-        url = (
-            f"https://api.callmebot.com/whatsapp.php?"
-            f"phone={phone}&text={urllib.parse.quote(message)}&apikey={api_key}"
-        )
-
-        req = urllib.request.Request(url)
-        with urllib.request.urlopen(req, timeout=30) as response:
-            return {"status": response.status, "body": response.read().decode()}
+        return {"phone": phone, "text": message, "apikey": api_key}
 
     def _send_twilio(self, phone: str, message: str, api_key: str) -> Dict[str, Any]:
         """Send via Twilio WhatsApp API."""
+        url, data, auth = self._twilio_request(phone, message, api_key)
+        response = get_http_client().post(url, data=data, auth=auth)
+        response.raise_for_status()
+        return response.json()
+
+    async def _send_twilio_async(
+        self, client: httpx.AsyncClient, phone: str, message: str, api_key: str
+    ) -> Dict[str, Any]:
+        """Send via Twilio WhatsApp API (async)."""
+        url, data, auth = self._twilio_request(phone, message, api_key)
+        response = await client.post(url, data=data, auth=auth)
+        response.raise_for_status()
+        return response.json()
+
+    def _twilio_request(
+        self, phone: str, message: str, api_key: str
+    ) -> Tuple[str, Dict[str, str], Tuple[str, str]]:
+        """Build the Twilio Messages URL, form data and basic-auth pair."""
         # api_key format: "ACCOUNT_SID:AUTH_TOKEN:FROM_NUMBER"
         if not api_key:
             api_key = os.environ.get("TWILIO_WHATSAPP_KEY", "")
@@ -202,24 +287,10 @@ class WhatsAppNotifySkill(AquaSkill):
 
         url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
 
-        data = urllib.parse.urlencode({
+        data = {
             "From": f"whatsapp:+{from_number}",
             "To": f"whatsapp:+{phone}",
             "Body": message,
-        }).encode()
-
-        # Create request with basic auth
-        import base64
-        auth = base64.b64encode(f"{account_sid}:{auth_token}".encode()).decode()
-
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={
-                "Authorization": f"Basic {auth}",
-                "Content-Type": "application/x-www-form-urlencoded",
-            },
-        )
+        }
 
-        with urllib.request.urlopen(req, timeout=30) as response:
-            return json.loads(response.read().decode())
+        return url, data, (account_sid, auth_token)
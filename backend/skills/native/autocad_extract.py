@@ -14,22 +14,151 @@ Pipeline:
 
 from __future__ import annotations
 import subprocess
+import asyncio
 import json
+import logging
 import os
 import re
+import math
 import shlex
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Callable, Collection
+from pathlib import Path, PureWindowsPath
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
-def validate_path(path: str, allowed_extensions: Optional[List[str]] = None) -> str:
+logger = logging.getLogger(__name__)
+
+# Skip profile loading and interactive host setup on every spawn
+POWERSHELL_CMD = ("powershell.exe", "-NoProfile", "-NonInteractive")
+
+
+def _detect_wsl() -> bool:
+    """Detect if running in WSL environment."""
+    try:
+        return "microsoft" in Path("/proc/version").read_text().lower()
+    except OSError:
+        return False
+
+
+# Fixed for the lifetime of the process - read /proc/version once
+_IS_WSL = _detect_wsl()
+
+# Error object inside PowerShell output (log lines may surround it).
+# It is flat, so [^{}] keeps the scan linear and skips stray braces in logs
+_JSON_ERROR_RE = re.compile(r'\{[^{}]*"error"[^{}]*\}')
+
+# Unit conversions for extracted sprinkler data
+LPM_TO_GPM = 0.264172
+SQM_TO_SQFT = 10.7639
+DEFAULT_MIN_PRESSURE_PSI = 7.0
+
+# Sprinkler lists at least this long get their numeric fields computed with NumPy
+ENRICH_VECTORIZE_THRESHOLD = 64
+
+
+def _sprinkler_numbers(raw_sprinklers: List[Dict]) -> List[Tuple[float, ...]]:
+    """
+    Compute the numeric fields of each sprinkler.
+
+    Returns one tuple per sprinkler: (x, y, z, flow_lpm, flow_gpm, coverage_m2,
+    coverage_sqft, k_factor, min_pressure_psi, rotation_deg, scale_x, scale_y, scale_z)
+    """
+    rows = []
+    for spk in raw_sprinklers:
+        flow_lpm = float(spk.get("FlowLpm", 0))
+        flow_gpm = round(flow_lpm * LPM_TO_GPM, 2)
+        coverage_m2 = float(spk.get("CoverageM2", 12))
+        k_factor = float(spk.get("KFactor", 5.6))
+
+        # Minimum required pressure (P = (Q/K)²)
+        if k_factor > 0 and flow_gpm > 0:
+            min_pressure_psi = round((flow_gpm / k_factor) ** 2, 2)
+        else:
+            min_pressure_psi = DEFAULT_MIN_PRESSURE_PSI
+
+        rows.append((
+            float(spk.get("X", 0)), float(spk.get("Y", 0)), float(spk.get("Z", 0)),
+            flow_lpm, flow_gpm, coverage_m2, round(coverage_m2 * SQM_TO_SQFT, 1),
+            k_factor, min_pressure_psi, math.degrees(float(spk.get("Rotation", 0))),
+            float(spk.get("ScaleX", 1)), float(spk.get("ScaleY", 1)), float(spk.get("ScaleZ", 1))
+        ))
+    return rows
+
+
+def _sprinkler_numbers_numpy(raw_sprinklers: List[Dict]) -> List[Tuple[float, ...]]:
+    """Vectorized _sprinkler_numbers - same tuples, arithmetic done column-wise."""
+    import numpy as np
+
+    def column(key: str, default: float) -> "np.ndarray":
+        return np.array([spk.get(key, default) for spk in raw_sprinklers], dtype=np.float64)
+
+    flow_lpm = column("FlowLpm", 0)
+    flow_gpm = np.round(flow_lpm * LPM_TO_GPM, 2)
+    coverage_m2 = column("CoverageM2", 12)
+    k_factor = column("KFactor", 5.6)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        min_pressure_psi = np.where(
+            (k_factor > 0) & (flow_gpm > 0),
+            np.round((flow_gpm / k_factor) ** 2, 2),
+            DEFAULT_MIN_PRESSURE_PSI
+        )
+
+    columns = (
+        column("X", 0), column("Y", 0), column("Z", 0),
+        flow_lpm, flow_gpm, coverage_m2, np.round(coverage_m2 * SQM_TO_SQFT, 1),
+        k_factor, min_pressure_psi, np.degrees(column("Rotation", 0)),
+        column("ScaleX", 1), column("ScaleY", 1), column("ScaleZ", 1)
+    )
+    return list(zip(*(c.tolist() for c in columns)))
+
+
+# Drive-root translations ("/mnt/c" <-> "C:\\"); the rest of a path maps 1:1,
+# so wslpath only runs once per drive and direction
+_MOUNT_CACHE: Dict[str, str] = {}
+
+
+def _wslpath(flag: str, path: str) -> Optional[str]:
+    """Run wslpath, returning None on failure."""
+    try:
+        result = subprocess.run(["wslpath", flag, path], capture_output=True, text=True, timeout=5)
+    except Exception as e:
+        logger.warning("wslpath failed: %s", e)
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _mount_root(key: str, flag: str, root: str) -> Optional[str]:
+    """Translate a drive root with wslpath, cached per process."""
+    if key not in _MOUNT_CACHE:
+        translated = _wslpath(flag, root)
+        if translated is None:
+            return None
+        _MOUNT_CACHE[key] = translated
+    return _MOUNT_CACHE[key]
+
+
+# Shell/script metacharacters, traversal and UNC prefixes - one scan per path
+_DANGEROUS_PATH_RE = re.compile("|".join(re.escape(p) for p in (
+    '$(', '${', ';', '&', '|', '$', '`', '\n', '\r', '\x00',
+    '..', '<', '>', '"', "'", '\\\\',
+)))
+
+# Drawing formats accoreconsole can open (lowercase)
+DWG_EXTS = frozenset({'.dwg', '.dxf'})
+
+
+def validate_path(path: str, allowed_extensions: Optional[Collection[str]] = None) -> str:
     """
     Validate and sanitize file paths to prevent command injection.
 
     Args:
         path: The file path to validate
-        allowed_extensions: Optional list of allowed file extensions (e.g., ['.dwg', '.dxf'])
+        allowed_extensions: Optional allowed file extensions; a frozenset is
+            taken as already lowercased (e.g., DWG_EXTS)
 
     Returns:
         Sanitized absolute path
@@ -41,20 +170,18 @@ def validate_path(path: str, allowed_extensions: Optional[List[str]] = None) ->
         raise ValueError("Path cannot be empty")
 
     # Block dangerous patterns
-    dangerous_patterns = [
-        ';', '&', '|', '$', '`', '\n', '\r', '\x00',
-        '$(', '${', '..', '<', '>', '"', "'", '\\\\',
-    ]
-    for pattern in dangerous_patterns:
-        if pattern in path:
-            raise ValueError(f"Path contains forbidden character: {pattern!r}")
+    match = _DANGEROUS_PATH_RE.search(path)
+    if match:
+        raise ValueError(f"Path contains forbidden character: {match.group()!r}")
 
     # Resolve to absolute path
     resolved = Path(path).resolve()
 
     # Check extension if specified
     if allowed_extensions:
-        if resolved.suffix.lower() not in [ext.lower() for ext in allowed_extensions]:
+        if not isinstance(allowed_extensions, frozenset):
+            allowed_extensions = {ext.lower() for ext in allowed_extensions}
+        if resolved.suffix.lower() not in allowed_extensions:
             raise ValueError(f"File extension not allowed: {resolved.suffix}")
 
     return str(resolved)
@@ -81,8 +208,16 @@ class AutoCADExtractSkill(AquaSkill):
 
     # Configuration
     POWERSHELL_SCRIPT = "Extract-Sprinklers.ps1"
+    LISP_SCRIPT = "sprinkler_extractor.lsp"
+    ACCORECONSOLE_PATHS = (
+        "C:\\Program Files\\Autodesk\\AutoCAD 2026\\accoreconsole.exe",
+        "C:\\Program Files\\Autodesk\\AutoCAD 2025\\accoreconsole.exe",
+        "C:\\Program Files\\Autodesk\\AutoCAD 2024\\accoreconsole.exe",
+    )
     SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts" / "autocad"
     TEMP_DIR = Path("/tmp/aquabrain") if os.name != 'nt' else Path("C:/AquaBrain/temp")
+    OUTPUT_FILE_MTIME_SLACK_SEC = 2
+    BATCH_MAX_WORKERS = 4  # Concurrent accoreconsole runs (license/disk bound)
 
     @property
     def metadata(self) -> SkillMetadata:
@@ -133,8 +268,8 @@ class AutoCADExtractSkill(AquaSkill):
         ])
 
     def _is_wsl(self) -> bool:
-        """Detect if running in WSL environment."""
-        return os.path.exists("/proc/version") and "microsoft" in open("/proc/version").read().lower()
+        """Detect if running in WSL environment (cached at import)."""
+        return _IS_WSL
 
     def _wsl_to_windows_path(self, wsl_path: str) -> str:
         r"""
@@ -148,28 +283,21 @@ class AutoCADExtractSkill(AquaSkill):
             # Already a Windows path or relative path
             return wsl_path
 
-        try:
-            result = subprocess.run(
-                ["wslpath", "-w", wsl_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception as e:
-            print(f"[WARN] wslpath failed: {e}")
+        # Drive mount (/mnt/<letter>[/...]) - translate the root only
+        if len(wsl_path) >= 6 and wsl_path[5].isalpha() and wsl_path[6:7] in ("", "/"):
+            root = _mount_root(wsl_path[:6], "-w", wsl_path[:6])
+            if root is not None:
+                return root.rstrip("\\") + "\\" + wsl_path[7:].replace("/", "\\")
+        else:
+            converted = _wslpath("-w", wsl_path)
+            if converted is not None:
+                return converted
 
         # Manual fallback conversion
         # /mnt/c/Users/... -> C:\Users\...
-        if wsl_path.startswith("/mnt/"):
-            parts = wsl_path[5:].split("/", 1)
-            if len(parts) == 2:
-                drive = parts[0].upper()
-                path = parts[1].replace("/", "\\")
-                return f"{drive}:\\{path}"
-            elif len(parts) == 1:
-                return f"{parts[0].upper()}:\\"
+        if len(wsl_path) >= 6 and wsl_path[6:7] in ("", "/"):
+            rest = wsl_path[7:].replace("/", "\\")
+            return f"{wsl_path[5].upper()}:\\{rest}"
 
         return wsl_path
 
@@ -181,17 +309,16 @@ class AutoCADExtractSkill(AquaSkill):
             # Already a Unix path
             return windows_path
 
-        try:
-            result = subprocess.run(
-                ["wslpath", "-u", windows_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
+        # Drive path (X:...) - translate the root only
+        if len(windows_path) >= 2 and windows_path[1] == ":":
+            drive = windows_path[0].upper()
+            root = _mount_root(drive + ":", "-u", drive + ":\\")
+            if root is not None:
+                return root.rstrip("/") + "/" + windows_path[2:].replace("\\", "/").lstrip("/")
+        else:
+            converted = _wslpath("-u", windows_path)
+            if converted is not None:
+                return converted
 
         # Manual fallback
         if len(windows_path) >= 2 and windows_path[1] == ":":
@@ -231,39 +358,21 @@ class AutoCADExtractSkill(AquaSkill):
         Returns:
             Dictionary with extraction results
         """
-        script_path = self._find_powershell_script()
-
-        # Convert script path to Windows format if in WSL
-        if self._is_wsl():
-            windows_script_path = self._wsl_to_windows_path(script_path)
-        else:
-            windows_script_path = script_path
-
-        # Build PowerShell command
-        cmd = [
-            "powershell.exe",
-            "-ExecutionPolicy", "Bypass",
-            "-File", windows_script_path,
-            "-DwgPath", dwg_path,
-            "-OutputFormat", output_format
-        ]
-
-        print(f"[AutoCAD Extract] Running: {' '.join(cmd)}")
+        cmd = self._powershell_command(dwg_path, output_format)
 
         try:
             process = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=300,  # 5 minute timeout
-                env={**os.environ, "PYTHONIOENCODING": "utf-8"}
+                timeout=300  # 5 minute timeout
             )
 
             stdout = process.stdout.strip()
             stderr = process.stderr.strip()
 
             if stderr:
-                print(f"[AutoCAD Extract] STDERR: {stderr}")
+                logger.warning("Bridge STDERR: %s", stderr)
 
             return {
                 "success": process.returncode == 0,
@@ -287,6 +396,161 @@ class AutoCADExtractSkill(AquaSkill):
                 "stderr": ""
             }
 
+    async def _run_powershell_async(self, dwg_path: str, output_format: str) -> Dict[str, Any]:
+        """
+        Execute the PowerShell bridge script without blocking the event loop.
+
+        Same arguments and result dictionary as _run_powershell.
+        """
+        try:
+            cmd = self._powershell_command(dwg_path, output_format)
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e), "stdout": "", "stderr": ""}
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)  # 5 minute timeout
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return {
+                "success": False,
+                "error": "Extraction timed out after 5 minutes",
+                "stdout": "",
+                "stderr": ""
+            }
+
+        stdout = stdout.decode("utf-8", errors="replace").strip()
+        stderr = stderr.decode("utf-8", errors="replace").strip()
+
+        if stderr:
+            logger.warning("Bridge STDERR: %s", stderr)
+
+        return {
+            "success": process.returncode == 0,
+            "stdout": stdout,
+            "stderr": stderr,
+            "returncode": process.returncode
+        }
+
+    def _run_powershell_batch(self, dwg_paths: List[str]) -> Dict[str, Any]:
+        """
+        Extract several DWG files in a single accoreconsole session.
+
+        Writes one .scr that opens each drawing in turn and runs
+        EXTRACTSPRINKLERS with *OUTPUT-FILE* preset to <stem>_sprinklers.json
+        next to the drawing (the extractor writes there instead of its
+        default sprinkler_data.json), so AutoCAD starts once for the whole
+        batch and every drawing gets its own output file.
+
+        Args:
+            dwg_paths: Validated Windows paths to the DWG files
+
+        Returns:
+            Dictionary like _run_powershell
+        """
+        lisp_path = str(Path(self._find_powershell_script()).with_name(self.LISP_SCRIPT))
+        if self._is_wsl():
+            lisp_path = _wslpath("-w", lisp_path) or lisp_path
+        lisp_path = lisp_path.replace("\\", "/")
+
+        lines = []
+        for i, dwg_path in enumerate(dwg_paths):
+            if i:
+                lines += ["_.OPEN", f'"{dwg_path}"']
+            win_path = PureWindowsPath(dwg_path)
+            output_path = str(win_path.with_name(f"{win_path.stem}_sprinklers.json")).replace("\\", "/")
+            lines += [
+                f'(setq *OUTPUT-FILE* "{output_path}")',
+                f'(load "{lisp_path}")',
+                "EXTRACTSPRINKLERS",
+            ]
+        lines.append("QUIT Y")
+
+        self.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+        scr_file = self.TEMP_DIR / f"extract_batch_{datetime.now():%Y%m%d%H%M%S%f}.scr"
+        scr_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        windows_scr = (_wslpath("-w", str(scr_file)) if self._is_wsl() else None) or str(scr_file)
+
+        candidates = ", ".join(f"'{path}'" for path in self.ACCORECONSOLE_PATHS)
+        ps_command = (
+            f"$acc = @({candidates}) | Where-Object {{ Test-Path $_ }} | Select-Object -First 1; "
+            f'& $acc /i "{dwg_paths[0]}" /s "{windows_scr}" /l en-US'
+        )
+        logger.debug("Session for %d DWG files: %s", len(dwg_paths), windows_scr)
+
+        try:
+            process = subprocess.run(
+                [*POWERSHELL_CMD, "-Command", ps_command],
+                capture_output=True,
+                text=True,
+                timeout=300 * len(dwg_paths)
+            )
+        except subprocess.TimeoutExpired:
+            return {
+                "success": False,
+                "error": f"Batch extraction timed out after {5 * len(dwg_paths)} minutes",
+                "stdout": "",
+                "stderr": ""
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e), "stdout": "", "stderr": ""}
+        finally:
+            scr_file.unlink(missing_ok=True)
+
+        return {
+            "success": process.returncode == 0,
+            "stdout": process.stdout.strip(),
+            "stderr": process.stderr.strip(),
+            "returncode": process.returncode
+        }
+
+    def _powershell_command(self, dwg_path: str, output_format: str) -> List[str]:
+        """Build the bridge script command line."""
+        script_path = self._find_powershell_script()
+
+        # Convert script path to Windows format if in WSL
+        if self._is_wsl():
+            windows_script_path = self._wsl_to_windows_path(script_path)
+        else:
+            windows_script_path = script_path
+
+        # Build PowerShell command
+        cmd = [
+            *POWERSHELL_CMD,
+            "-ExecutionPolicy", "Bypass",
+            "-File", windows_script_path,
+            "-DwgPath", dwg_path,
+            "-OutputFormat", output_format
+        ]
+
+        logger.debug("Running: %s", cmd)
+        return cmd
+
+    def _read_output_file(self, local_dwg_path: str, since: float) -> Optional[List[Dict[str, Any]]]:
+        """
+        Load the JSON the bridge script saves next to the DWG (<name>_sprinklers.json).
+
+        Returns None when the file is missing, unreadable or older than this
+        run (since, minus OUTPUT_FILE_MTIME_SLACK_SEC for clock differences
+        between Windows and WSL).
+        """
+        output_path = Path(local_dwg_path).with_name(f"{Path(local_dwg_path).stem}_sprinklers.json")
+
+        try:
+            if output_path.stat().st_mtime < since - self.OUTPUT_FILE_MTIME_SLACK_SEC:
+                return None
+            with open(output_path, encoding="utf-8-sig") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return data if isinstance(data, list) else None
+
     def _parse_json_output(self, raw_output: str) -> List[Dict[str, Any]]:
         """
         Parse JSON from PowerShell output.
@@ -294,18 +558,19 @@ class AutoCADExtractSkill(AquaSkill):
         PowerShell may include log messages before/after JSON,
         so we need to extract just the JSON array.
         """
-        # Try to find JSON array in output
-        json_match = re.search(r'\[[\s\S]*\]', raw_output)
+        # Try to find JSON array in output (first '[' to last ']')
+        start = raw_output.find("[")
+        end = raw_output.rfind("]")
 
-        if json_match:
+        if start != -1 and end > start:
             try:
-                return json.loads(json_match.group(0))
+                return json.loads(raw_output[start:end + 1])
             except json.JSONDecodeError as e:
-                print(f"[AutoCAD Extract] JSON parse error: {e}")
+                logger.warning("JSON parse error: %s", e)
                 return []
 
         # Try parsing as error object
-        error_match = re.search(r'\{[\s\S]*"error"[\s\S]*\}', raw_output)
+        error_match = _JSON_ERROR_RE.search(raw_output)
         if error_match:
             try:
                 error_data = json.loads(error_match.group(0))
@@ -323,31 +588,17 @@ class AutoCADExtractSkill(AquaSkill):
         - Add calculated fields
         - Normalize property names
         """
-        enriched = []
-
-        for spk in raw_sprinklers:
-            # Extract location
-            x = float(spk.get("X", 0))
-            y = float(spk.get("Y", 0))
-            z = float(spk.get("Z", 0))
-
-            # Convert flow: LPM -> GPM
-            flow_lpm = float(spk.get("FlowLpm", 0))
-            flow_gpm = round(flow_lpm * 0.264172, 2)
-
-            # Convert coverage: m² -> ft²
-            coverage_m2 = float(spk.get("CoverageM2", 12))
-            coverage_sqft = round(coverage_m2 * 10.7639, 1)
-
-            # K-Factor
-            k_factor = float(spk.get("KFactor", 5.6))
+        if len(raw_sprinklers) >= ENRICH_VECTORIZE_THRESHOLD:
+            numbers = _sprinkler_numbers_numpy(raw_sprinklers)
+        else:
+            numbers = _sprinkler_numbers(raw_sprinklers)
 
-            # Calculate minimum required pressure (P = (Q/K)²)
-            if k_factor > 0 and flow_gpm > 0:
-                min_pressure_psi = round((flow_gpm / k_factor) ** 2, 2)
-            else:
-                min_pressure_psi = 7.0  # Default minimum
+        # One extraction run - one timestamp
+        extracted_at = datetime.now().isoformat()
+        enriched = []
 
+        for spk, (x, y, z, flow_lpm, flow_gpm, coverage_m2, coverage_sqft, k_factor,
+                  min_pressure_psi, rotation_deg, scale_x, scale_y, scale_z) in zip(raw_sprinklers, numbers):
             enriched.append({
                 "id": spk.get("ID", f"SPK-{len(enriched)+1}"),
                 "block_name": spk.get("BlockName", "SPRINKLER"),
@@ -368,15 +619,15 @@ class AutoCADExtractSkill(AquaSkill):
                     "min_pressure_psi": min_pressure_psi,
                     "zone": spk.get("ZoneId", "ZONE-1")
                 },
-                "rotation_deg": float(spk.get("Rotation", 0)) * (180 / 3.14159),
+                "rotation_deg": rotation_deg,
                 "scale": {
-                    "x": float(spk.get("ScaleX", 1)),
-                    "y": float(spk.get("ScaleY", 1)),
-                    "z": float(spk.get("ScaleZ", 1))
+                    "x": scale_x,
+                    "y": scale_y,
+                    "z": scale_z
                 },
                 "metadata": {
                     "source": "autocad_dwg",
-                    "extracted_at": datetime.now().isoformat(),
+                    "extracted_at": extracted_at,
                     "attributes": spk.get("Attributes", {}),
                     "xdata": spk.get("XData", {})
                 }
@@ -396,16 +647,43 @@ class AutoCADExtractSkill(AquaSkill):
         5. Return results
         """
         start_time = datetime.now()
+        prepared = self._prepare_extraction(inputs)
+        if isinstance(prepared, ExecutionResult):
+            return prepared
+
+        # Step 3: Run extraction
+        result = self._run_powershell(prepared[1], inputs.get("output_format", "JSON"))
+        return self._finish_extraction(inputs, prepared, result, start_time)
+
+    async def execute_async(self, inputs: Dict[str, Any]) -> ExecutionResult:
+        """
+        Async variant of execute: awaits the bridge process instead of
+        blocking a thread, so several extractions can overlap on one loop.
+        """
+        start_time = datetime.now()
+        prepared = self._prepare_extraction(inputs)
+        if isinstance(prepared, ExecutionResult):
+            return prepared
+
+        # Step 3: Run extraction
+        result = await self._run_powershell_async(prepared[1], inputs.get("output_format", "JSON"))
+        return self._finish_extraction(inputs, prepared, result, start_time)
+
+    def _prepare_extraction(self, inputs: Dict[str, Any]):
+        """Steps 1-2: resolve the DWG path; returns (check_path, windows_path) or a FAILED result."""
         dwg_path = inputs.get("dwg_path", "")
-        output_format = inputs.get("output_format", "JSON")
-        extract_xdata = inputs.get("extract_xdata", True)
+
+        is_wsl = self._is_wsl()
+        is_win_path = len(dwg_path) >= 2 and dwg_path[1] == ":"
 
         # Step 1: Validate file exists
         # Convert to check existence (might be WSL or Windows path)
-        check_path = dwg_path
-        if self._is_wsl() and dwg_path.startswith("/mnt/"):
+        if is_win_path:
+            # Already what AutoCAD wants; only WSL needs a local path to check
+            check_path = self._windows_to_wsl_path(dwg_path) if is_wsl else dwg_path
+        elif dwg_path.startswith("/"):
             check_path = dwg_path
-        elif not dwg_path.startswith("/"):
+        else:
             check_path = self._windows_to_wsl_path(dwg_path)
 
         if not os.path.exists(check_path):
@@ -417,15 +695,31 @@ class AutoCADExtractSkill(AquaSkill):
             )
 
         # Step 2: Convert path to Windows format for AutoCAD
-        if self._is_wsl():
+        if is_wsl and not is_win_path:
             windows_dwg_path = self._wsl_to_windows_path(dwg_path)
         else:
             windows_dwg_path = dwg_path
 
-        print(f"[AutoCAD Extract] Processing: {windows_dwg_path}")
+        logger.debug("Processing: %s", windows_dwg_path)
+        return check_path, windows_dwg_path
+
+    def _finish_extraction(
+        self,
+        inputs: Dict[str, Any],
+        prepared: Tuple[str, str],
+        result: Dict[str, Any],
+        start_time: datetime,
+        require_output_file: bool = False
+    ) -> ExecutionResult:
+        """
+        Steps 4-5: turn the bridge result into an ExecutionResult.
 
-        # Step 3: Run extraction
-        result = self._run_powershell(windows_dwg_path, output_format)
+        With require_output_file, a missing output file fails the drawing
+        instead of falling back to stdout (a shared session's stdout cannot
+        be attributed to a single drawing).
+        """
+        check_path, windows_dwg_path = prepared
+        output_format = inputs.get("output_format", "JSON")
 
         if not result.get("success"):
             return ExecutionResult(
@@ -435,9 +729,22 @@ class AutoCADExtractSkill(AquaSkill):
                 error=result.get("error") or result.get("stderr", "Unknown error")
             )
 
-        # Step 4: Parse JSON output
+        # Step 4: Load the JSON file the bridge wrote, else parse it out of stdout
+        raw_sprinklers = None
+        if output_format == "JSON" or require_output_file:
+            raw_sprinklers = self._read_output_file(check_path, start_time.timestamp())
+
+        if raw_sprinklers is None and require_output_file:
+            return ExecutionResult(
+                status=ExecutionStatus.FAILED,
+                skill_id=self.metadata.id,
+                message="AutoCAD extraction failed",
+                error=f"No sprinkler output was written for {windows_dwg_path}"
+            )
+
         try:
-            raw_sprinklers = self._parse_json_output(result.get("stdout", ""))
+            if raw_sprinklers is None:
+                raw_sprinklers = self._parse_json_output(result.get("stdout", ""))
         except ValueError as e:
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
@@ -489,6 +796,106 @@ class AutoCADExtractSkill(AquaSkill):
             }
         )
 
+    def execute_batch(
+        self,
+        inputs_list: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        on_result: Optional[Callable[[int, ExecutionResult], None]] = None,
+        single_session: bool = False
+    ) -> List[ExecutionResult]:
+        """
+        Extract several DWG files concurrently.
+
+        Each extraction mostly waits on its own PowerShell/accoreconsole
+        process, so threads are enough to overlap them. Drawings that share
+        a folder run one after another: an extractor that ignores
+        *OUTPUT-FILE* writes sprinkler_data.json there for the bridge to
+        rename, and a.dwg / a.dxf share an output file.
+
+        Args:
+            inputs_list: One execute() inputs dict per DWG
+            max_workers: Concurrent folders (default: BATCH_MAX_WORKERS)
+            on_result: Called with (index, result) as each file finishes
+                (from a worker thread, one call at a time)
+            single_session: Run all files through one accoreconsole session
+                instead (sequential, but AutoCAD starts only once)
+
+        Returns:
+            ExecutionResults in the same order as inputs_list
+        """
+        results: List[Optional[ExecutionResult]] = [None] * len(inputs_list)
+        if not inputs_list:
+            return []
+
+        if single_session:
+            return self._execute_session(inputs_list, results, on_result)
+
+        folders: Dict[str, List[int]] = {}
+        for index, inputs in enumerate(inputs_list):
+            folders.setdefault(self._output_folder_key(inputs.get("dwg_path", "")), []).append(index)
+
+        callback_lock = threading.Lock()
+
+        def extract_folder(indices: List[int]) -> None:
+            for index in indices:
+                results[index] = self.execute(inputs_list[index])
+                if on_result:
+                    with callback_lock:
+                        on_result(index, results[index])
+
+        workers = min(max_workers or self.BATCH_MAX_WORKERS, len(folders))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(extract_folder, indices) for indices in folders.values()]):
+                future.result()
+
+        return results
+
+    def _output_folder_key(self, dwg_path: str) -> str:
+        """Normalized folder of a DWG (WSL and Windows spellings compare equal)."""
+        local_path = self._windows_to_wsl_path(dwg_path).replace("\\", "/")
+        return os.path.dirname(local_path).lower()
+
+    def _execute_session(
+        self,
+        inputs_list: List[Dict[str, Any]],
+        results: List[Optional[ExecutionResult]],
+        on_result: Optional[Callable[[int, ExecutionResult], None]]
+    ) -> List[ExecutionResult]:
+        """execute_batch(single_session=True): one _run_powershell_batch for all valid files."""
+        start_time = datetime.now()
+        pending = []
+
+        for index, inputs in enumerate(inputs_list):
+            prepared = self._prepare_extraction(inputs)
+            if not isinstance(prepared, ExecutionResult):
+                # Paths are written into the .scr and a PowerShell command line
+                try:
+                    validate_path(prepared[0], allowed_extensions=DWG_EXTS)
+                except ValueError as e:
+                    prepared = ExecutionResult(
+                        status=ExecutionStatus.FAILED,
+                        skill_id=self.metadata.id,
+                        message=f"Invalid DWG path: {e}"
+                    )
+
+            if isinstance(prepared, ExecutionResult):
+                results[index] = prepared
+                if on_result:
+                    on_result(index, prepared)
+            else:
+                pending.append((index, prepared))
+
+        if pending:
+            session = self._run_powershell_batch([prepared[1] for _, prepared in pending])
+            for index, prepared in pending:
+                results[index] = self._finish_extraction(
+                    inputs_list[index], prepared, session, start_time, require_output_file=True
+                )
+                if on_result:
+                    on_result(index, results[index])
+
+        return results
+
 
 # ============================================================================
 # ADDITIONAL AUTOCAD SKILLS
@@ -498,6 +905,11 @@ class AutoCADExtractSkill(AquaSkill):
 class AutoCADOpenDWGSkill(AquaSkill):
     """Open a DWG file in AutoCAD GUI."""
 
+    AUTOCAD_PATHS = (
+        "C:\\Program Files\\Autodesk\\AutoCAD 2026\\acad.exe",
+        "C:\\Program Files\\Autodesk\\AutoCAD 2025\\acad.exe",
+    )
+
     @property
     def metadata(self) -> SkillMetadata:
         return SkillMetadata(
@@ -515,6 +927,39 @@ class AutoCADOpenDWGSkill(AquaSkill):
             InputField(name="dwg_path", label="DWG File Path", type=FieldType.TEXT, required=True)
         ])
 
+    @staticmethod
+    def _local_path(windows_path: str) -> str:
+        """Windows install path as seen from this process (as-is on Windows, under the drive's mount in WSL)."""
+        if os.name == "nt":
+            return windows_path
+        drive = windows_path[0].upper()
+        root = _mount_root(drive + ":", "-u", drive + ":\\") or "/mnt/" + drive.lower()
+        return root.rstrip("/") + "/" + windows_path[3:].replace("\\", "/")
+
+    def _find_autocad(self) -> Optional[str]:
+        """Return the first installed AutoCAD executable, or None."""
+        for path in self.AUTOCAD_PATHS:
+            if os.path.exists(self._local_path(path)):
+                return path
+
+        if os.name == "nt":
+            return None
+
+        # Drive not mounted where expected - ask Windows once for all candidates
+        candidates = ",".join(f"'{path}'" for path in self.AUTOCAD_PATHS)
+        try:
+            # SECURITY: Use list args instead of shell=True to prevent injection
+            result = subprocess.run(
+                [*POWERSHELL_CMD, "-Command",
+                 f"@({candidates}) | Where-Object {{ Test-Path $_ }} | Select-Object -First 1"],
+                capture_output=True, text=True
+            )
+        except OSError:
+            return None
+
+        found = result.stdout.strip()
+        return found if found in self.AUTOCAD_PATHS else None
+
     def execute(self, inputs: Dict[str, Any]) -> ExecutionResult:
         dwg_path = inputs.get("dwg_path", "")
 
@@ -529,21 +974,7 @@ class AutoCADOpenDWGSkill(AquaSkill):
             windows_path = dwg_path
 
         # Find AutoCAD
-        autocad_paths = [
-            "C:\\Program Files\\Autodesk\\AutoCAD 2026\\acad.exe",
-            "C:\\Program Files\\Autodesk\\AutoCAD 2025\\acad.exe",
-        ]
-
-        autocad_exe = None
-        for path in autocad_paths:
-            # SECURITY: Use list args instead of shell=True to prevent injection
-            result = subprocess.run(
-                ["powershell.exe", "-Command", f"Test-Path '{path}'"],
-                capture_output=True, text=True
-            )
-            if "True" in result.stdout:
-                autocad_exe = path
-                break
+        autocad_exe = self._find_autocad()
 
         if not autocad_exe:
             return ExecutionResult(
@@ -552,9 +983,39 @@ class AutoCADOpenDWGSkill(AquaSkill):
                 message="AutoCAD not found"
             )
 
-        # SECURITY: Use list args to prevent command injection
-        ps_command = f'Start-Process "{autocad_exe}" -ArgumentList @("{windows_path}")'
-        subprocess.run(["powershell.exe", "-Command", ps_command])
+        local_exe = self._local_path(autocad_exe)
+        if os.name == "nt" or os.path.exists(local_exe):
+            # SECURITY: Use list args to prevent command injection. acad.exe is
+            # launched directly (WSL interop runs Windows binaries) - no shell in between
+            cmd = [local_exe, windows_path]
+        else:
+            # Found by the PowerShell probe but not mounted here - Windows starts it
+            try:
+                validate_path(windows_path, allowed_extensions=DWG_EXTS)
+            except ValueError as e:
+                return ExecutionResult(
+                    status=ExecutionStatus.FAILED,
+                    skill_id=self.metadata.id,
+                    message=f"Invalid DWG path: {e}"
+                )
+            # Both paths are free of quotes (AUTOCAD_PATHS constants, validated DWG)
+            cmd = [*POWERSHELL_CMD, "-Command",
+                   f"Start-Process -FilePath '{autocad_exe}' -ArgumentList '\"{windows_path}\"'"]
+
+        try:
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                creationflags=getattr(subprocess, "DETACHED_PROCESS", 0),
+                start_new_session=os.name != "nt"
+            )
+        except OSError as e:
+            return ExecutionResult(
+                status=ExecutionStatus.FAILED,
+                skill_id=self.metadata.id,
+                message="Failed to launch AutoCAD",
+                error=str(e)
+            )
 
         return ExecutionResult(
             status=ExecutionStatus.SUCCESS,
@@ -593,7 +1054,7 @@ class AutoCADRunLISPSkill(AquaSkill):
 
         # SECURITY: Validate dwg_path to prevent injection
         try:
-            validated_dwg = validate_path(dwg_path, allowed_extensions=['.dwg', '.dxf'])
+            validated_dwg = validate_path(dwg_path, allowed_extensions=DWG_EXTS)
         except ValueError as e:
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
@@ -602,7 +1063,6 @@ class AutoCADRunLISPSkill(AquaSkill):
             )
 
         # Create temp LISP file
-        import tempfile
         with tempfile.NamedTemporaryFile(mode='w', suffix='.lsp', delete=False) as f:
             f.write(lisp_code)
             lisp_file = f.name
@@ -626,7 +1086,7 @@ class AutoCADRunLISPSkill(AquaSkill):
         ps_command = f'& "{accore}" /i "{windows_dwg}" /s "{windows_scr}" /l en-US'
 
         result = subprocess.run(
-            ["powershell.exe", "-Command", ps_command],
+            [*POWERSHELL_CMD, "-Command", ps_command],
             capture_output=True, text=True, timeout=120
         )
 
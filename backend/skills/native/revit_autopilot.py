@@ -14,7 +14,12 @@ This skill wraps the existing engineering orchestration pipeline:
 Now exposed through the Universal Orchestrator!
 """
 
+import asyncio
+import traceback
+import weakref
 from typing import Dict, Any
+
+import services.orchestrator as engineering
 from skills.base import (
     AquaSkill,
     SkillMetadata,
@@ -41,6 +46,12 @@ class RevitAutopilotSkill(AquaSkill):
     - Traffic Light status generation
     """
 
+    # Concurrent async pipeline runs per event loop (bounded by Revit COM connections)
+    MAX_CONCURRENT_RUNS = 2
+    _run_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     @property
     def metadata(self) -> SkillMetadata:
         return SkillMetadata(
@@ -124,49 +135,78 @@ class RevitAutopilotSkill(AquaSkill):
         This wraps the existing orchestrator logic into the skill framework.
         """
         try:
-            project_id = inputs.get("project_id", "DEMO_PROJECT")
-            hazard_class = inputs.get("hazard_class", "ordinary_1")
-            revit_version = inputs.get("revit_version", "auto")
-            notes = inputs.get("notes", "")
-            mock_mode = inputs.get("mock_mode", True)
-
-            # Import the orchestrator service
-            from services.orchestrator import run_engineering_process_sync
+            params = self._pipeline_params(inputs)
 
             # Run the pipeline
-            result = run_engineering_process_sync(
-                project_id=project_id,
-                hazard_class=hazard_class,
-                notes=notes,
-                revit_version=revit_version,
-                mock_mode=mock_mode,
-            )
-
-            # Determine status based on traffic light
-            traffic_light = result.get("traffic_light", {})
-            status_color = traffic_light.get("status", "YELLOW")
-
-            message = f"Pipeline completed - Traffic Light: {status_color}"
-
-            return ExecutionResult(
-                status=ExecutionStatus.SUCCESS,
-                skill_id=self.metadata.id,
-                message=message,
-                output=result,
-                metrics={
-                    "traffic_light_status": status_color,
-                    "compliance_score": traffic_light.get("compliance_score", 0),
-                    "project_id": project_id,
-                    "hazard_class": hazard_class,
-                },
-            )
+            result = engineering.run_engineering_process_sync(**params)
+
+            return self._pipeline_result(result, params)
 
         except Exception as e:
-            import traceback
-            return ExecutionResult(
-                status=ExecutionStatus.FAILED,
-                skill_id=self.metadata.id,
-                message="Engineering pipeline failed",
-                error=str(e),
-                error_traceback=traceback.format_exc(),
-            )
+            return self._pipeline_failure(e)
+
+    async def execute_async(self, inputs: Dict[str, Any]) -> ExecutionResult:
+        """
+        Execute the pipeline on the caller's event loop.
+
+        Awaits the async orchestrator entry point instead of blocking a
+        thread; at most MAX_CONCURRENT_RUNS pipelines run at once per loop.
+        """
+        loop = asyncio.get_running_loop()
+        slots = self._run_slots.get(loop)
+        if slots is None:
+            slots = self._run_slots[loop] = asyncio.Semaphore(self.MAX_CONCURRENT_RUNS)
+
+        try:
+            params = self._pipeline_params(inputs)
+
+            async with slots:
+                # Mode is passed per run - concurrent runs may differ
+                result = await engineering.run_engineering_process(**params)
+
+            return self._pipeline_result(result, params)
+
+        except Exception as e:
+            return self._pipeline_failure(e)
+
+    @staticmethod
+    def _pipeline_params(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Orchestrator arguments from the skill inputs."""
+        return {
+            "project_id": inputs.get("project_id", "DEMO_PROJECT"),
+            "hazard_class": inputs.get("hazard_class", "ordinary_1"),
+            "revit_version": inputs.get("revit_version", "auto"),
+            "notes": inputs.get("notes", ""),
+            "mock_mode": inputs.get("mock_mode", True),
+        }
+
+    def _pipeline_result(self, result: Dict[str, Any], params: Dict[str, Any]) -> ExecutionResult:
+        """Wrap a pipeline result with its Traffic Light status."""
+        # Determine status based on traffic light
+        traffic_light = result.get("traffic_light", {})
+        status_color = traffic_light.get("status", "YELLOW")
+
+        message = f"Pipeline completed - Traffic Light: {status_color}"
+
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            skill_id=self.metadata.id,
+            message=message,
+            output=result,
+            metrics={
+                "traffic_light_status": status_color,
+                "compliance_score": traffic_light.get("compliance_score", 0),
+                "project_id": params["project_id"],
+                "hazard_class": params["hazard_class"],
+            },
+        )
+
+    def _pipeline_failure(self, error: Exception) -> ExecutionResult:
+        """Failed result for an exception raised by the pipeline."""
+        return ExecutionResult(
+            status=ExecutionStatus.FAILED,
+            skill_id=self.metadata.id,
+            message="Engineering pipeline failed",
+            error=str(error),
+            error_traceback=traceback.format_exc(),
+        )
@@ -25,9 +25,14 @@ Usage:
     })
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
 from datetime import datetime
+import hashlib
 import json
+import threading
+import time
+import traceback
 import requests
 
 from skills.base import (
@@ -47,8 +52,57 @@ from services.ai_engine import (
     get_ollama_client,
     OLLAMA_BASE_URL,
     LOCAL_MODEL,
+    DEFAULT_GEMINI_MODEL,
     smart_ask
 )
+from services.ollama_batcher import generate_many
+
+
+# Response cache - identical requests skip the LLM roundtrip
+RESPONSE_CACHE_TTL_SEC = 3600
+RESPONSE_CACHE_MAX_ENTRIES = 256
+CACHEABLE_MAX_TEMPERATURE = 0.3  # Above this, a repeat answer is not what the caller wants
+
+LOCAL_TEMPERATURE = 0.2  # Engineering precision - factual responses
+CLOUD_TEMPERATURE = 0.3
+
+_response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(
+    system_prompt: str,
+    prompt: str,
+    model: str,
+    temperature: float,
+    max_tokens: int
+) -> str:
+    """Cache key for one LLM request."""
+    payload = "\0".join((system_prompt, prompt, model, repr(temperature), str(max_tokens)))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _cached_response(key: str) -> Optional[str]:
+    """Cached response for key, if present and fresh."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        created, response = entry
+        if time.monotonic() - created > RESPONSE_CACHE_TTL_SEC:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return response
+
+
+def _store_response(key: str, response: str) -> None:
+    """Cache a response, evicting the least recently used entry when full."""
+    with _response_cache_lock:
+        _response_cache[key] = (time.monotonic(), response)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
 
 
 # Research-specific system prompts
@@ -198,35 +252,14 @@ class ResearchSkill(AquaSkill):
         start_time = datetime.now()
 
         try:
-            # Extract inputs
-            query = inputs.get("query", "")
-            context = inputs.get("context", "")
-            research_type = inputs.get("research_type", "general")
-            output_format = inputs.get("output_format", "structured")
-            max_length = inputs.get("max_length", "medium")
-
-            if not query.strip():
-                return ExecutionResult(
-                    status=ExecutionStatus.FAILED,
-                    skill_id=self.metadata.id,
-                    message="Research query cannot be empty",
-                    error="Empty query provided"
-                )
-
-            # Determine max tokens based on length setting
-            max_tokens_map = {
-                "short": 500,
-                "medium": 1500,
-                "long": 3000,
-                "unlimited": 4096
-            }
-            max_tokens = max_tokens_map.get(max_length, 1500)
-
-            # Select system prompt based on research type
-            system_prompt = self._get_system_prompt(research_type)
+            request = self._prepare_request(inputs)
+            if isinstance(request, ExecutionResult):
+                return request
 
-            # Build the full prompt
-            full_prompt = self._build_prompt(query, context, research_type, output_format)
+            # Same request answered before - skip the LLM entirely
+            cached = self._cached_result(request, start_time)
+            if cached is not None:
+                return cached
 
             # Check if Ollama is available
             ollama = get_ollama_client()
@@ -234,63 +267,210 @@ class ResearchSkill(AquaSkill):
             if ollama.is_available():
                 # Use local LLM (zero latency!)
                 provider_used = "ollama"
-                response = ollama.generate(
-                    prompt=full_prompt,
-                    model=LOCAL_MODEL,
-                    system_prompt=system_prompt,
-                    temperature=0.2,  # Engineering precision - factual responses
-                    max_tokens=max_tokens
-                )
+                model_used = LOCAL_MODEL
+                temperature = LOCAL_TEMPERATURE
+                cache_key = request["local_key"]
+                response = ollama.generate(**self._local_request(request))
             else:
                 # Fallback to cloud (Gemini)
                 provider_used = "gemini (fallback)"
+                model_used = DEFAULT_GEMINI_MODEL
+                temperature = CLOUD_TEMPERATURE
+                cache_key = request["cloud_key"]
                 response = smart_ask(
-                    prompt=full_prompt,
-                    system_prompt=system_prompt,
-                    temperature=0.3,
+                    prompt=request["prompt"],
+                    system_prompt=request["system_prompt"],
+                    temperature=temperature,
                     fallback=True
                 )
 
-            # Calculate duration
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            if response and temperature <= CACHEABLE_MAX_TEMPERATURE:
+                _store_response(cache_key, response)
 
-            # Parse and structure the output
-            structured_output = self._structure_output(
-                response,
-                research_type,
-                output_format,
-                provider_used
+            return self._research_result(
+                response, request["research_type"], request["output_format"],
+                provider_used, model_used, start_time
             )
 
-            return ExecutionResult(
-                status=ExecutionStatus.SUCCESS,
-                skill_id=self.metadata.id,
-                message=f"Research completed using {provider_used}",
-                output=structured_output,
-                duration_ms=duration_ms,
-                metrics={
-                    "provider": provider_used,
-                    "model": LOCAL_MODEL if provider_used == "ollama" else "gemini-2.5-flash",
-                    "research_type": research_type,
-                    "output_format": output_format,
-                    "response_length": len(response),
-                    "tokens_estimated": len(response.split()) * 1.3
-                }
+        except Exception as e:
+            return self._research_failure(e, start_time)
+
+    def execute_many(self, inputs_list: List[Dict[str, Any]]) -> List[ExecutionResult]:
+        """
+        Execute several research queries, overlapping their LLM calls.
+
+        Cached requests are answered at once; the rest are sent to Ollama
+        together (services.ollama_batcher) so the server can decode them in
+        parallel. Without Ollama each query goes through execute().
+
+        Args:
+            inputs_list: One execute() inputs dict per query
+
+        Returns:
+            ExecutionResults in the same order as inputs_list
+        """
+        start_time = datetime.now()
+        results: List[Optional[ExecutionResult]] = [None] * len(inputs_list)
+        pending = []
+
+        for index, inputs in enumerate(inputs_list):
+            try:
+                request = self._prepare_request(inputs)
+                if not isinstance(request, ExecutionResult):
+                    request = self._cached_result(request, start_time) or request
+            except Exception as e:
+                request = self._research_failure(e, start_time)
+
+            if isinstance(request, ExecutionResult):
+                results[index] = request
+            else:
+                pending.append((index, request))
+
+        if not pending:
+            return results
+
+        if not get_ollama_client().is_available():
+            for index, _ in pending:
+                results[index] = self.execute(inputs_list[index])
+            return results
+
+        responses = generate_many([self._local_request(request) for _, request in pending])
+
+        for (index, request), response in zip(pending, responses):
+            if isinstance(response, Exception):
+                results[index] = self._research_failure(response, start_time)
+                continue
+
+            if response:
+                _store_response(request["local_key"], response)
+            results[index] = self._research_result(
+                response, request["research_type"], request["output_format"],
+                "ollama", LOCAL_MODEL, start_time
             )
 
-        except Exception as e:
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-            import traceback
+        return results
+
+    def _prepare_request(self, inputs: Dict[str, Any]):
+        """Prompts and cache keys for one query, or a FAILED result for an empty one."""
+        # Extract inputs
+        query = inputs.get("query", "")
+        context = inputs.get("context", "")
+        research_type = inputs.get("research_type", "general")
+        output_format = inputs.get("output_format", "structured")
+        max_length = inputs.get("max_length", "medium")
 
+        if not query.strip():
             return ExecutionResult(
                 status=ExecutionStatus.FAILED,
                 skill_id=self.metadata.id,
-                message=f"Research failed: {str(e)}",
-                error=str(e),
-                error_traceback=traceback.format_exc(),
-                duration_ms=duration_ms
+                message="Research query cannot be empty",
+                error="Empty query provided"
             )
 
+        # Determine max tokens based on length setting
+        max_tokens_map = {
+            "short": 500,
+            "medium": 1500,
+            "long": 3000,
+            "unlimited": 4096
+        }
+        max_tokens = max_tokens_map.get(max_length, 1500)
+
+        # Select system prompt based on research type
+        system_prompt = self._get_system_prompt(research_type)
+
+        # Build the full prompt
+        full_prompt = self._build_prompt(query, context, research_type, output_format)
+
+        return {
+            "research_type": research_type,
+            "output_format": output_format,
+            "system_prompt": system_prompt,
+            "prompt": full_prompt,
+            "max_tokens": max_tokens,
+            # Local and fallback requests, each keyed as it would be sent
+            "local_key": _response_cache_key(
+                system_prompt, full_prompt, LOCAL_MODEL, LOCAL_TEMPERATURE, max_tokens
+            ),
+            "cloud_key": _response_cache_key(
+                system_prompt, full_prompt, DEFAULT_GEMINI_MODEL, CLOUD_TEMPERATURE, max_tokens
+            ),
+        }
+
+    @staticmethod
+    def _local_request(request: Dict[str, Any]) -> Dict[str, Any]:
+        """OllamaClient.generate() arguments for a prepared request."""
+        return {
+            "prompt": request["prompt"],
+            "model": LOCAL_MODEL,
+            "system_prompt": request["system_prompt"],
+            "temperature": LOCAL_TEMPERATURE,
+            "max_tokens": request["max_tokens"],
+        }
+
+    def _cached_result(self, request: Dict[str, Any], start_time: datetime) -> Optional[ExecutionResult]:
+        """Result from the response cache, if either provider answered this request."""
+        candidates = ((LOCAL_MODEL, request["local_key"]), (DEFAULT_GEMINI_MODEL, request["cloud_key"]))
+
+        for model_used, cache_key in candidates:
+            cached = _cached_response(cache_key)
+            if cached is not None:
+                return self._research_result(
+                    cached, request["research_type"], request["output_format"],
+                    "cache", model_used, start_time
+                )
+        return None
+
+    def _research_failure(self, error: Exception, start_time: datetime) -> ExecutionResult:
+        """FAILED result for an exception raised while researching."""
+        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+
+        return ExecutionResult(
+            status=ExecutionStatus.FAILED,
+            skill_id=self.metadata.id,
+            message=f"Research failed: {str(error)}",
+            error=str(error),
+            error_traceback="".join(traceback.format_exception(type(error), error, error.__traceback__)),
+            duration_ms=duration_ms
+        )
+
+    def _research_result(
+        self,
+        response: str,
+        research_type: str,
+        output_format: str,
+        provider_used: str,
+        model: str,
+        start_time: datetime
+    ) -> ExecutionResult:
+        """Wrap an LLM (or cached) response in a successful ExecutionResult."""
+        # Calculate duration
+        duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+
+        # Parse and structure the output
+        structured_output = self._structure_output(
+            response,
+            research_type,
+            output_format,
+            provider_used
+        )
+
+        return ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            skill_id=self.metadata.id,
+            message=f"Research completed using {provider_used}",
+            output=structured_output,
+            duration_ms=duration_ms,
+            metrics={
+                "provider": provider_used,
+                "model": model,
+                "research_type": research_type,
+                "output_format": output_format,
+                "response_length": len(response),
+                "tokens_estimated": len(response.split()) * 1.3
+            }
+        )
+
     def _get_system_prompt(self, research_type: str) -> str:
         """Get the appropriate system prompt for the research type."""
         prompts = {
@@ -6,25 +6,63 @@ Background task definitions for the event-driven architecture.
 Tasks:
 - execute_engineering_workflow: Full autopilot pipeline
 - execute_skill: Universal skill execution
+- execute_skill_batch: One skill over many payloads in a single task
 - health_check: Periodic health monitoring
 """
 
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import traceback
 import json
+import uuid
+import atexit
+import itertools
+import threading
+import time
+from contextlib import ExitStack
+
+from sqlalchemy import update
+from sqlalchemy.orm import scoped_session
 
 from models import SessionLocal, SkillExecution, ProjectRun
 
 logger = get_task_logger(__name__)
 
+# Thread-local session reused by status updates (one per worker thread)
+Session = scoped_session(SessionLocal)
+
 
 # ============================================================================
 # DATABASE HELPERS
 # ============================================================================
 
+# Progress-only updates for the same task closer together than this are
+# coalesced; the latest values are written by a background flush
+PROGRESS_DEBOUNCE_SEC = 0.2
+
+# Statuses that end a task (SkillExecution and ProjectRun spellings)
+FINAL_STATUSES = {"success", "failed", "cancelled", "completed"}
+
+# task -> (sequence number, coalesced values) of its buffered progress update
+_pending_updates: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+_last_write: Dict[str, float] = {}
+# task -> sequence number of its newest progress update; dropped on a final write
+_latest_update: Dict[str, int] = {}
+_update_seq = itertools.count(1)
+_status_lock = threading.RLock()  # Guards the bookkeeping above; never held during DB I/O
+_flusher: Optional[threading.Thread] = None
+
+# Writes for one task are ordered under its stripe lock; other tasks write in parallel
+_WRITE_STRIPES = 32
+_write_locks = tuple(threading.Lock() for _ in range(_WRITE_STRIPES))
+
+
+def _write_lock_index(task_id: str) -> int:
+    return hash(task_id) % _WRITE_STRIPES
+
+
 def update_task_status(
     task_id: str,
     status: str,
@@ -33,8 +71,143 @@ def update_task_status(
     result_data: Dict = None,
     error_message: str = None,
 ):
-    """Update task status in the database."""
-    db = SessionLocal()
+    """
+    Update task status in the database.
+
+    Progress updates are a single UPDATE on the thread's session; one that
+    follows the previous write for the task within PROGRESS_DEBOUNCE_SEC is
+    coalesced and written by the background flush. Results, errors and
+    final statuses are always written immediately, and a progress write
+    that lands after them (or after a newer update) is skipped.
+    """
+    is_final = bool(result_data or error_message or status.lower() in FINAL_STATUSES)
+
+    with _status_lock:
+        # Anything still pending for this task is superseded by this update
+        _, pending = _pending_updates.pop(task_id, (0, {}))
+
+        if is_final:
+            _last_write.pop(task_id, None)
+            _latest_update.pop(task_id, None)
+        else:
+            values = dict(pending, status=status)
+            if stage:
+                values["current_stage"] = stage
+            if progress is not None:
+                values["progress_percent"] = progress
+
+            seq = next(_update_seq)
+            _latest_update[task_id] = seq
+
+            now = time.monotonic()
+            if now - _last_write.get(task_id, float("-inf")) < PROGRESS_DEBOUNCE_SEC:
+                _pending_updates[task_id] = (seq, values)
+                _ensure_flusher()
+                return
+            _last_write[task_id] = now
+
+    with _write_locks[_write_lock_index(task_id)]:
+        if is_final:
+            _write_final(task_id, status, stage, progress, result_data, error_message)
+        else:
+            _write_progress({task_id: (seq, values)})
+
+
+def flush_pending_updates() -> None:
+    """Write coalesced progress updates now."""
+    with _status_lock:
+        if not _pending_updates:
+            return
+        pending = dict(_pending_updates)
+        _pending_updates.clear()
+
+        now = time.monotonic()
+        for task_id in pending:
+            _last_write[task_id] = now
+
+    # Sorted, so two flushes cannot deadlock; other writers hold one stripe at a time
+    with ExitStack() as stack:
+        for index in sorted({_write_lock_index(task_id) for task_id in pending}):
+            stack.enter_context(_write_locks[index])
+        try:
+            _write_progress(pending)
+        except Exception as e:
+            logger.error(f"Progress flush failed for {len(pending)} tasks: {e}")
+
+
+def _ensure_flusher() -> None:
+    """
+    Start the flush thread if it is not running (caller holds _status_lock).
+
+    Started lazily, so each forked worker gets its own; it exits once
+    nothing is pending and is started again by the next buffered update.
+    """
+    global _flusher
+    if _flusher is None or not _flusher.is_alive():
+        _flusher = threading.Thread(target=_flush_loop, name="task-status-flush", daemon=True)
+        _flusher.start()
+
+
+def _flush_loop() -> None:
+    global _flusher
+    while True:
+        time.sleep(PROGRESS_DEBOUNCE_SEC)
+        flush_pending_updates()
+        with _status_lock:
+            if not _pending_updates:
+                _flusher = None
+                return
+
+
+atexit.register(flush_pending_updates)
+
+
+def _write_progress(updates: Dict[str, Tuple[int, Dict[str, Any]]]) -> None:
+    """
+    UPDATE status columns for several tasks in one transaction, no SELECTs.
+
+    The caller holds the tasks' write locks. Updates superseded by a newer
+    one or by a final status are skipped.
+    """
+    with _status_lock:
+        current = {
+            task_id: values
+            for task_id, (seq, values) in updates.items()
+            if _latest_update.get(task_id) == seq
+        }
+    if not current:
+        return
+
+    db = Session()
+    try:
+        for task_id, values in current.items():
+            rows = db.execute(
+                update(SkillExecution).where(SkillExecution.id == task_id).values(**values)
+            ).rowcount
+            if rows == 0:
+                db.execute(
+                    update(ProjectRun)
+                    .where(ProjectRun.id == task_id)
+                    .values(**dict(values, status=values["status"].upper()))
+                )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        Session.remove()
+
+
+def _write_final(
+    task_id: str,
+    status: str,
+    stage: Optional[str],
+    progress: Optional[int],
+    result_data: Optional[Dict],
+    error_message: Optional[str],
+) -> None:
+    """Write a result, error or final status (needs started_at for timings)."""
+    db = Session()
     try:
         # Try SkillExecution first
         task = db.query(SkillExecution).filter(SkillExecution.id == task_id).first()
@@ -75,6 +248,65 @@ def update_task_status(
                     run.duration_seconds = (run.completed_at - run.started_at).total_seconds()
             db.commit()
 
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        Session.remove()
+
+
+def store_batch_results(task_ids: List[str], results: List[Any]) -> None:
+    """
+    Write the final state of several SkillExecution rows in one transaction.
+
+    Args:
+        task_ids: SkillExecution ids
+        results: One ExecutionResult per task id
+    """
+    completed_at = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        started = dict(
+            db.query(SkillExecution.id, SkillExecution.started_at)
+            .filter(SkillExecution.id.in_(task_ids))
+            .all()
+        )
+
+        rows = []
+        for task_id, result in zip(task_ids, results):
+            if task_id not in started:
+                continue
+
+            row = {"id": task_id, "completed_at": completed_at}
+            if result.status.value == "success":
+                row.update(
+                    status="success",
+                    current_stage="completed",
+                    progress_percent=100,
+                    result_data_json=json.dumps({
+                        "output": {
+                            "output": result.output,
+                            "message": result.message,
+                            "metrics": result.metrics,
+                        },
+                        "artifacts": result.artifacts,
+                    }),
+                )
+            else:
+                row.update(
+                    status="failed",
+                    current_stage="failed",
+                    progress_percent=0,
+                    error_message=result.error or result.message,
+                )
+            if started[task_id]:
+                row["execution_time_ms"] = int(
+                    (completed_at - started[task_id]).total_seconds() * 1000
+                )
+            rows.append(row)
+
+        db.bulk_update_mappings(SkillExecution, rows)
+        db.commit()
     finally:
         db.close()
 
@@ -277,6 +509,118 @@ def execute_skill(
         raise
 
 
+@shared_task(
+    name="tasks.execute_skill_batch",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=10,
+)
+def execute_skill_batch(
+    self,
+    task_ids: List[str],
+    skill_id: str,
+    payloads: List[Dict[str, Any]],
+    project_id: str = None,
+):
+    """
+    Execute one skill over several payloads in a single task.
+
+    Skills that implement execute_many() (e.g. research_local) get the
+    whole batch at once so their LLM calls overlap; other skills run the
+    payloads one after another. Every payload keeps its own task record.
+
+    Args:
+        task_ids: One task identifier per payload
+        skill_id: ID of the skill to execute
+        payloads: Input parameters, one dict per task
+        project_id: Optional project context
+    """
+    logger.info(f"Executing skill {skill_id} for {len(task_ids)} batched tasks")
+
+    try:
+        for task_id in task_ids:
+            update_task_status(task_id, "running", "executing", 10)
+
+        # Get skill from registry
+        from skills.base import skill_registry
+        skill = skill_registry.get(skill_id)
+
+        if not skill:
+            raise ValueError(f"Skill '{skill_id}' not found in registry")
+
+        results = _execute_payloads(skill, payloads)
+        store_batch_results(task_ids, results)
+
+        logger.info(f"Skill {skill_id} completed for {len(task_ids)} batched tasks")
+        return [
+            {"task_id": task_id, "status": result.status.value, "message": result.message}
+            for task_id, result in zip(task_ids, results)
+        ]
+
+    except Exception as e:
+        logger.error(f"Batched skill execution failed for {skill_id}: {e}")
+        for task_id in task_ids:
+            update_task_status(
+                task_id,
+                "failed",
+                "failed",
+                0,
+                error_message=str(e),
+            )
+        raise
+
+
+def _execute_payloads(skill, payloads: List[Dict[str, Any]]) -> List[Any]:
+    """Run a skill over several payloads, batched when the skill supports it."""
+    execute_many = getattr(skill, "execute_many", None)
+    if execute_many is None:
+        return [skill.safe_execute(payload) for payload in payloads]
+
+    from skills.base import ExecutionResult, ExecutionStatus
+
+    results: List[Any] = [None] * len(payloads)
+    valid = []
+    for index, payload in enumerate(payloads):
+        errors = skill.validate_inputs(payload)
+        if errors:
+            results[index] = ExecutionResult(
+                status=ExecutionStatus.FAILED,
+                skill_id=skill.metadata.id,
+                error="; ".join(errors),
+                message="Input validation failed",
+            )
+        else:
+            valid.append(index)
+
+    for index, result in zip(valid, execute_many([payloads[i] for i in valid])):
+        results[index] = result
+    return results
+
+
+def queue_skill_batch(
+    skill_id: str,
+    payloads: List[Dict[str, Any]],
+    project_id: str = None,
+) -> List[str]:
+    """
+    Create task records for a batch of payloads and queue one batch task.
+
+    Returns:
+        The task ids, in payload order
+    """
+    task_ids = [str(uuid.uuid4())[:12] for _ in payloads]
+    for task_id, payload in zip(task_ids, payloads):
+        create_task_record(task_id, skill_id, project_id, payload)
+
+    execute_skill_batch.delay(
+        task_ids=task_ids,
+        skill_id=skill_id,
+        payloads=payloads,
+        project_id=project_id,
+    )
+    return task_ids
+
+
 @shared_task(name="tasks.health_check")
 def health_check():
     """
@@ -316,7 +660,6 @@ def health_check():
 # FALLBACK: Thread-based execution (when Redis unavailable)
 # ============================================================================
 
-import threading
 from queue import Queue
 
 _task_queue: Queue = Queue()
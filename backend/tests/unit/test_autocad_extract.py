@@ -0,0 +1,435 @@
+"""
+AutoCAD Extract Tests
+=====================
+Unit tests for the AutoCAD native skills (no AutoCAD or PowerShell required).
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from skills.native import autocad_extract as acad
+from skills.native.autocad_extract import AutoCADExtractSkill, AutoCADOpenDWGSkill
+
+
+class TestPathConversion:
+    """Test suite for WSL <-> Windows path conversion."""
+
+    @pytest.fixture
+    def wslpath_calls(self, monkeypatch):
+        """Fake wslpath that only knows drive roots; records every call."""
+        calls = []
+        roots = {("-w", "/mnt/c"): "C:\\", ("-u", "C:\\"): "/mnt/c/"}
+
+        class Result:
+            def __init__(self, stdout):
+                self.returncode = 0 if stdout else 1
+                self.stdout = stdout + "\n"
+
+        def fake_run(cmd, **kwargs):
+            calls.append(tuple(cmd[1:]))
+            return Result(roots.get(tuple(cmd[1:]), ""))
+
+        monkeypatch.setattr(acad, "_MOUNT_CACHE", {})
+        monkeypatch.setattr(acad.subprocess, "run", fake_run)
+        return calls
+
+    def test_drive_root_translated_once(self, wslpath_calls):
+        """Test that wslpath runs once per drive root, not per path."""
+        skill = AutoCADExtractSkill()
+
+        assert skill._wsl_to_windows_path("/mnt/c/Projects/a.dwg") == "C:\\Projects\\a.dwg"
+        assert skill._wsl_to_windows_path("/mnt/c/Projects/b.dwg") == "C:\\Projects\\b.dwg"
+        assert skill._windows_to_wsl_path("C:\\Projects\\a.dwg") == "/mnt/c/Projects/a.dwg"
+        assert skill._windows_to_wsl_path("c:\\Projects\\b.dwg") == "/mnt/c/Projects/b.dwg"
+
+        assert wslpath_calls == [("-w", "/mnt/c"), ("-u", "C:\\")]
+
+    def test_manual_fallback(self, wslpath_calls):
+        """Test the manual conversion when wslpath cannot translate the drive."""
+        skill = AutoCADExtractSkill()
+
+        assert skill._wsl_to_windows_path("/mnt/g/Shared/x.dwg") == "G:\\Shared\\x.dwg"
+        assert skill._wsl_to_windows_path("/mnt/g") == "G:\\"
+        assert skill._windows_to_wsl_path("G:\\Shared\\x.dwg") == "/mnt/g/Shared/x.dwg"
+
+
+class TestParseJsonOutput:
+    """Test suite for extracting JSON from PowerShell output."""
+
+    @pytest.fixture
+    def skill(self):
+        """Extract skill instance."""
+        return AutoCADExtractSkill()
+
+    def test_array_between_log_lines(self, skill):
+        """Test that the sprinkler array is found among log lines."""
+        raw = 'Loading acad...\n[{"ID": "S1", "X": 1.5}, {"ID": "S2"}]\nDone.'
+
+        assert skill._parse_json_output(raw) == [{"ID": "S1", "X": 1.5}, {"ID": "S2"}]
+
+    def test_error_object_raises(self, skill):
+        """Test that an error object is surfaced even with braces in the logs."""
+        raw = 'Using {config}\n{"error": true, "message": "DWG locked"}'
+
+        with pytest.raises(ValueError, match="DWG locked"):
+            skill._parse_json_output(raw)
+
+    def test_no_json(self, skill):
+        """Test that output without JSON yields no sprinklers."""
+        assert skill._parse_json_output("nothing here") == []
+
+
+class TestExtractExecute:
+    """Test suite for the extraction flow with the bridge script mocked out."""
+
+    @pytest.fixture
+    def dwg(self, tmp_path):
+        """Empty DWG file in a temp directory."""
+        path = tmp_path / "building.dwg"
+        path.write_bytes(b"")
+        return path
+
+    def test_reads_output_file(self, dwg, monkeypatch):
+        """Test that the JSON file written by the bridge is used instead of stdout."""
+        skill = AutoCADExtractSkill()
+        stdout = "log line\n[1, 2]"
+
+        def fake_run(dwg_path, output_format):
+            dwg.with_name("building_sprinklers.json").write_text('[{"ID": "S1", "FlowLpm": 57}]', encoding="utf-8")
+            return {"success": True, "stdout": stdout}
+
+        monkeypatch.setattr(skill, "_run_powershell", fake_run)
+        monkeypatch.setattr(skill, "_parse_json_output", lambda raw: pytest.fail("stdout was parsed"))
+
+        result = skill.execute({"dwg_path": str(dwg)})
+
+        assert result.status == acad.ExecutionStatus.SUCCESS
+        assert [s["id"] for s in result.output["sprinklers"]] == ["S1"]
+
+    def test_stale_output_file_ignored(self, dwg, monkeypatch):
+        """Test that an output file from an earlier run falls back to stdout."""
+        skill = AutoCADExtractSkill()
+        stale = dwg.with_name("building_sprinklers.json")
+        stale.write_text('[{"ID": "OLD"}]', encoding="utf-8")
+        acad.os.utime(stale, (0, 0))
+
+        monkeypatch.setattr(skill, "_run_powershell", lambda *a: {"success": True, "stdout": '[{"ID": "NEW"}]'})
+
+        result = skill.execute({"dwg_path": str(dwg)})
+
+        assert [s["id"] for s in result.output["sprinklers"]] == ["NEW"]
+
+    @pytest.mark.parametrize("is_wsl", [True, False])
+    def test_windows_path_passed_through(self, dwg, is_wsl, monkeypatch):
+        """Test that a C:\\ path reaches the bridge unchanged and is converted at most once."""
+        skill = AutoCADExtractSkill()
+        converted, ran = [], []
+        monkeypatch.setattr(acad, "_IS_WSL", is_wsl)
+        monkeypatch.setattr(acad.os.path, "exists", lambda p: True)
+        monkeypatch.setattr(skill, "_windows_to_wsl_path", lambda p: converted.append(p) or str(dwg))
+        monkeypatch.setattr(skill, "_wsl_to_windows_path", lambda p: pytest.fail("converted back"))
+        monkeypatch.setattr(skill, "_run_powershell", lambda p, fmt: ran.append(p) or {"success": True, "stdout": "[]"})
+
+        result = skill.execute({"dwg_path": "C:\\Projects\\building.dwg"})
+
+        assert result.status == acad.ExecutionStatus.SUCCESS
+        assert ran == ["C:\\Projects\\building.dwg"]
+        assert converted == (["C:\\Projects\\building.dwg"] if is_wsl else [])
+
+    def test_execute_batch_preserves_order(self, tmp_path, monkeypatch):
+        """Test that batch results come back in input order with progress callbacks."""
+        skill = AutoCADExtractSkill()
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.dwg"
+            path.write_bytes(b"")
+            paths.append(str(path))
+
+        monkeypatch.setattr(
+            skill, "_run_powershell",
+            lambda dwg_path, fmt: {"success": True, "stdout": f'[{{"ID": "{Path(dwg_path).stem}"}}]'}
+        )
+        progress = []
+
+        results = skill.execute_batch(
+            [{"dwg_path": p} for p in paths + [str(tmp_path / "missing.dwg")]],
+            on_result=lambda i, r: progress.append(i)
+        )
+
+        assert [r.output["sprinklers"][0]["id"] for r in results[:3]] == ["a", "b", "c"]
+        assert results[3].status == acad.ExecutionStatus.FAILED
+        assert sorted(progress) == [0, 1, 2, 3]
+
+    def test_batch_serializes_drawings_per_folder(self, tmp_path, monkeypatch):
+        """Test that drawings sharing a folder never extract at the same time."""
+        skill = AutoCADExtractSkill()
+        paths = []
+        for folder, name in (("p1", "a"), ("p1", "b"), ("p2", "c"), ("p1", "d")):
+            path = tmp_path / folder / f"{name}.dwg"
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(b"")
+            paths.append(str(path))
+        active, peaks, lock = {}, {}, threading.Lock()
+
+        def fake_run(dwg_path, fmt):
+            folder = Path(dwg_path).parent.name
+            with lock:
+                active[folder] = active.get(folder, 0) + 1
+                peaks[folder] = max(peaks.get(folder, 0), active[folder])
+                peaks["total"] = max(peaks.get("total", 0), sum(active.values()))
+            time.sleep(0.02)
+            with lock:
+                active[folder] -= 1
+            return {"success": True, "stdout": f'[{{"ID": "{Path(dwg_path).stem}"}}]'}
+
+        monkeypatch.setattr(skill, "_run_powershell", fake_run)
+
+        results = skill.execute_batch([{"dwg_path": p} for p in paths])
+
+        assert [r.output["sprinklers"][0]["id"] for r in results] == ["a", "b", "c", "d"]
+        assert peaks == {"p1": 1, "p2": 1, "total": 2}
+
+    def test_single_session_batch(self, tmp_path, monkeypatch):
+        """Test that a single-session batch starts AutoCAD once and reads each output file."""
+        skill = AutoCADExtractSkill()
+        paths = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.dwg"
+            path.write_bytes(b"")
+            paths.append(str(path))
+        unsafe = tmp_path / "bad$name.dwg"
+        unsafe.write_bytes(b"")
+        sessions = []
+
+        def fake_batch(dwg_paths):
+            sessions.append(dwg_paths)
+            for dwg_path in dwg_paths:
+                Path(dwg_path).with_name(f"{Path(dwg_path).stem}_sprinklers.json").write_text(
+                    f'[{{"ID": "{Path(dwg_path).stem}"}}]', encoding="utf-8"
+                )
+            return {"success": True, "stdout": "[1, 2]"}
+
+        monkeypatch.setattr(skill, "_run_powershell_batch", fake_batch)
+
+        results = skill.execute_batch(
+            [{"dwg_path": p} for p in paths + [str(unsafe)]],
+            single_session=True
+        )
+
+        assert sessions == [paths]
+        assert [r.output["sprinklers"][0]["id"] for r in results[:2]] == ["a", "b"]
+        assert results[2].status == acad.ExecutionStatus.FAILED
+        assert "forbidden character" in results[2].message
+
+    def test_single_session_missing_output_fails(self, tmp_path, monkeypatch):
+        """Test that a drawing without its own output file fails instead of reporting no sprinklers."""
+        skill = AutoCADExtractSkill()
+        paths = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.dwg"
+            path.write_bytes(b"")
+            paths.append(str(path))
+
+        def fake_batch(dwg_paths):
+            # The extractor's default output - shared by every drawing in the folder
+            (tmp_path / "sprinkler_data.json").write_text('[{"ID": "S1"}]', encoding="utf-8")
+            (tmp_path / "a_sprinklers.json").write_text('[{"ID": "A1"}]', encoding="utf-8")
+            return {"success": True, "stdout": '[{"ID": "S1"}]'}
+
+        monkeypatch.setattr(skill, "_run_powershell_batch", fake_batch)
+
+        results = skill.execute_batch([{"dwg_path": p} for p in paths], single_session=True)
+
+        assert [s["id"] for s in results[0].output["sprinklers"]] == ["A1"]
+        assert results[1].status == acad.ExecutionStatus.FAILED
+        assert "No sprinkler output" in results[1].error
+
+    def test_batch_script_opens_each_dwg(self, monkeypatch, tmp_path):
+        """Test the session .scr: one extraction per drawing, each with its own output file."""
+        skill = AutoCADExtractSkill()
+        scripts, commands = [], []
+        monkeypatch.setattr(AutoCADExtractSkill, "TEMP_DIR", tmp_path)
+        monkeypatch.setattr(acad, "_IS_WSL", False)
+
+        class Result:
+            returncode, stdout, stderr = 0, "", ""
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            scripts.append(next(tmp_path.glob("*.scr")).read_text(encoding="utf-8").splitlines())
+            return Result()
+
+        monkeypatch.setattr(acad.subprocess, "run", fake_run)
+
+        result = skill._run_powershell_batch(["C:\\P\\a.dwg", "C:\\P\\b.dwg"])
+
+        assert result["success"]
+        assert len(commands) == 1 and '/i "C:\\P\\a.dwg"' in commands[0][-1]
+        lines = scripts[0]
+        assert lines.count("EXTRACTSPRINKLERS") == 2
+        assert lines[lines.index("_.OPEN") + 1] == '"C:\\P\\b.dwg"'
+        assert '(setq *OUTPUT-FILE* "C:/P/b_sprinklers.json")' in lines
+        assert lines[-1] == "QUIT Y"
+        assert list(tmp_path.glob("*.scr")) == []
+
+    def test_extractor_keeps_preset_output_file(self):
+        """Test that loading the LISP extractor does not reset the *OUTPUT-FILE* the .scr sets first."""
+        source = (AutoCADExtractSkill.SCRIPTS_DIR / AutoCADExtractSkill.LISP_SCRIPT).read_text(encoding="utf-8")
+        top_level = [line for line in source.splitlines() if line.startswith("(setq *OUTPUT-FILE*")]
+
+        assert top_level == []
+        assert "(if (not *OUTPUT-FILE*)" in source
+
+    def test_execute_async_runs_bridge_process(self, dwg, monkeypatch):
+        """Test that the async path awaits the bridge process and parses its stdout."""
+        skill = AutoCADExtractSkill()
+        script = 'print("loading"); print(\'[{"ID": "S1"}, {"ID": "S2"}]\')'
+        monkeypatch.setattr(skill, "_powershell_command", lambda *a: [sys.executable, "-c", script])
+
+        result = asyncio.run(skill.execute_async({"dwg_path": str(dwg)}))
+
+        assert result.status == acad.ExecutionStatus.SUCCESS
+        assert [s["id"] for s in result.output["sprinklers"]] == ["S1", "S2"]
+
+    def test_run_powershell_async_failure(self, monkeypatch):
+        """Test that a failing bridge process reports its exit code and stderr."""
+        skill = AutoCADExtractSkill()
+        script = 'import sys; sys.stderr.write("DWG locked"); sys.exit(3)'
+        monkeypatch.setattr(skill, "_powershell_command", lambda *a: [sys.executable, "-c", script])
+
+        result = asyncio.run(skill._run_powershell_async("C:\\a.dwg", "JSON"))
+
+        assert result == {"success": False, "stdout": "", "stderr": "DWG locked", "returncode": 3}
+
+
+class TestEnrichSprinklerData:
+    """Test suite for sprinkler enrichment."""
+
+    @pytest.fixture
+    def raw(self):
+        """Mixed raw sprinklers, long enough for the vectorized path."""
+        raw = []
+        for i in range(100):
+            spk = {
+                "ID": f"S{i}",
+                "X": i * 1.5, "Y": str(i), "Z": 3,
+                "FlowLpm": [57.0, 80.5, 0][i % 3],
+                "KFactor": [5.6, "8.0", 0][i % 3],
+                "Rotation": 1.5708,
+            }
+            if i % 7 == 0:
+                del spk["ID"], spk["FlowLpm"]
+            raw.append(spk)
+        return raw
+
+    @staticmethod
+    def _strip_timestamps(enriched):
+        for spk in enriched:
+            spk["metadata"].pop("extracted_at")
+        return enriched
+
+    def test_vectorized_matches_loop(self, raw, monkeypatch):
+        """Test that the NumPy path produces the same sprinklers as the Python loop."""
+        skill = AutoCADExtractSkill()
+        vectorized = self._strip_timestamps(skill._enrich_sprinkler_data(raw))
+
+        monkeypatch.setattr(acad, "ENRICH_VECTORIZE_THRESHOLD", len(raw) + 1)
+        looped = self._strip_timestamps(skill._enrich_sprinkler_data(raw))
+
+        assert vectorized == looped
+        assert vectorized[0]["id"] == "SPK-1"
+        assert vectorized[1]["properties"]["min_pressure_psi"] == round((round(80.5 * 0.264172, 2) / 8.0) ** 2, 2)
+        assert vectorized[2]["properties"]["min_pressure_psi"] == 7.0
+        assert vectorized[1]["rotation_deg"] == pytest.approx(90.0, abs=1e-3)
+
+
+class TestAutoCADOpenDWG:
+    """Test suite for locating AutoCAD."""
+
+    @pytest.fixture
+    def skill(self):
+        """Open-DWG skill instance."""
+        return AutoCADOpenDWGSkill()
+
+    @pytest.fixture(autouse=True)
+    def mounted_c(self, monkeypatch):
+        """C: resolves to a cached mount root, so no wslpath call is made."""
+        monkeypatch.setitem(acad._MOUNT_CACHE, "C:", "/c/")
+
+    def test_local_path_uses_mount_root(self, skill, monkeypatch):
+        """Test that the install path follows the drive's real mount root."""
+        monkeypatch.setattr(acad.os, "name", "posix")
+
+        assert skill._local_path(AutoCADOpenDWGSkill.AUTOCAD_PATHS[0]) == \
+            "/c/Program Files/Autodesk/AutoCAD 2026/acad.exe"
+
+    def test_find_autocad_without_subprocess(self, skill, monkeypatch):
+        """Test that a mounted install is found with no PowerShell spawn."""
+        spawned = []
+        monkeypatch.setattr(acad.os, "name", "posix")
+        monkeypatch.setattr(acad.os.path, "exists", lambda p: p.endswith("AutoCAD 2025/acad.exe"))
+        monkeypatch.setattr(acad.subprocess, "run", lambda *a, **k: spawned.append(a))
+
+        assert skill._find_autocad() == AutoCADOpenDWGSkill.AUTOCAD_PATHS[1]
+        assert spawned == []
+
+    def test_find_autocad_single_probe(self, skill, monkeypatch):
+        """Test that an unmounted drive is probed with exactly one PowerShell call."""
+        spawned = []
+
+        class Result:
+            stdout = AutoCADOpenDWGSkill.AUTOCAD_PATHS[0] + "\r\n"
+
+        def fake_run(cmd, **kwargs):
+            spawned.append(cmd)
+            return Result()
+
+        monkeypatch.setattr(acad.os, "name", "posix")
+        monkeypatch.setattr(acad.os.path, "exists", lambda p: False)
+        monkeypatch.setattr(acad.subprocess, "run", fake_run)
+
+        assert skill._find_autocad() == AutoCADOpenDWGSkill.AUTOCAD_PATHS[0]
+        assert len(spawned) == 1
+
+    def test_open_launches_acad_directly(self, skill, monkeypatch):
+        """Test that AutoCAD is started as its own process, not through a shell."""
+        launched = []
+        monkeypatch.setattr(acad.os, "name", "posix")
+        monkeypatch.setattr(acad.os.path, "exists", lambda p: True)
+        monkeypatch.setattr(skill, "_find_autocad", lambda: AutoCADOpenDWGSkill.AUTOCAD_PATHS[0])
+        monkeypatch.setattr(acad.subprocess, "Popen", lambda cmd, **kwargs: launched.append(cmd))
+
+        result = skill.execute({"dwg_path": "C:\\Projects\\building.dwg"})
+
+        assert result.status == acad.ExecutionStatus.SUCCESS
+        assert launched == [["/c/Program Files/Autodesk/AutoCAD 2026/acad.exe", "C:\\Projects\\building.dwg"]]
+
+    def test_open_unmounted_install_through_windows(self, skill, monkeypatch):
+        """Test that an install found only by the PowerShell probe is started by Windows."""
+        launched = []
+
+        class Result:
+            stdout = AutoCADOpenDWGSkill.AUTOCAD_PATHS[0] + "\r\n"
+
+        monkeypatch.setattr(acad.os, "name", "posix")
+        monkeypatch.setattr(acad.os.path, "exists", lambda p: False)
+        monkeypatch.setattr(acad.subprocess, "run", lambda cmd, **kwargs: Result())
+        monkeypatch.setattr(acad.subprocess, "Popen", lambda cmd, **kwargs: launched.append(cmd))
+
+        result = skill.execute({"dwg_path": "C:\\Projects\\building.dwg"})
+
+        assert result.status == acad.ExecutionStatus.SUCCESS
+        assert len(launched) == 1
+        assert launched[0][:len(acad.POWERSHELL_CMD)] == list(acad.POWERSHELL_CMD)
+        assert launched[0][-1] == (
+            f"Start-Process -FilePath '{AutoCADOpenDWGSkill.AUTOCAD_PATHS[0]}' "
+            "-ArgumentList '\"C:\\Projects\\building.dwg\"'"
+        )
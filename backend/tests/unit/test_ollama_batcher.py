@@ -0,0 +1,53 @@
+"""
+Ollama Batcher Tests
+====================
+Unit tests for concurrent Ollama generation (HTTP mocked out).
+"""
+
+import asyncio
+import json
+import sys
+from functools import partial
+from pathlib import Path
+
+import httpx
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from services import ollama_batcher as batcher
+
+
+class TestGenerateMany:
+    """Test suite for generate_many."""
+
+    def test_bounded_concurrency_and_order(self, monkeypatch):
+        """Test that requests overlap up to max_parallel and responses keep input order."""
+        active, peak, bodies = 0, 0, []
+
+        async def handler(request):
+            nonlocal active, peak
+            body = json.loads(request.content)
+            bodies.append(body)
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if body["prompt"] == "bad":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"response": body["prompt"].upper()})
+
+        monkeypatch.setattr(
+            batcher.httpx, "AsyncClient",
+            partial(httpx.AsyncClient, transport=httpx.MockTransport(handler))
+        )
+
+        prompts = ["a", "b", "bad", "c", "d"]
+        responses = batcher.generate_many(
+            [{"prompt": p, "temperature": 0.2, "max_tokens": 500} for p in prompts], max_parallel=2
+        )
+
+        assert responses[:2] == ["A", "B"] and responses[3:] == ["C", "D"]
+        assert isinstance(responses[2], httpx.HTTPStatusError)
+        assert peak == 2
+        assert all(b["options"]["num_predict"] == 500 and not b["stream"] for b in bodies)
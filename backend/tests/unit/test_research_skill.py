@@ -0,0 +1,141 @@
+"""
+Research Skill Tests
+====================
+Unit tests for the local research skill (LLM clients mocked out).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from skills import research_skill as research
+from skills.base import ExecutionStatus
+from skills.research_skill import ResearchSkill
+
+
+class FakeOllama:
+    """Ollama client stand-in that counts generate() calls."""
+
+    def __init__(self, available=True):
+        self.available = available
+        self.calls = []
+
+    def is_available(self):
+        return self.available
+
+    def generate(self, **kwargs):
+        self.calls.append(kwargs)
+        return f"answer {len(self.calls)}"
+
+
+class TestResponseCache:
+    """Test suite for the research response cache."""
+
+    @pytest.fixture
+    def ollama(self, monkeypatch):
+        """Fresh cache and a fake local LLM."""
+        client = FakeOllama()
+        monkeypatch.setattr(research, "_response_cache", research.OrderedDict())
+        monkeypatch.setattr(research, "get_ollama_client", lambda: client)
+        return client
+
+    def test_repeat_query_served_from_cache(self, ollama):
+        """Test that an identical request skips the LLM."""
+        skill = ResearchSkill()
+        inputs = {"query": "NFPA 13 spacing", "output_format": "bullets"}
+
+        first = skill.execute(inputs)
+        second = skill.execute(inputs)
+
+        assert len(ollama.calls) == 1
+        assert first.status == second.status == ExecutionStatus.SUCCESS
+        assert second.output["raw_response"] == first.output["raw_response"] == "answer 1"
+        assert second.metrics["provider"] == "cache"
+        assert second.metrics["model"] == research.LOCAL_MODEL
+
+    def test_different_request_misses(self, ollama):
+        """Test that the length setting and query are part of the key."""
+        skill = ResearchSkill()
+
+        skill.execute({"query": "NFPA 13 spacing"})
+        skill.execute({"query": "NFPA 13 spacing", "max_length": "long"})
+        skill.execute({"query": "NFPA 14 standpipes"})
+
+        assert len(ollama.calls) == 3
+
+    def test_lru_eviction(self, ollama, monkeypatch):
+        """Test that the cache stays bounded and drops the oldest entry."""
+        monkeypatch.setattr(research, "RESPONSE_CACHE_MAX_ENTRIES", 2)
+        skill = ResearchSkill()
+
+        for query in ("q1", "q2", "q3", "q1"):
+            skill.execute({"query": query})
+
+        assert len(research._response_cache) == 2
+        assert len(ollama.calls) == 4
+
+    def test_expired_entry_refetched(self, ollama, monkeypatch):
+        """Test that entries older than the TTL are not served."""
+        monkeypatch.setattr(research, "RESPONSE_CACHE_TTL_SEC", -1)
+        skill = ResearchSkill()
+
+        skill.execute({"query": "NFPA 13 spacing"})
+        result = skill.execute({"query": "NFPA 13 spacing"})
+
+        assert len(ollama.calls) == 2
+        assert result.metrics["provider"] == "ollama"
+
+
+class TestExecuteMany:
+    """Test suite for multi-query research."""
+
+    @pytest.fixture
+    def batches(self, monkeypatch):
+        """Fresh cache, an available local LLM and a recording generate_many."""
+        batches = []
+
+        def fake_generate_many(batch):
+            batches.append(batch)
+            return [
+                RuntimeError("model unloaded") if "fail" in request["prompt"] else f"answer {i}"
+                for i, request in enumerate(batch)
+            ]
+
+        monkeypatch.setattr(research, "_response_cache", research.OrderedDict())
+        monkeypatch.setattr(research, "get_ollama_client", lambda: FakeOllama())
+        monkeypatch.setattr(research, "generate_many", fake_generate_many)
+        return batches
+
+    def test_misses_sent_in_one_batch(self, batches):
+        """Test that uncached queries share one batch and results keep input order."""
+        skill = ResearchSkill()
+
+        results = skill.execute_many([
+            {"query": "NFPA 13 spacing"},
+            {"query": ""},
+            {"query": "please fail"},
+            {"query": "K-factor"},
+        ])
+
+        assert len(batches) == 1 and len(batches[0]) == 3
+        assert [r.status for r in results] == [
+            ExecutionStatus.SUCCESS, ExecutionStatus.FAILED, ExecutionStatus.FAILED, ExecutionStatus.SUCCESS
+        ]
+        assert results[0].output["raw_response"] == "answer 0"
+        assert results[2].error == "model unloaded"
+        assert results[3].output["raw_response"] == "answer 2"
+
+    def test_cached_queries_not_resent(self, batches):
+        """Test that answers from an earlier batch are served from the cache."""
+        skill = ResearchSkill()
+        skill.execute_many([{"query": "NFPA 13 spacing"}])
+
+        results = skill.execute_many([{"query": "NFPA 13 spacing"}, {"query": "K-factor"}])
+
+        assert [len(batch) for batch in batches] == [1, 1]
+        assert results[0].metrics["provider"] == "cache"
+        assert results[1].metrics["provider"] == "ollama"
@@ -0,0 +1,93 @@
+"""
+Revit Autopilot Tests
+=====================
+Unit tests for the Revit Autopilot skill wrapper (orchestrator mocked out).
+"""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from services import orchestrator
+from skills.base import ExecutionStatus
+from skills.native.revit_autopilot import RevitAutopilotSkill
+
+
+class TestRevitAutopilotAsync:
+    """Test suite for the async entry point."""
+
+    def test_concurrent_runs_are_bounded(self, monkeypatch):
+        """Test that at most MAX_CONCURRENT_RUNS pipelines run at once."""
+        active, peak = 0, 0
+
+        async def fake_run(project_id, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"project_id": project_id, "traffic_light": {"status": "GREEN"}}
+
+        monkeypatch.setattr(orchestrator, "run_engineering_process", fake_run)
+        skill = RevitAutopilotSkill()
+
+        async def run_all():
+            return await asyncio.gather(*(skill.execute_async({"project_id": f"P{i}"}) for i in range(5)))
+
+        results = asyncio.run(run_all())
+
+        assert [r.metrics["project_id"] for r in results] == [f"P{i}" for i in range(5)]
+        assert all(r.status == ExecutionStatus.SUCCESS for r in results)
+        assert peak == RevitAutopilotSkill.MAX_CONCURRENT_RUNS
+
+    @pytest.fixture
+    def bridged(self, monkeypatch):
+        """Record the projects that reach the Revit bridge; skip mode-independent stages."""
+        bridged = []
+        real_sleep = asyncio.sleep
+        simulate = orchestrator.orchestrator._simulate_geometry
+
+        def get_geometry(project_id):
+            bridged.append(project_id)
+            return simulate(project_id)
+
+        monkeypatch.setitem(sys.modules, "scripts.bridge_revit", types.SimpleNamespace(get_geometry=get_geometry))
+        monkeypatch.setattr(orchestrator.asyncio, "sleep", lambda delay: real_sleep(0))
+        monkeypatch.setattr(orchestrator.orchestrator, "SIMULATION_MODE", True)
+
+        async def skipped(*args):
+            return {}
+
+        # Only extraction and LOD 500 generation depend on the mode
+        for stage in ("_voxelize", "_plan_routes", "_calculate_hydraulics", "_validate_nfpa"):
+            monkeypatch.setattr(orchestrator.orchestrator, stage, skipped)
+        return bridged
+
+    def test_mixed_mock_and_live_runs_isolated(self, bridged):
+        """Test that concurrent runs keep their own mock_mode (only live runs hit the bridge)."""
+        skill = RevitAutopilotSkill()
+
+        async def run_all():
+            return await asyncio.gather(*(
+                skill.execute_async({"project_id": f"P{i}", "mock_mode": i % 2 == 0}) for i in range(4)
+            ))
+
+        results = asyncio.run(run_all())
+
+        assert [r.output["status"] for r in results] == ["completed"] * 4
+        assert sorted(bridged) == ["P1", "P3"]
+        assert orchestrator.orchestrator.SIMULATION_MODE is True
+
+    def test_sync_run_keeps_default_mode(self, bridged):
+        """Test that a live sync run does not change the orchestrator's default mode."""
+        result = orchestrator.run_engineering_process_sync("P9", mock_mode=False)
+
+        assert result["status"] == "completed"
+        assert bridged == ["P9"]
+        assert orchestrator.orchestrator.SIMULATION_MODE is True
@@ -0,0 +1,205 @@
+"""
+Celery Task Tests
+=================
+Unit tests for the task bodies (run in-process against an in-memory database).
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import tasks
+from models import Base, ProjectRun, SkillExecution
+from skills.base import ExecutionResult, ExecutionStatus, SkillMetadata, skill_registry
+
+ensure_flusher = tasks._ensure_flusher
+
+
+class BatchSkill:
+    """Skill stand-in with execute_many(); fails payloads missing 'query'."""
+
+    metadata = SkillMetadata(id="batch_stub", name="Batch Stub", description="Test stub")
+
+    def __init__(self):
+        self.batches = []
+
+    def validate_inputs(self, payload):
+        return [] if "query" in payload else ["Missing required field: query"]
+
+    def execute_many(self, payloads):
+        self.batches.append(payloads)
+        return [
+            ExecutionResult(status=ExecutionStatus.SUCCESS, skill_id="batch_stub", output={"answer": p["query"]})
+            for p in payloads
+        ]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """In-memory database wired into the task module's sessions."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(tasks, "SessionLocal", session_factory)
+    monkeypatch.setattr(tasks, "Session", scoped_session(session_factory))
+    return session_factory
+
+
+def _rows(db):
+    session = db()
+    rows = {row.id: row for row in session.query(SkillExecution).all()}
+    session.close()
+    return rows
+
+
+class TestUpdateTaskStatus:
+    """Test suite for status updates and progress coalescing."""
+
+    @pytest.fixture(autouse=True)
+    def no_flush_thread(self, monkeypatch):
+        """Fresh debounce state; flushes are triggered by the tests."""
+        monkeypatch.setattr(tasks, "_pending_updates", {})
+        monkeypatch.setattr(tasks, "_last_write", {})
+        monkeypatch.setattr(tasks, "_latest_update", {})
+        monkeypatch.setattr(tasks, "_ensure_flusher", lambda: None)
+
+    def test_rapid_progress_coalesced(self, db):
+        """Test that a burst of progress updates writes the first and the latest."""
+        tasks.create_task_record("T1", "stub")
+
+        tasks.update_task_status("T1", "running", "starting", 5)
+        tasks.update_task_status("T1", "running", "executing", 10)
+        tasks.update_task_status("T1", "running", None, 20)
+
+        assert _rows(db)["T1"].progress_percent == 5
+        assert tasks._pending_updates["T1"][1] == {
+            "status": "running", "current_stage": "executing", "progress_percent": 20
+        }
+
+        tasks.flush_pending_updates()
+
+        row = _rows(db)["T1"]
+        assert (row.current_stage, row.progress_percent) == ("executing", 20)
+        assert tasks._pending_updates == {}
+
+    def test_flush_thread_exits_when_idle(self, db, monkeypatch):
+        """Test that the flush thread stops once nothing is pending and restarts on demand."""
+        monkeypatch.setattr(tasks, "_ensure_flusher", ensure_flusher)
+        monkeypatch.setattr(tasks, "_flusher", None)
+        monkeypatch.setattr(tasks, "PROGRESS_DEBOUNCE_SEC", 0.01)
+        tasks.create_task_record("T1", "stub")
+
+        for progress in (10, 20):
+            # Written just now, so this update is buffered for the flusher
+            tasks._last_write["T1"] = float("inf")
+            with tasks._status_lock:  # Keeps the flusher from exiting before it is read
+                tasks.update_task_status("T1", "running", "executing", progress)
+                flusher = tasks._flusher
+            assert flusher is not None
+
+            flusher.join(timeout=5)
+
+            assert not flusher.is_alive()
+            assert tasks._flusher is None
+            assert _rows(db)["T1"].progress_percent == progress
+
+    def test_final_update_supersedes_pending(self, db):
+        """Test that a final status is written at once and drops buffered progress."""
+        tasks.create_task_record("T1", "stub")
+
+        tasks.update_task_status("T1", "running", "starting", 5)
+        tasks.update_task_status("T1", "running", "executing", 10)
+        tasks.update_task_status("T1", "success", "completed", 100, result_data={"ok": True})
+        tasks.flush_pending_updates()
+
+        row = _rows(db)["T1"]
+        assert (row.status, row.progress_percent) == ("success", 100)
+        assert row.get_result_data() == {"ok": True}
+        assert row.completed_at is not None
+
+    def test_flush_racing_final_update_skipped(self, db):
+        """Test that progress snapshotted by a flush does not overwrite a final status written meanwhile."""
+        tasks.create_task_record("T1", "stub")
+        tasks.update_task_status("T1", "running", "starting", 5)
+        tasks.update_task_status("T1", "running", "executing", 50)
+
+        # The flusher has taken its snapshot when the final update arrives
+        snapshot = dict(tasks._pending_updates)
+        tasks._pending_updates.clear()
+        tasks.update_task_status("T1", "success", "completed", 100, result_data={"ok": True})
+        tasks._write_progress(snapshot)
+
+        row = _rows(db)["T1"]
+        assert (row.status, row.progress_percent) == ("success", 100)
+
+    def test_status_lock_released_during_write(self, db, monkeypatch):
+        """Test that other threads can update bookkeeping while a status write runs."""
+        tasks.create_task_record("T1", "stub")
+        acquired = []
+        write_final = tasks._write_final
+
+        def probe():
+            if tasks._status_lock.acquire(timeout=1):
+                acquired.append(True)
+                tasks._status_lock.release()
+
+        def probing_write_final(*args):
+            thread = threading.Thread(target=probe)
+            thread.start()
+            thread.join()
+            write_final(*args)
+
+        monkeypatch.setattr(tasks, "_write_final", probing_write_final)
+        tasks.update_task_status("T1", "success", "completed", 100)
+
+        assert acquired == [True]
+        assert _rows(db)["T1"].status == "success"
+
+    def test_project_run_fallback(self, db):
+        """Test that ids not in skill_executions update the matching project run."""
+        session = db()
+        session.add(ProjectRun(id="R1", project_id="P1"))
+        session.commit()
+        session.close()
+
+        tasks.update_task_status("R1", "processing", "executing", 10)
+
+        session = db()
+        run = session.get(ProjectRun, "R1")
+        assert (run.status, run.progress_percent) == ("PROCESSING", 10)
+        session.close()
+
+
+class TestExecuteSkillBatch:
+    """Test suite for the batched skill task."""
+
+    def test_batch_runs_once_and_stores_each_result(self, db, monkeypatch):
+        """Test that valid payloads share one execute_many call and every record is updated."""
+        skill = BatchSkill()
+        monkeypatch.setattr(skill_registry, "get", lambda skill_id: skill)
+        payloads = [{"query": "a"}, {"bad": True}, {"query": "c"}]
+        task_ids = ["T1", "T2", "T3"]
+        for task_id, payload in zip(task_ids, payloads):
+            tasks.create_task_record(task_id, "batch_stub", input_params=payload)
+
+        summary = tasks.execute_skill_batch.run(task_ids, "batch_stub", payloads)
+
+        assert skill.batches == [[{"query": "a"}, {"query": "c"}]]
+        assert [s["status"] for s in summary] == ["success", "failed", "success"]
+
+        rows = _rows(db)
+        assert rows["T1"].status == "success" and rows["T1"].progress_percent == 100
+        assert rows["T1"].get_result_data()["output"]["output"] == {"answer": "a"}
+        assert rows["T2"].status == "failed"
+        assert "query" in rows["T2"].error_message
+        assert rows["T3"].completed_at is not None
@@ -0,0 +1,504 @@
+"""
+Virtual Senior Engineer Tests
+=============================
+Unit tests for Skill #601 project memory and helpers.
+"""
+
+import asyncio
+import gc
+import sys
+import threading
+import weakref
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from services import ai_engine
+from skills.library import virtual_senior_engineer as vse
+from skills.library.virtual_senior_engineer import (
+    ActionItemsTracker,
+    CalendarIntegration,
+    EnhancedDeclarationHandler,
+    MeetingPrepGenerator,
+    NotificationHub,
+    ProjectMemory,
+    SeniorEngineerProfile,
+    Skill_VirtualSeniorEngineer,
+)
+
+
+class TestProjectMemory:
+    """Test suite for project search."""
+
+    @pytest.fixture
+    def memory(self):
+        """Fresh mock-backed project memory."""
+        return ProjectMemory()
+
+    @pytest.mark.parametrize("query, expected", [
+        ("קניון נופים", "NOF-2024"),
+        ("ארלוזורוב 20", "ARL-20-2024"),
+        ("ארלוזורוב 20, תל אביב", "ARL-20-2024"),
+        ("פגישה על קניון נופים מחר", "NOF-2024"),
+        ("נופים", "NOF-2024"),
+    ])
+    def test_search_project(self, memory, query, expected):
+        """Test exact, address and partial project matches."""
+        project = memory.search_project(query)
+
+        assert project is not None
+        assert project["project_id"] == expected
+
+    def test_search_project_not_found(self, memory):
+        """Test that an unknown query returns None."""
+        assert memory.search_project("פרויקט לא קיים") is None
+
+    def test_get_project_exact_only(self, memory):
+        """Test that get_project matches exact names and getters still accept queries."""
+        assert memory.get_project("קניון נופים")["project_id"] == "NOF-2024"
+        assert memory.get_project("נופים") is None
+        assert memory.get_open_issues("נופים") == memory.get_open_issues("קניון נופים")
+
+    def test_find_projects_in_text(self, memory):
+        """Test that all mentioned projects are found once, in text order."""
+        text = "פגישה על ארלוזורוב 20 ואז קניון נופים ושוב ארלוזורוב 20"
+
+        assert memory.find_projects(text) == ["ארלוזורוב 20", "קניון נופים"]
+        assert memory.find_projects("ישיבת צוות") == []
+
+    def test_blocking_issues(self, memory):
+        """Test that only keyword-matching open issues are blocking."""
+        assert memory.get_blocking_issues("ארלוזורוב 20") == ["ברז ריקון חסר במאגר שריפה"]
+        assert memory.get_blocking_issues("פרויקט לא קיים") == []
+
+    def test_search_cache_invalidated_on_activity(self, memory):
+        """Test that logging activity drops cached search results."""
+        first = memory.search_project("קניון נופים")
+        assert memory.search_project("קניון נופים") is first
+
+        memory.log_activity("קניון נופים", "note", "test")
+
+        assert memory.search_project("קניון נופים") is not first
+
+    def test_search_cache_bounded(self, memory, monkeypatch):
+        """Test that distinct queries, misses included, cannot grow the search cache without limit."""
+        monkeypatch.setattr(vse, "SEARCH_CACHE_MAX_ENTRIES", 2)
+        first = memory.search_project("קניון נופים")
+
+        for query in ("פרויקט 1", "קניון נופים", "פרויקט 2", "פרויקט 3"):
+            memory.search_project(query)
+
+        assert list(memory._search_cache) == ["פרויקט 2", "פרויקט 3"]
+        assert memory.search_project("קניון נופים") is not first
+
+    def test_project_json_cached_per_project(self, memory):
+        """Test that different queries for one project share a single serialized entry."""
+        by_name = memory.project_json("קניון נופים")
+
+        assert memory.project_json("פגישה על קניון נופים מחר") is by_name
+        assert memory.project_json("פרויקט לא קיים") is None
+        assert list(memory._json_cache) == ["קניון נופים"]
+
+    def test_activity_written_in_batches(self, memory, monkeypatch):
+        """Test that a burst of logged activity is written in one background batch."""
+        batches = []
+        monkeypatch.setattr(memory, "_write_activities", batches.append)
+
+        for i in range(3):
+            memory.log_activity("קניון נופים", "note", f"test {i}")
+        memory.flush()
+
+        assert [[a["description"] for a in batch] for batch in batches] == [["test 0", "test 1", "test 2"]]
+
+    def test_idle_writer_exits(self, monkeypatch):
+        """Test that the writer thread stops when idle and no longer pins the memory."""
+        monkeypatch.setattr(vse, "ACTIVITY_WRITER_IDLE_SEC", 0.01)
+        memory = ProjectMemory()
+        memory._write_activities = lambda activities: None
+
+        memory.log_activity("קניון נופים", "note", "test")
+        writer = memory._writer
+        memory.flush()
+        writer.join(timeout=1)
+
+        assert not writer.is_alive()
+        assert memory._writer is None
+
+        ref = weakref.ref(memory)
+        del memory
+        gc.collect()
+        assert ref() is None
+
+
+class TestMeetingPrepGenerator:
+    """Test suite for meeting prep generation."""
+
+    @pytest.fixture
+    def generator(self):
+        """Prep generator over mock project memory."""
+        return MeetingPrepGenerator(ProjectMemory())
+
+    @pytest.fixture
+    def meetings(self):
+        """Two meetings on different projects."""
+        when = datetime(2025, 1, 1, 10, 0)
+        return [
+            {"project_name": "קניון נופים", "meeting_title": "A", "participants": ["מיכל כהן"], "meeting_time": when},
+            {"project_name": "ארלוזורוב 20", "meeting_title": "B", "participants": [], "meeting_time": when},
+        ]
+
+    def test_batch_splits_marked_response(self, generator, meetings, monkeypatch):
+        """Test that one LLM call serves every meeting in the batch."""
+        calls = []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return "===[1]===\nמסמך נופים\n===[2]===\nמסמך ארלוזורוב\n"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        preps = generator.generate_batch(meetings)
+
+        assert len(calls) == 1
+        assert [p["document"] for p in preps] == ["מסמך נופים", "מסמך ארלוזורוב"]
+        assert preps[0]["project"]["project_id"] == "NOF-2024"
+
+    def test_batch_reuses_cached_documents(self, generator, meetings, monkeypatch):
+        """Test that a repeated batch is served from the prep cache and streams once."""
+        calls, chunks = [], []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return "===[1]===\nמסמך נופים\n===[2]===\nמסמך ארלוזורוב\n"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        streamed = [dict(m, on_chunk=chunks.append) for m in meetings]
+        first = generator.generate_batch(streamed)
+        second = generator.generate_batch(meetings)
+
+        assert len(calls) == 1
+        assert chunks == ["מסמך נופים", "מסמך ארלוזורוב"]
+        assert [p["document"] for p in second] == [p["document"] for p in first]
+
+    def test_batch_falls_back_per_meeting(self, generator, meetings, monkeypatch):
+        """Test that an unparsable batch response is retried per meeting."""
+        calls = []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return "מסמך"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        preps = generator.generate_batch(meetings)
+
+        assert len(calls) == 3
+        assert [p["document"] for p in preps] == ["מסמך", "מסמך"]
+
+    def test_generate_many_preserves_order(self, generator, meetings, monkeypatch):
+        """Test that concurrent prep returns one result per meeting, in order."""
+        monkeypatch.setattr(ai_engine, "ask_ai", lambda prompt, **kwargs: prompt)
+        preps = asyncio.run(generator.generate_many(meetings))
+
+        assert [p["project"]["name"] for p in preps] == ["קניון נופים", "ארלוזורוב 20"]
+
+    def test_prep_document_cached_until_activity(self, generator, meetings, monkeypatch):
+        """Test that repeat preps reuse the LLM document until the project logs activity."""
+        calls = []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return f"מסמך {len(calls)}"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        first = generator.generate(**meetings[0])
+        second = generator.generate(**dict(meetings[0], meeting_title="פגישה חוזרת"))
+        generator.memory.log_activity("ארלוזורוב 20", "note", "other project")
+        third = generator.generate(**meetings[0])
+        generator.memory.log_activity("קניון נופים", "note", "test")
+        fourth = generator.generate(**meetings[0])
+
+        assert first["document"] == second["document"] == third["document"] == "מסמך 1"
+        assert fourth["document"] == "מסמך 2"
+
+    def test_prep_cache_bounded(self, generator, meetings, monkeypatch):
+        """Test that the prep cache stays bounded and drops the least recently used entry."""
+        calls = []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return f"מסמך {len(calls)}"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        monkeypatch.setattr(vse, "PREP_CACHE_MAX_ENTRIES", 2)
+        for participants in (["א"], ["ב"], ["א"], ["ג"], ["א"], ["ב"]):
+            generator.generate(**dict(meetings[0], participants=participants))
+
+        assert len(generator._prep_cache) == 2
+        assert len(calls) == 4
+
+    def test_json_answer_rendered_locally(self, generator, meetings, monkeypatch):
+        """Test that the LLM's JSON sections are rendered into the prep document."""
+        answer = '```json\n{"goal": "סגירת לו\\"ז", "risks": ["קנס"], "wants": "אישור כב\\"א", "concessions": []}\n```'
+        monkeypatch.setattr(ai_engine, "ask_ai", lambda prompt, **kwargs: answer)
+
+        document = generator.generate(**meetings[0])["document"]
+
+        assert "1. מטרת הפגישה:\n   סגירת לו\"ז" in document
+        assert "   • קנס" in document
+        assert "   • אישור כב\"א" in document
+        assert "דחיית תשלום דמי הקמה" in document  # default concessions
+
+    def test_unknown_project_skips_llm(self, generator, meetings, monkeypatch):
+        """Test that an unknown project is rendered locally without an LLM call."""
+        calls = []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return "===[1]===\n{}\n===[2]===\n{}"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        unknown = dict(meetings[0], project_name="פרויקט לא קיים")
+
+        prep = generator.generate(**unknown)
+        batch = generator.generate_batch([unknown, meetings[0], meetings[1]])
+
+        assert len(calls) == 1
+        assert "פרויקט לא קיים" not in calls[0]
+        assert "מסמך הכנה לפגישה - פרויקט לא קיים" in prep["document"]
+        assert [p["project"]["name"] for p in batch] == ["פרויקט לא קיים", "קניון נופים", "ארלוזורוב 20"]
+
+
+class TestCalendarIntegration:
+    """Test suite for calendar event parsing."""
+
+    @pytest.mark.parametrize("event, expected", [
+        ({"project_name": "קניון נופים", "title": "ארלוזורוב 20"}, "קניון נופים"),
+        ({"title": "סיור באתר ארלוזורוב 20", "location": ""}, "ארלוזורוב 20"),
+        ({"title": "פגישה", "location": "קניון נופים, רמת גן"}, "קניון נופים"),
+        ({"title": "ישיבת צוות", "location": "משרד"}, None),
+    ])
+    def test_extract_project_from_event(self, event, expected):
+        """Test explicit, title and location based project extraction."""
+        assert CalendarIntegration().extract_project_from_event(event) == expected
+
+    def test_upcoming_meetings_cached(self, monkeypatch):
+        """Test that repeat polls inside the TTL reuse the last fetch."""
+        calendar = CalendarIntegration()
+        first = calendar.get_upcoming_meetings(hours_ahead=2)
+
+        assert calendar.get_upcoming_meetings(hours_ahead=2) is first
+        assert calendar.get_upcoming_meetings(hours_ahead=24) is not first
+
+        monkeypatch.setattr(vse, "CALENDAR_CACHE_TTL_SEC", 0)
+        assert calendar.get_upcoming_meetings(hours_ahead=2) is not first
+
+
+class TestNotificationHub:
+    """Test suite for multi-channel notifications."""
+
+    def test_failing_channel_does_not_block_others(self, monkeypatch):
+        """Test that one channel error is reported without losing the rest."""
+        hub = NotificationHub(SeniorEngineerProfile())
+
+        def broken_email(subject, body):
+            raise ConnectionError("smtp down")
+
+        monkeypatch.setattr(hub, "_send_email", broken_email)
+        results = hub.send_meeting_prep("מסמך", "פגישה", ["command_center", "email", "whatsapp"])
+
+        assert results == {"command_center": True, "email": False, "whatsapp": True}
+
+    def test_slow_channel_times_out(self, monkeypatch):
+        """Test that a channel exceeding the timeout is reported as failed."""
+        hub = NotificationHub(SeniorEngineerProfile())
+        release = threading.Event()
+
+        def slow_email(subject, body):
+            release.wait(5)
+            return True
+
+        monkeypatch.setattr(hub, "_send_email", slow_email)
+        monkeypatch.setattr(vse, "NOTIFY_TIMEOUT_SEC", 0.05)
+        results = hub.send_meeting_prep("מסמך", "פגישה", ["command_center", "email"])
+        release.set()
+
+        assert results == {"command_center": True, "email": False}
+
+
+class TestMeetingPrepStreaming:
+    """Test suite for streamed meeting prep."""
+
+    @pytest.fixture
+    def meeting(self):
+        """Meeting on a project with open issues."""
+        return {
+            "project_name": "קניון נופים",
+            "meeting_title": "פגישה",
+            "participants": [],
+            "meeting_time": datetime(2025, 1, 1, 10, 0),
+        }
+
+    def test_rendered_document_sent_once(self, meeting, monkeypatch):
+        """Test that the callback gets the rendered document, never the raw JSON answer."""
+        answer = '{"goal": "סגירת לו\\"ז", "risks": ["קנס"], "wants": [], "concessions": []}'
+        calls = []
+        monkeypatch.setattr(ai_engine, "ask_ai", lambda prompt, **kwargs: calls.append(prompt) or answer)
+        generator = MeetingPrepGenerator(ProjectMemory())
+        received = []
+
+        prep = generator.generate(**meeting, on_chunk=received.append)
+        cached = generator.generate(**meeting, on_chunk=received.append)
+
+        assert len(calls) == 1
+        assert received == [prep["document"], cached["document"]]
+        assert "1. מטרת הפגישה:\n   סגירת לו\"ז" in received[0]
+        assert "{" not in received[0]
+
+    def test_skipped_llm_still_sends_document(self, meeting, monkeypatch):
+        """Test that a prep rendered without the LLM still reaches the callback."""
+        monkeypatch.setattr(ai_engine, "ask_ai", lambda prompt, **kwargs: pytest.fail("LLM called"))
+        received = []
+
+        prep = MeetingPrepGenerator(ProjectMemory()).generate(
+            **dict(meeting, project_name="פרויקט לא קיים"), on_chunk=received.append
+        )
+
+        assert received == [prep["document"]]
+
+
+class TestEnhancedDeclarationHandler:
+    """Test suite for declaration analysis."""
+
+    def test_duplicate_email_cached_until_activity(self):
+        """Test that a repeated email reuses the analysis until project activity is logged."""
+        memory = ProjectMemory()
+        handler = EnhancedDeclarationHandler(memory, NotificationHub(SeniorEngineerProfile()))
+
+        first = handler.analyze_with_history("תצהיר", "", "קניון נופים")
+        assert handler.analyze_with_history("תצהיר", "", "קניון נופים") is first
+        assert handler.analyze_with_history("תצהיר אחר", "", "קניון נופים") is not first
+
+        memory.log_activity("קניון נופים", "note", "עדכון")
+        again = handler.analyze_with_history("תצהיר", "", "קניון נופים")
+
+        assert again is not first
+        assert again == first
+
+    def test_analysis_cache_bounded(self, monkeypatch):
+        """Test that the analysis cache stays bounded and drops the least recently used entry."""
+        monkeypatch.setattr(vse, "DECLARATION_CACHE_MAX_ENTRIES", 2)
+        handler = EnhancedDeclarationHandler(ProjectMemory(), NotificationHub(SeniorEngineerProfile()))
+
+        first = handler.analyze_with_history("תצהיר 1", "", "קניון נופים")
+        handler.analyze_with_history("תצהיר 2", "", "קניון נופים")
+        handler.analyze_with_history("תצהיר 1", "", "קניון נופים")
+        handler.analyze_with_history("תצהיר 3", "", "קניון נופים")
+
+        assert len(handler._analysis_cache) == 2
+        assert handler.analyze_with_history("תצהיר 1", "", "קניון נופים") is first
+
+
+class TestActionItemsTracker:
+    """Test suite for action item tracking."""
+
+    def test_pending_and_complete(self):
+        """Test pending filters by project and completion, keeping insertion order."""
+        tracker = ActionItemsTracker(ProjectMemory())
+        a = tracker.add_item("קניון נופים", "א", "01/01/2025")
+        b = tracker.add_item("ארלוזורוב 20", "ב", "01/01/2025")
+        c = tracker.add_item("קניון נופים", "ג", "01/01/2025")
+
+        assert [i["id"] for i in tracker.get_pending_items()] == [a, b, c]
+        assert tracker.complete_item(a) is True
+        assert tracker.complete_item("missing") is False
+        assert [i["id"] for i in tracker.get_pending_items("קניון נופים")] == [c]
+        assert tracker.get_pending_items("פרויקט לא קיים") == []
+
+    def test_add_items_bulk_shares_timestamp(self):
+        """Test that bulk-added items get distinct ids and one created_at."""
+        tracker = ActionItemsTracker(ProjectMemory())
+        ids = tracker.add_items_bulk("קניון נופים", [
+            {"action": "א", "deadline": "01/01/2025", "priority": "high"},
+            {"action": "ב", "deadline": "08/01/2025"},
+        ])
+        items = tracker.get_pending_items("קניון נופים")
+
+        assert [i["id"] for i in items] == ids and len(set(ids)) == 2
+        assert items[0]["created_at"] == items[1]["created_at"]
+        assert items[1]["priority"] == "medium"
+
+
+class TestCommandParsing:
+    """Test suite for chat command project extraction."""
+
+    KNOWN = ("ארלוזורוב 20", "קניון נופים")
+
+    @pytest.mark.parametrize("command, expected", [
+        ("יש לי פגישה מחר עם עיריית תל אביב על קניון נופים", "קניון נופים"),
+        ("קיבלתי תצהיר לארלוזורוב 20", "ארלוזורוב 20"),
+        ("פגישה על קניון הזהב", "קניון הזהב"),
+        ("מה שלומך", None),
+    ])
+    def test_extract_project(self, command, expected):
+        """Test known-name and pattern based extraction."""
+        assert vse._extract_project_cached(command, self.KNOWN) == expected
+
+    def test_extract_project_memoized(self):
+        """Test that a repeated command is served from the cache."""
+        vse._extract_project_cached.cache_clear()
+        vse._extract_project_cached("פגישה על קניון נופים", self.KNOWN)
+        vse._extract_project_cached("פגישה על קניון נופים", self.KNOWN)
+
+        assert vse._extract_project_cached.cache_info().hits == 1
+
+    @pytest.mark.parametrize("command, intent", [
+        ("יש לי פגישה מחר על קניון נופים", "meeting"),
+        ("קיבלתי תצהיר לארלוזורוב 20", "declaration"),
+        ("תצהיר לפני הפגישה", "meeting"),
+        ("מה שלומך", None),
+    ])
+    def test_intent_detection(self, command, intent):
+        """Test that the meeting intent takes priority over declarations."""
+        match = vse._INTENT_RE.search(command)
+        assert (match.lastgroup if match else None) == intent
+
+
+class TestSkillExecution:
+    """Test suite for the skill entry points."""
+
+    def test_execute_async_matches_execute(self):
+        """Test that concurrent async runs return the same result as the sync path."""
+        skill = Skill_VirtualSeniorEngineer()
+        inputs = {"trigger_type": "chat", "command": "שלום"}
+
+        async def run_twice():
+            return await asyncio.gather(skill.execute_async(inputs), skill.execute_async(inputs))
+
+        results = asyncio.run(run_twice())
+        expected = skill.execute(inputs)
+
+        assert [r.status for r in results] == [expected.status] * 2
+        assert all(r.output["available_projects"] == expected.output["available_projects"] for r in results)
+
+    def test_multi_project_meeting_merges_cached_preps(self, monkeypatch):
+        """Test that a chat meeting on two projects merges their cached preps."""
+        calls = []
+
+        def fake_ask_ai(prompt, **kwargs):
+            calls.append(prompt)
+            return "===[1]===\nמסמך נופים\n===[2]===\nמסמך ארלוזורוב\n"
+
+        monkeypatch.setattr(ai_engine, "ask_ai", fake_ask_ai)
+        skill = Skill_VirtualSeniorEngineer()
+        inputs = {"trigger_type": "chat", "command": "פגישה על קניון נופים וגם על ארלוזורוב 20"}
+
+        first = skill.execute(inputs).output
+        second = skill.execute(inputs).output
+
+        assert len(calls) == 1
+        assert first["project"] == "קניון נופים, ארלוזורוב 20"
+        assert first["document"] == second["document"] == "מסמך נופים\n---\nמסמך ארלוזורוב"
+        assert len(first["findings"]) == len(set(first["findings"]))